@@ -0,0 +1,130 @@
+import re
+from bisect import bisect_right
+from collections import deque
+
+# ------------------------------
+# Gazetteer-driven advocate name finder.
+# An Aho-Corasick automaton is built once from the configured surnames and
+# designations. One left-to-right pass over a case's text then reports
+# every whole-word occurrence at once, however many entries there are, so a
+# longer list costs nothing per case. Each surname hit closes a name. The
+# name reaches back over at most MAX_GIVEN_NAMES preceding name words, in
+# any case. It stops at a connective or field keyword (OF, VS, ACT, SUBJECT),
+# at a word the caller excludes (e.g. the respondent's), and at a counsel
+# title, which is kept ("MR. ANIL PRASAD"). A run of surnames ("RAJESH
+# KUMAR SINGH") stays one name. A designation ("A.A.G.") right after a name
+# is attached to it, and stands alone otherwise.
+# ------------------------------
+MAX_GIVEN_NAMES = 4
+NAME_WORD = re.compile(r"[A-Z.]+")
+STOP_WORDS = {"AND", "FOR", "WITH", "THE", "VS", "V/S", "VERSUS", "IN", "OF", "BY", "TO", "ON", "&",
+              "ACT", "SUBJECT", "IA", "NO", "NO."}
+TITLES = {"MR", "MR.", "MRS", "MRS.", "MS", "MS.", "DR", "DR."}
+WORD = re.compile(r"\S+")
+JOINERS = re.compile(r"[\s,\-]*")    # what may sit between a name and its designation
+
+class AhoCorasick:
+    """Multi-pattern matcher over upper-cased text: finditer() yields (start, end, value)."""
+
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+        for pattern, value in patterns:
+            self._add(pattern.upper(), value)
+        self._build()
+
+    def _add(self, pattern, value):
+        state = 0
+        for ch in pattern:
+            nxt = self.goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append([])
+            state = nxt
+        self.out[state].append((len(pattern), value))
+
+    def _build(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[nxt] = self.goto[fallback].get(ch, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def finditer(self, text):
+        state = 0
+        for i, ch in enumerate(text.upper()):
+            while state and ch not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(ch, 0)
+            for length, value in self.out[state]:
+                yield i + 1 - length, i + 1, value
+
+def _is_word_char(ch):
+    return ch.isalnum()
+
+class AdvocateMatcher:
+    """Finds advocate names in case text from a surname and designation gazetteer."""
+
+    def __init__(self, surnames, designations=()):
+        entries = [(s, "surname") for s in surnames] + [(d, "designation") for d in designations]
+        self.automaton = AhoCorasick(entries)
+
+    def hits(self, text):
+        """Longest whole-word gazetteer hits, left to right and non-overlapping: (start, end, kind)."""
+        found = []
+        for start, end, kind in self.automaton.finditer(text):
+            if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+                continue
+            if end < len(text) and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+                continue
+            # keep the longest of hits that overlap (hits arrive ordered by end)
+            while found and found[-1][0] >= start:
+                found.pop()
+            if found and found[-1][1] > start:
+                continue
+            found.append((start, end, kind))
+        return found
+
+    def find(self, text, exclude=()):
+        """Advocate names in text, in order of appearance.
+
+        Words in `exclude` (compared upper-case, without trailing punctuation)
+        are never taken as given names.
+        """
+        exclude = {word.upper().rstrip(",.;:") for word in exclude}
+        words = [(m.start(), m.end()) for m in WORD.finditer(text)]
+        word_starts = [start for start, _ in words]
+        spans = []          # [start, end] of each name found so far
+        last_end = 0
+        for start, end, kind in self.hits(text):
+            between = text[last_end:start]
+            if spans and JOINERS.fullmatch(between) and (kind == "designation" or not between.strip(" ")):
+                spans[-1][1] = end     # surname run, or designation right after a name
+                last_end = end
+                continue
+            if kind == "designation":
+                spans.append([start, end])
+                last_end = end
+                continue
+            name_start = start
+            index = bisect_right(word_starts, start) - 1    # word holding the hit
+            for word_start, word_end in reversed(words[max(0, index - MAX_GIVEN_NAMES):max(index, 0)]):
+                word = text[word_start:word_end].upper()     # "Rajesh" counts as "RAJESH"
+                if (word_start < last_end or word in STOP_WORDS or not NAME_WORD.fullmatch(word)
+                        or word.rstrip(".") in exclude):
+                    break
+                name_start = word_start
+                if word in TITLES:
+                    break
+            spans.append([name_start, end])
+            last_end = end
+        return [" ".join(text[start:end].split()) for start, end in spans]
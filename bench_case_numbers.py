@@ -0,0 +1,136 @@
+import re
+import sys
+import time
+import argparse
+
+from case_numbers import DIALECTS, case_recognizer, normalize_case_type
+
+# ------------------------------
+# Corpus check and benchmark for the shared case-number recognizer.
+# CORPUS holds case blocks in each court's spelling with the
+# (type, number, year, IA) the recognizer must return. Every entry is
+# checked first. Then each court's blocks, padded with typical party text,
+# are timed through the recognizer call its parser makes and through the
+# ad-hoc regexes the parsers used before (LEGACY: separate case and IA
+# searches, two stages for Gauhati).
+# Exits with status 1 if any corpus entry is not recognized as expected.
+#
+#   python bench_case_numbers.py
+#   python bench_case_numbers.py --court orissa --rounds 20000
+# ------------------------------
+CORPUS = {
+    "tshc": [
+        ("12 WP/12345/2024 RAMESH VS STATE OF TELANGANA", ("WP", "12345", "2024", "N/A")),
+        ("3 CRLP/55/2023 IA NO.1/2023 A VS B", ("CRLP", "55", "2023", "1/2023")),
+        ("no case number on this line", ("N/A", "N/A", "N/A", "N/A")),
+    ],
+    "orissa": [
+        ("1 WP(C)/31043/2024 IA No.328/2025 SRI X Versus STATE", ("WP(C)", "31043", "2024", "328/2025")),
+        ("2 RVWPET/193/2025 A Versus B", ("RVWPET", "193", "2025", "N/A")),
+        ("5 CONTC/7667/2024 (With IA No. 12/2024)", ("CONTC", "7667", "2024", "12/2024")),
+    ],
+    "gauhati": [
+        ("1 WP(C)/1234/2024 ABC Versus STATE OF MIZORAM", ("WP(C)", "1234", "2024", "N/A")),
+        ("2 Crl.A(J)/5/2024 X Versus Y", ("A(J)", "5", "2024", "N/A")),
+        ("3 CRL.A(J)/5/2024 X Versus Y", ("CRL.A(J)", "5", "2024", "N/A")),
+        ("4 I.A.(C)/3/2024 IN WP(C)/12/2023", ("WP(C)", "12", "2023", "N/A")),
+    ],
+    "jharkhand": [
+        ("W.P.(S)/1234/2024 RAM KUMAR VS STATE OF JHARKHAND IA NO. 55/2024", ("W.P.(S)", "1234", "2024", "55/2024")),
+        ("Cr.M.P. / 55 / 2023 A VS B", ("Cr.M.P.", "55", "2023", "N/A")),
+    ],
+    "jharkhand_table": [
+        ("Court 2 W.P(S) 1234 2024 RAM VS STATE IA NO.7/2024", ("W.P(S)", "1234", "2024", "7/2024")),
+        ("AB.CD(CR) - 12 / 2024 X VS Y", ("AB.CD(CR)", "12", "2024", "N/A")),
+    ],
+    "gujarat": [
+        ("1 R/SCA/1234/2024 RAMESH V/S STATE OF GUJARAT", ("SCA", "1234", "2024", "N/A")),
+        ("2 SCA/55/20245 CR.A/1/2023", ("A", "1", "2023", "N/A")),
+    ],
+    "karnataka": [
+        ("WP 1176/2024", ("WP", "1176", "2024", "N/A")),
+        ("CCC 12/2023 PET: X RES: Y", ("CCC", "12", "2023", "N/A")),
+    ],
+}
+
+def _legacy(case_pattern, ia_pattern=None):
+    """Separate case and IA searches with pattern strings, as the parsers ran them."""
+    def run(text):
+        m = re.search(case_pattern, text)
+        ia = re.search(ia_pattern, text, re.IGNORECASE) if ia_pattern else None
+        return (m.groups() if m else None), (ia.group(1) if ia else None)
+    return run
+
+def _legacy_gauhati(text):
+    m = re.search(r'([A-Z]+(?:\([A-Z]\))?(?:\.[A-Z]+)?(?:\([A-Za-z]+\))?)/(\d+)/(\d{4})', text)
+    if not m:
+        m = re.search(r'([A-Z\.\(\)]+)/(\d+)/(\d{4})', text)
+    return (m.groups() if m else None), None
+
+# The per-parser regexes the recognizer replaced
+LEGACY = {
+    "tshc": _legacy(r'([A-Z]+)/(\d+)/(\d{4})'),
+    "orissa": _legacy(r'([A-Z]+(?:\([A-Z]+\))?)/(\d+)/(\d{4})', r'IA\s*No\.?(\d+/\d{4})'),
+    "gauhati": _legacy_gauhati,
+    "jharkhand": _legacy(r'([A-Za-z\.\(\)/]+)\s*/\s*(\d+)\s*/\s*(\d{4})', r'IA\s+NO\.?\s*([0-9/]+)'),
+    "jharkhand_table": _legacy(r"([A-Z]\.[A-Z]\([A-Z]+\)|[A-Z]+\.[A-Z]+\([A-Z]+\))\s*[/\-]?\s*(\d+)\s*[/\-]?\s*(\d{4})",
+                               r"IA\s*NO\.?\s*([0-9/]+)"),
+    "gujarat": lambda text: (re.findall(r'([A-Z]+)/(\d+)/(\d+)', text), None),
+    "karnataka": _legacy(r'([A-Z]+)\s+(\d+)/(\d{4})'),
+}
+
+# How each parser calls the recognizer (what the legacy regexes are timed against)
+PARSER_CALLS = {
+    "tshc": lambda recognizer, text: recognizer.search(text, with_ia=False),
+    "gauhati": lambda recognizer, text: recognizer.search(text, with_ia=False),
+    "karnataka": lambda recognizer, text: recognizer.search(text, with_ia=False),
+    "gujarat": lambda recognizer, text: recognizer.findall(text),
+}
+# Party and advocate text as it follows the case number in a real block
+PADDING = " RAMESH KUMAR SHARMA AND ANOTHER VS STATE REP BY ITS PRINCIPAL SECRETARY MR A B SINGH" * 4
+
+def check_corpus(courts):
+    """Failures as (court, text, expected, got)."""
+    failures = []
+    for court in courts:
+        recognizer = case_recognizer(court)
+        for text, expected in CORPUS[court]:
+            got = recognizer.identify(text)
+            if got != expected:
+                failures.append((court, text, expected, got))
+    return failures
+
+def _time(fn, blocks, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in blocks:
+            fn(text)
+    return time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check and time the shared case-number recognizer")
+    parser.add_argument("--court", choices=sorted(DIALECTS), action="append",
+                        help="limit to these dialects (default: all)")
+    parser.add_argument("--rounds", type=int, default=5000)
+    args = parser.parse_args(argv)
+    courts = args.court or sorted(CORPUS)
+
+    failures = check_corpus(courts)
+    for court, text, expected, got in failures:
+        print(f"MISMATCH [{court}] {text!r}: expected {expected}, got {got}")
+
+    print(f"{'court':16} {'blocks':>6} {'legacy s':>10} {'shared s':>10}")
+    for court in courts:
+        blocks = [text + PADDING for text, _ in CORPUS[court]]
+        recognizer = case_recognizer(court)
+        call = PARSER_CALLS.get(court, lambda recognizer, text: recognizer.identify(text))
+        legacy_s = _time(LEGACY[court], blocks, args.rounds)
+        shared_s = _time(lambda text: call(recognizer, text), blocks, args.rounds)
+        print(f"{court:16} {len(blocks):6d} {legacy_s:10.4f} {shared_s:10.4f}")
+
+    print("Normalized types:", sorted({normalize_case_type(expected[0])
+                                       for court in courts for _, expected in CORPUS[court] if expected[0] != "N/A"}))
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
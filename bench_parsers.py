@@ -0,0 +1,297 @@
+import os
+import sys
+import json
+import timeit
+import logging
+import argparse
+import platform
+import importlib
+import tracemalloc
+from datetime import datetime
+from contextlib import contextmanager
+
+# ------------------------------
+# Parser micro-benchmark with output snapshots.
+# Each parser runs over its checked-in, anonymised text fixture
+# (bench_fixtures/<fixture>.txt) repeated 1x, 10x and 100x. The PDF text
+# extraction step is swapped for the fixture text, so only parsing is timed.
+# It reports lines/sec and cases/sec (best of --repeat timings, each looping
+# the parser for at least 0.2s so short runs are not lost in noise) and the peak
+# memory of one run (tracemalloc; the Gujarat process pool's workers are not
+# counted).
+# Results are compared with bench_fixtures/baseline.json. A parser that gets
+# slower, or needs more memory, by more than --threshold is a regression.
+# Timings depend on the machine, so the baseline is kept locally: the first
+# run records it, and --update-baseline records it again.
+# Output at 1x, and the case count at every scale, must equal the snapshot in
+# bench_fixtures/snapshots/. A speedup therefore cannot change results
+# unnoticed. --update-snapshots accepts an intended change of output.
+# A snapshot records what the parser produces, right or wrong. Its
+# "known_issues" list holds the fields that were checked by hand against the
+# fixture and found wrong, with the value the cause list actually shows
+# ("want"). They are reported on every run and dropped from the snapshot by
+# --update-snapshots once the parser gets them right.
+# Exits with status 1 on a regression, a snapshot mismatch, or a parser that
+# cannot be imported or fails.
+#
+#   python bench_parsers.py
+#   python bench_parsers.py --parser gujarat --parser orissa --scales 1 10
+#   python bench_parsers.py --update-snapshots
+# ------------------------------
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(HERE, "bench_fixtures")
+SNAPSHOT_DIR = os.path.join(FIXTURE_DIR, "snapshots")
+BASELINE_FILE = os.path.join(FIXTURE_DIR, "baseline.json")
+SCALES = (1, 10, 100)
+THRESHOLD = 0.25  # allowed slowdown / memory growth against the baseline
+PAGE_BREAK = "\f"  # separates PDF pages in a fixture (Orissa parses page by page)
+CELL_BREAK = "%%"  # line separating table cells in the Karnataka fixture
+CAUSE_DATE = datetime(2025, 1, 2)
+
+@contextmanager
+def text_source(module, extractor, text):
+    """Let `module.extractor(pdf_path)` return the fixture text while parsing."""
+    original = getattr(module, extractor)
+    setattr(module, extractor, lambda pdf_path: text)
+    try:
+        yield
+    finally:
+        setattr(module, extractor, original)
+
+# === PARSER ADAPTERS ===
+# run(module, text) feeds the scaled fixture to the loaded script's parser;
+# rows(module, result) turns what it returned into one row per case.
+def run_tshc(module, text):
+    with text_source(module, "extract_text_from_pdf", text):
+        return module.extract_cases_from_pdf("TSHC-CauseList_2025_01_02.pdf")
+
+def run_orissa(module, text):
+    pages = [page for page in text.split(PAGE_BREAK) if page.strip()]
+    with text_source(module, "extract_text_from_pdf_with_layout", pages):
+        return module.parse_orissa_causelist_structured("orissa_causelist_2025_01_02_1.pdf",
+                                                        "orissa_causelist_2025_01_02_1.pdf", CAUSE_DATE, "Court No. 3")
+
+def run_gauhati(module, text):
+    with text_source(module, "extract_layout_text", text):
+        return module.parse_gauhati_causelist("aizawl_bench_causelist_2025_01_02_1.pdf", "AIZAWL BENCH")
+
+def run_gujarat(module, text):
+    return module.parse_causelist_data(text, CAUSE_DATE.strftime("%d/%m/%Y"), "GHC_CauseList_02-01-2025.pdf")
+
+def run_jharkhand(module, text):
+    return module.parse_causelist_data(text, "JHC_CauseList_2025-01-02.pdf")
+
+def run_karnataka(module, text):
+    results = []
+    for cell in text.split(CELL_BREAK):
+        prefix = cell.strip()[:3].upper()
+        results.append(module.split_party_and_advocate(cell, prefix if prefix in ("PET", "RES") else None))
+    return results
+
+def case_rows(module, cases):
+    return cases
+
+def karnataka_rows(module, results):
+    return [{"party": party, "advocate": advocate} for party, advocate in results]
+
+def gujarat_rows(module, blocks):
+    return [dict(zip(module.CASE_COLUMNS, row)) for row in module.expand_cases(blocks)]
+
+def close_gujarat(module):
+    module.shutdown_section_pool()
+
+# name -> (script, fixture, run, rows, close or None)
+PARSERS = {
+    "tshc": ("tshc_downloadand_extraction.py", "tshc", run_tshc, case_rows, None),
+    "orissa": ("orissa_causelist_downloadandextraction.py", "orissa", run_orissa, case_rows, None),
+    "gauhati": ("aizawl_bench", "gauhati", run_gauhati, case_rows, None),
+    "gujarat": ("gujarat_causelist_execution.py", "gujarat", run_gujarat, gujarat_rows, close_gujarat),
+    "jharkhand": ("jharkhand_execute_3.py", "jharkhand", run_jharkhand, case_rows, None),
+    "jharkhand_table": ("extract4_jharkhand.py", "jharkhand_table", run_jharkhand, case_rows, None),
+    "karnataka_kshc": ("kshccases.py", "karnataka", run_karnataka, karnataka_rows, None),
+    "karnataka_kalaburagi": ("kalaburagi_causelist.py", "karnataka", run_karnataka, karnataka_rows, None),
+    "karnataka_dharwad": ("dharwd_causelist.py", "karnataka", run_karnataka, karnataka_rows, None),
+}
+
+def load_parser_script(script):
+    """Import a scraper script by file name; aizawl_bench has no .py suffix."""
+    if script.endswith(".py"):
+        # a regular import, so process-pool workers can find the parser by module name
+        return importlib.import_module(script[:-3])
+    from ecourts_engine import load_script
+    return load_script(script)
+
+def scale_fixture(text, scale):
+    """The fixture repeated `scale` times, joined the way its units are separated."""
+    separator = "\n" + CELL_BREAK + "\n" if CELL_BREAK in text else "\n"
+    return separator.join([text.strip("\n")] * scale)
+
+def count_lines(text):
+    return sum(1 for line in text.splitlines() if line.strip() and line.strip() != CELL_BREAK)
+
+def as_json(rows):
+    """Rows as they compare after a JSON round trip (tuples become lists, dates strings)."""
+    return json.loads(json.dumps(rows, default=str))
+
+def measure(run, module, text, repeat):
+    """(best seconds per run, peak traced bytes of one warmed-up run, result)"""
+    timer = timeit.Timer(lambda: run(module, text))
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat, number)) / number
+    tracemalloc.start()
+    try:
+        result = run(module, text)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak, result
+
+def load_json(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def write_json(path, data):
+    tmp = path + ".part"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp, path)
+
+def bench_parser(name, scales, repeat):
+    """Metrics per scale plus the 1x rows and the case count per scale."""
+    script, fixture, run, rows, close = PARSERS[name]
+    module = load_parser_script(script)
+    with open(os.path.join(FIXTURE_DIR, fixture + ".txt"), "r", encoding="utf-8") as f:
+        text = f.read()
+    metrics, counts, snapshot_rows = {}, {}, None
+    try:
+        for scale in scales:
+            scaled = scale_fixture(text, scale)
+            seconds, peak, result = measure(run, module, scaled, repeat)
+            result_rows = rows(module, result)
+            counts[str(scale)] = len(result_rows)
+            if scale == 1:
+                snapshot_rows = as_json(result_rows)
+            lines = count_lines(scaled)
+            seconds = max(seconds, 1e-9)
+            metrics[str(scale)] = {
+                "lines": lines,
+                "cases": len(result_rows),
+                "lines_per_sec": round(lines / seconds, 1),
+                "cases_per_sec": round(len(result_rows) / seconds, 1),
+                "peak_kib": round(peak / 1024, 1),
+            }
+    finally:
+        if close:
+            close(module)
+    return metrics, counts, snapshot_rows
+
+def regressions(name, metrics, baseline, threshold):
+    """Messages for each scale slower, or more memory-hungry, than the baseline allows."""
+    found = []
+    for scale, current in metrics.items():
+        recorded = (baseline or {}).get("parsers", {}).get(name, {}).get(scale)
+        if not recorded:
+            continue
+        if current["lines_per_sec"] < recorded["lines_per_sec"] * (1 - threshold):
+            found.append(f"{name} {scale}x: {current['lines_per_sec']:.0f} lines/sec, "
+                         f"baseline {recorded['lines_per_sec']:.0f}")
+        if current["peak_kib"] > recorded["peak_kib"] * (1 + threshold):
+            found.append(f"{name} {scale}x: peak {current['peak_kib']:.0f} KiB, baseline {recorded['peak_kib']:.0f} KiB")
+    return found
+
+def _row_diff(want, got):
+    if isinstance(want, dict) and isinstance(got, dict):
+        keys = [key for key in {**want, **got} if want.get(key) != got.get(key)]
+        return "; ".join(f"{key}: expected {want.get(key)!r}, got {got.get(key)!r}" for key in keys)
+    return f"expected {want!r}, got {got!r}"
+
+def snapshot_mismatches(name, counts, snapshot_rows, snapshot):
+    """Messages for each difference from the stored snapshot."""
+    found = []
+    if snapshot_rows is not None and snapshot_rows != snapshot["rows"]:
+        expected = snapshot["rows"]
+        for idx, (got, want) in enumerate(zip(snapshot_rows, expected)):
+            if got != want:
+                found.append(f"{name}: row {idx} differs: {_row_diff(want, got)}")
+                break
+        if len(snapshot_rows) != len(expected):
+            found.append(f"{name}: {len(snapshot_rows)} rows at 1x, snapshot has {len(expected)}")
+    for scale, count in counts.items():
+        want = snapshot["cases"].get(scale)
+        if want is not None and want != count:
+            found.append(f"{name}: {count} cases at {scale}x, snapshot has {want}")
+    return found
+
+def known_issues(snapshot_rows, issues):
+    """Split hand-checked known issues into (still open, now resolved)."""
+    still_open, resolved = [], []
+    for issue in issues:
+        row = snapshot_rows[issue["row"]] if issue["row"] < len(snapshot_rows) else {}
+        (resolved if row.get(issue["field"]) == issue["want"] else still_open).append(issue)
+    return still_open, resolved
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the cause list parsers on text fixtures and check their output")
+    parser.add_argument("--parser", choices=sorted(PARSERS), action="append",
+                        help="limit to these parsers (default: all)")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="allowed slowdown / memory growth as a fraction of the baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="record this run as the baseline")
+    parser.add_argument("--update-snapshots", action="store_true", help="accept this run's output as the snapshots")
+    args = parser.parse_args(argv)
+    names = args.parser or list(PARSERS)
+    scales = sorted(set(args.scales) | {1})
+
+    logging.disable(logging.WARNING)  # the parsers' progress logging is not part of what is timed
+    baseline = load_json(BASELINE_FILE)
+    failures = []
+    results = {}
+
+    print(f"{'parser':22} {'scale':>5} {'lines':>7} {'cases':>6} {'lines/s':>10} {'cases/s':>10} {'peak KiB':>9}")
+    for name in names:
+        try:
+            metrics, counts, snapshot_rows = bench_parser(name, scales, args.repeat)
+        except Exception as e:
+            failures.append(f"{name}: {type(e).__name__}: {e}")
+            print(f"{name:22} failed: {type(e).__name__}: {e}")
+            continue
+        results[name] = metrics
+        for scale in scales:
+            row = metrics[str(scale)]
+            print(f"{name:22} {scale:4d}x {row['lines']:7d} {row['cases']:6d} {row['lines_per_sec']:10.0f} "
+                  f"{row['cases_per_sec']:10.0f} {row['peak_kib']:9.1f}")
+
+        snapshot_path = os.path.join(SNAPSHOT_DIR, name + ".json")
+        snapshot = load_json(snapshot_path)
+        still_open, resolved = known_issues(snapshot_rows, (snapshot or {}).get("known_issues", []))
+        if args.update_snapshots or snapshot is None:
+            write_json(snapshot_path, {"parser": name, "cases": counts, "rows": snapshot_rows,
+                                       "known_issues": still_open})
+            print(f"{name:22} snapshot {'updated' if snapshot is not None else 'recorded'}")
+        else:
+            failures.extend(snapshot_mismatches(name, counts, snapshot_rows, snapshot))
+        for issue in resolved:
+            print(f"{name:22} resolved: row {issue['row']} {issue['field']} = {issue['want']!r}")
+        if still_open:
+            print(f"{name:22} {len(still_open)} known issue(s) open")
+        if not args.update_baseline:
+            failures.extend(regressions(name, metrics, baseline, args.threshold))
+
+    if args.update_baseline or baseline is None:
+        recorded = dict((baseline or {}).get("parsers", {}))
+        recorded.update(results)
+        write_json(BASELINE_FILE, {"recorded": datetime.now().isoformat(timespec="seconds"),
+                                   "python": platform.python_version(), "parsers": recorded})
+        print(f"Baseline {'updated' if baseline is not None else 'recorded'} in {BASELINE_FILE}")
+
+    for failure in failures:
+        print("FAIL", failure)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
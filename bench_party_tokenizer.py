@@ -0,0 +1,140 @@
+import re
+import sys
+import time
+import argparse
+
+from party_tokenizer import BLOCK_BUDGET, BlockBudget, tokenize, extract_parties, extract_advocates
+
+# ------------------------------
+# Pathological-input benchmark for party/advocate extraction.
+# Times the party_tokenizer extractors against the regexes they replaced
+# in gujarat_causelist_execution.process_case_block, on blocks built to make
+# those regexes backtrack. Sizes double until --max-words. The legacy
+# regexes stop being timed once one run exceeds --regex-cap seconds.
+# Before timing, the extractors are checked against CORPUS: case blocks laid
+# out like the Gujarat cause list, with the parties and counsel written down
+# by reading each block, not by running any extractor over it.
+# Exits with status 1 on a CORPUS mismatch or if the tokenizer ever needs
+# more than its per-block budget, so it can be run before shipping a change
+# to the extractor.
+#
+#   python bench_party_tokenizer.py
+#   python bench_party_tokenizer.py --max-words 65536 --regex-cap 5
+# ------------------------------
+LEGACY_PARTIES = re.compile(r'([A-Z][A-Z\s\.\,\&\(\)]+?)\s+V[/\\]?S\s+([A-Z][A-Z\s\.\,\&\(\)]+?)(?=\s+MR|MS|ADVOCATE|\n|$)',
+                            re.IGNORECASE)
+LEGACY_ADVOCATES = re.compile(r'(MR\.?|MS\.?|MRS\.?|ADVOCATE)\s+([A-Z][A-Z\s\.]+?)(?=\s+\d+|\s+MR|MS|FOR|LISTED|$)',
+                              re.IGNORECASE)
+
+# Each case builds one block of about `words` words that never completes a match
+CASES = {
+    "names without separator": lambda words: ["RAMESH KUMAR PATEL " * (words // 3) + "1/2"],
+    "separator without counsel": lambda words: ["ABC V/S " + "STATE OF GUJARAT " * (words // 3) + "(1)"],
+    "separators, no respondent end": lambda words: ["A VS B " * (words // 3) + "9"],
+    "title without name end": lambda words: ["MR " + "SHAH DESAI " * (words // 2) + "(1234)"],
+    "respondent wrapped over lines": lambda words: ["ABC V/S STATE"] + ["OF GUJARAT THROUGH"] * (words // 3) + ["(1)"],
+    "realistic lines": lambda words: ["1 SCA/1234/2024 RAMESH KUMAR V/S STATE OF GUJARAT & 1 OTHER(S) "
+                                      "MR A B SHAH(1234) for the Petitioner(s)"] * max(1, words // 18),
+}
+
+# (block lines, expected parties, expected counsel)
+CORPUS = [
+    (["1 R/SCA/1234/2024 RAMESH KUMAR PATEL V/S STATE OF GUJARAT & 1 OTHER(S) MR A B SHAH(1234) for the Petitioner(s) No. 1",
+      "MS C D DESAI, AGP for the Respondent(s) No. 1"],
+     [("RAMESH KUMAR PATEL", "STATE OF GUJARAT & 1 OTHER(S)")], [("MR", "A B SHAH"), ("MS", "C D DESAI")]),
+    (["3 R/CR.A/12/2024 STATE OF GUJARAT V/S MAHESH @ MAHIO MR K L PANDYA, APP for the Appellant(s)",
+      "UNDER SECTION 378 CR.P.C."],
+     [("STATE OF GUJARAT", "MAHESH @ MAHIO")], [("MR", "K L PANDYA")]),
+    (["1 R/SCA/20011/2023 M/S SHREE TRADERS V/S UNION OF INDIA MR P Q RAVAL(2281) for the Petitioner(s)",
+      "MR R S TRIVEDI for the Respondent(s)"],
+     [("M/S SHREE TRADERS", "UNION OF INDIA")], [("MR", "P Q RAVAL"), ("MR", "R S TRIVEDI")]),
+    (["3 R/FA/45/2022 NEW INDIA ASSURANCE CO LTD V/S KANTABEN WD/O RAMJI MR V W SHETH for the Appellant(s)"],
+     [("NEW INDIA ASSURANCE CO LTD", "KANTABEN WD/O RAMJI")], [("MR", "V W SHETH")]),
+    (["5 R/SCA/88/2024 BHAVESH SHAH V/S THE STATE OF GUJARAT THROUGH THE",
+      "SECRETARY, REVENUE DEPARTMENT",
+      "MR J K NAIK(771) for the Petitioner(s) No. 1"],
+     [("BHAVESH SHAH", "THE STATE OF GUJARAT THROUGH THE SECRETARY, REVENUE DEPARTMENT")], [("MR", "J K NAIK")]),
+    (["2 R/CR.MA/777/2024 LISTED 3 TIMES",
+      "R/CR.MA/778/2024 R/CR.MA/779/2024 JIGNESH V/S STATE OF GUJARAT MS T U VORA(9912) for the Applicant(s)",
+      "FOR CONDONATION OF DELAY"],
+     [("JIGNESH", "STATE OF GUJARAT")], [("MS", "T U VORA")]),
+    (["4 R/SCA/10/2024 ASHOK V/S STATE OF GUJARAT",
+      "ASHOK V/S DISTRICT COLLECTOR MR Y Z RANA for the Petitioner(s)"],
+     [("ASHOK", "STATE OF GUJARAT"), ("ASHOK", "DISTRICT COLLECTOR")], [("MR", "Y Z RANA")]),
+    (["6 R/SA/5/2020 LALJI V/S BHIKHA MRS. P R SONI for the Appellant(s)"],
+     [("LALJI", "BHIKHA")], [("MRS.", "P R SONI")]),
+    (["1 R/SCA/3003/2021 DINESH V/S GUJARAT HOUSING BOARD"],
+     [("DINESH", "GUJARAT HOUSING BOARD")], []),
+]
+
+def corpus_mismatches():
+    """Messages for each CORPUS block the extractors read differently."""
+    found = []
+    for lines, parties, advocates in CORPUS:
+        got_parties, got_advocates = tokenized(lines)
+        if got_parties != parties:
+            found.append(f"{lines[0][:40]}...: parties {got_parties}, expected {parties}")
+        if got_advocates != advocates:
+            found.append(f"{lines[0][:40]}...: counsel {got_advocates}, expected {advocates}")
+    return found
+
+def _time(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def legacy(lines):
+    text = " ".join(lines)
+    return list(LEGACY_PARTIES.finditer(text)), LEGACY_ADVOCATES.findall(text)
+
+def tokenized(lines):
+    tokens = tokenize(lines)
+    budget = BlockBudget()
+    return extract_parties(tokens, budget), extract_advocates(tokens, budget)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time party/advocate extraction on pathological case blocks")
+    parser.add_argument("--min-words", type=int, default=64)
+    parser.add_argument("--max-words", type=int, default=16384)
+    parser.add_argument("--regex-cap", type=float, default=2.0, help="stop timing the legacy regexes past this many seconds")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    mismatches = corpus_mismatches()
+    for mismatch in mismatches:
+        print(f"MISMATCH: {mismatch}")
+    if mismatches:
+        return 1
+    print(f"All {len(CORPUS)} corpus blocks read as expected")
+
+    over_budget = []
+    print(f"{'case':32} {'words':>7} {'legacy s':>10} {'tokenizer s':>12}")
+    for name, build in CASES.items():
+        legacy_done = False
+        words = args.min_words
+        while words <= args.max_words:
+            lines = build(words)
+            legacy_s = None
+            if not legacy_done:
+                legacy_s = _time(lambda: legacy(lines), 1)
+                legacy_done = legacy_s > args.regex_cap
+            token_s = _time(lambda: tokenized(lines), args.repeat)
+            if token_s > BLOCK_BUDGET:
+                over_budget.append((name, words, token_s))
+            legacy_text = f"{legacy_s:10.4f}" if legacy_s is not None else f"{'skipped':>10}"
+            print(f"{name:32} {words:7d} {legacy_text} {token_s:12.5f}")
+            words *= 2
+
+    if over_budget:
+        for name, words, seconds in over_budget:
+            print(f"OVER BUDGET: {name} at {words} words took {seconds:.3f}s (budget {BLOCK_BUDGET}s)")
+        return 1
+    print(f"Tokenizer stayed within the {BLOCK_BUDGET}s block budget on every input")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
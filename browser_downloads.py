@@ -0,0 +1,165 @@
+import os
+import time
+import shutil
+import tempfile
+import threading
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:   # optional: without it the (tiny) download folder is polled instead
+    Observer = None
+
+# ------------------------------
+# Isolated browser downloads.
+# Each download gets its own temporary folder inside the output folder.
+# Chrome is pointed at that folder over CDP for the duration of one click.
+# Only that download can appear there, so it is not guessed from the
+# newest file in an ever-growing archive. The download directory is a
+# browser-wide setting, so downloads through one driver hold that driver's
+# lock from start to finish; downloads in different drivers still run side
+# by side. Filesystem events (watchdog) wake the waiter as soon as Chrome
+# renames its .crdownload. The file must pass an end-of-file check before
+# it is moved to its final name. The move never overwrites an existing
+# file: it is skipped, or the download gets the next free "name_N" name.
+# ------------------------------
+PARTIAL_SUFFIXES = (".crdownload", ".tmp", ".part")
+POLL_INTERVAL = 0.25   # seconds between checks when watchdog is not installed
+EVENT_TIMEOUT = 5.0    # re-check at least this often even with events
+
+_driver_locks = {}
+_driver_locks_guard = threading.Lock()
+
+def driver_lock(driver):
+    """Lock serialising the downloads of one driver (its download folder is browser-wide)."""
+    with _driver_locks_guard:
+        return _driver_locks.setdefault(id(driver), threading.RLock())
+
+def is_complete_pdf(path):
+    """True when path starts with a PDF header and ends with an %%EOF marker."""
+    try:
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            if f.read(5) != b"%PDF-":
+                return False
+            f.seek(max(0, size - 2048))
+            return b"%%EOF" in f.read()
+    except OSError:
+        return False
+
+def _move_new(src, dest):
+    """Move src to dest unless dest exists; False if it does."""
+    try:
+        os.link(src, dest)   # fails instead of overwriting, atomically
+    except FileExistsError:
+        return False
+    except OSError:          # no hard links on this volume
+        if os.path.exists(dest):
+            return False
+        os.replace(src, dest)
+        return True
+    os.remove(src)
+    return True
+
+def set_download_dir(driver, folder):
+    """Point Chrome's downloads (all tabs) at folder."""
+    params = {"behavior": "allow", "downloadPath": folder}
+    try:
+        driver.execute_cdp_cmd("Browser.setDownloadBehavior", params)
+    except Exception:
+        driver.execute_cdp_cmd("Page.setDownloadBehavior", params)
+
+if Observer is not None:
+    class _Wakeup(FileSystemEventHandler):
+        def __init__(self, changed):
+            self.changed = changed
+
+        def on_any_event(self, event):
+            self.changed.set()
+
+class IsolatedDownload:
+    """One browser download into its own temporary folder, moved to its final name once complete.
+
+        with IsolatedDownload(driver, OUTPUT_FOLDER) as download:
+            link.click()
+            if download.wait(timeout=40):
+                saved = download.move_to(os.path.join(OUTPUT_FOLDER, name))
+    """
+
+    def __init__(self, driver, folder, check=is_complete_pdf):
+        self.driver = driver
+        self.folder = folder
+        self.check = check
+        self.path = None
+        self.file = None
+        self.changed = threading.Event()
+        self.observer = None
+        self.lock = driver_lock(driver)
+
+    def __enter__(self):
+        self.lock.acquire()
+        try:
+            self.path = tempfile.mkdtemp(prefix=".download_", dir=self.folder)
+            set_download_dir(self.driver, self.path)
+            if Observer is not None:
+                self.observer = Observer()
+                self.observer.schedule(_Wakeup(self.changed), self.path, recursive=False)
+                self.observer.start()
+        except BaseException:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def wait(self, timeout=60):
+        """Path of the finished, intact download, or None on timeout."""
+        deadline = time.monotonic() + timeout
+        interval = EVENT_TIMEOUT if self.observer is not None else POLL_INTERVAL
+        while True:
+            self.changed.clear()
+            for name in os.listdir(self.path):
+                path = os.path.join(self.path, name)
+                if not name.endswith(PARTIAL_SUFFIXES) and self.check(path):
+                    self.file = path
+                    return path
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            self.changed.wait(min(remaining, interval))
+
+    @property
+    def filename(self):
+        """Name the server gave the download (after wait() succeeded)."""
+        return os.path.basename(self.file) if self.file else None
+
+    def move_to(self, dest_path, rename=False):
+        """Move the download to dest_path and return the path it was saved under.
+
+        An existing file is never overwritten: the move is skipped (None), or
+        with rename the download is saved as "stem_1.ext", "stem_2.ext", ...
+        """
+        if self.file is None:
+            return None
+        stem, ext = os.path.splitext(dest_path)
+        candidate, n = dest_path, 0
+        while not _move_new(self.file, candidate):
+            if not rename:
+                return None
+            n += 1
+            candidate = f"{stem}_{n}{ext}"
+        self.file = None
+        return candidate
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self.observer is not None and self.observer.is_alive():
+                self.observer.stop()
+                self.observer.join()
+            try:
+                set_download_dir(self.driver, self.folder)
+            except Exception:
+                pass
+            if self.path:
+                shutil.rmtree(self.path, ignore_errors=True)
+        finally:
+            self.lock.release()
+        return False
@@ -0,0 +1,111 @@
+import re
+
+# ------------------------------
+# Shared case-number recognizer for the cause list parsers.
+# Every court writes case identifiers as TYPE / NUMBER / YEAR; they differ
+# in how the type is spelled and what separates the parts. Each dialect
+# below captures one court's spelling. It is compiled once into a single
+# pattern that also takes up an IA number ("IA No. 328/2025") before or
+# after the case number, so one search over a block yields
+# (type, number, year, IA). normalize_case_type() maps the spellings to one
+# form (W.P.(S) -> WP(S)), so case numbers from different courts can be
+# compared.
+# ------------------------------
+NA = "N/A"
+YEAR = r"(?P<year>\d{4})(?!\d)"
+TYPE_START = r"(?<![A-Za-z])"   # a type starts a word: no retries inside long upper-case runs
+
+def _ia(name):
+    return rf"(?i:\bIA\s*NO\.?\s*)(?P<{name}>\d+(?:/\d+)*)"
+
+# court -> (type pattern, separator after the type, separator before the year[, looser type pattern])
+# A looser type is only used when no case number in the block has the strict spelling.
+DIALECTS = {
+    # WP/1234/2024 (Telangana)
+    "tshc": (r"[A-Z]+", r"/", r"/"),
+    # WP(C)/31043/2024, RVWPET/193/2025 (Orissa)
+    "orissa": (r"[A-Z]+(?:\([A-Z]+\))?", r"/", r"/"),
+    # WP(C)/12/2024, Crl.A(J)/5/2024, and looser spellings such as I.A.(C)/3/2024 (Gauhati, Aizawl bench)
+    "gauhati": (r"[A-Z]+(?:\([A-Z]\))?(?:\.[A-Z]+)?(?:\([A-Za-z]+\))?", r"/", r"/", r"[A-Z.()]+"),
+    # W.P.(S)/1234/2024, Cr.M.P. / 55 / 2023 (Jharkhand, running text)
+    "jharkhand": (r"[A-Za-z.()/]+", r"\s*/\s*", r"\s*/\s*"),
+    # W.P(S) 1234 2024, A.B.(CR) - 12 / 2024 (Jharkhand, table layout)
+    "jharkhand_table": (r"[A-Z]\.[A-Z]\([A-Z]+\)|[A-Z]+\.[A-Z]+\([A-Z]+\)", r"\s*[/\-]?\s*", r"\s*[/\-]?\s*"),
+    # SCA/1234/2024, R/CR.A/12/2024 (Gujarat)
+    "gujarat": (r"[A-Z]+", r"/", r"/"),
+    # WP 1176/2024, CCC 12/2023 (Karnataka benches)
+    "karnataka": (r"[A-Z]+", r"\s+", r"/"),
+}
+
+def normalize_case_type(case_type):
+    """One spelling for a case type across courts: upper case, no dots or spaces."""
+    return re.sub(r"[.\s]+", "", case_type).upper()
+
+class CaseMatch:
+    """One recognized case number, with the block's IA number and the case number's span and text."""
+    __slots__ = ("type", "number", "year", "ia", "start", "end", "text")
+
+    def __init__(self, case_type, number, year, ia, start, end, text):
+        self.type = case_type
+        self.number = number
+        self.year = year
+        self.ia = ia
+        self.start = start
+        self.end = end
+        self.text = text
+
+    def as_tuple(self):
+        return self.type, self.number, self.year, self.ia
+
+class CaseNumberRecognizer:
+    """Precompiled case-number + IA scanner for one dialect."""
+
+    def __init__(self, type_pattern, type_sep=r"/", year_sep=r"/", loose_type=None):
+        self.stages = [self._compile(type_pattern, type_sep, year_sep)]
+        if loose_type:
+            self.stages.append(self._compile(loose_type, type_sep, year_sep))
+        self.ia_only = re.compile(_ia("ia"))
+
+    @staticmethod
+    def _compile(type_pattern, type_sep, year_sep):
+        case = rf"{TYPE_START}(?P<type>{type_pattern}){type_sep}(?P<number>\d+){year_sep}{YEAR}"
+        with_ia = rf"(?:{_ia('ia_before')}.*?)?{case}(?:.*?{_ia('ia_after')})?"
+        return re.compile(case), re.compile(with_ia, re.DOTALL)
+
+    def search(self, text, with_ia=True):
+        """First case number in text, or None. With with_ia its .ia is the block's first IA number (or N/A)."""
+        for case_only, case_with_ia in self.stages:
+            m = (case_with_ia if with_ia else case_only).search(text)
+            if m is None:
+                continue
+            ia = NA
+            if with_ia:
+                ia = m.group("ia_before") or m.group("ia_after") or NA
+            start, end = m.start("type"), m.end("year")
+            return CaseMatch(m.group("type").strip(), m.group("number"), m.group("year"), ia,
+                             start, end, text[start:end])
+        return None
+
+    def identify(self, text):
+        """(type, number, year, IA) of the first case number in text, N/A where absent."""
+        match = self.search(text)
+        if match is None:
+            m = self.ia_only.search(text)
+            return NA, NA, NA, m.group("ia") if m else NA
+        return match.as_tuple()
+
+    def findall(self, text):
+        """Every case number in text as (type, number, year), in order."""
+        for case_only, _ in self.stages:
+            found = [(m.group("type").strip(), m.group("number"), m.group("year")) for m in case_only.finditer(text)]
+            if found:
+                return found
+        return []
+
+_recognizers = {}
+
+def case_recognizer(court):
+    """The shared recognizer for a DIALECTS entry (compiled on first use)."""
+    if court not in _recognizers:
+        _recognizers[court] = CaseNumberRecognizer(*DIALECTS[court])
+    return _recognizers[court]
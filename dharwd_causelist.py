@@ -1,11 +1,12 @@
 import os 
 import re
+import sys
 import time
 import json
 import ctypes
 import threading
+import logging
 import traceback
-import pandas as pd
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -16,15 +17,29 @@ from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
-import shutil   # ✅ added for backup copy
+from karnataka_archive import ResponseArchive, parse_html_page, reparse_archive
+from karnataka_emptycache import EmptyCache
+from karnataka_progress import SprintCheckpoint
+from strategy_cache import StrategyCache
+from case_numbers import case_recognizer
+from log_setup import setup_queue_logging
+from karnataka_store import open_record_store
+from karnataka_session import is_court_option, resubmit_court
+from karnataka_snapshots import SnapshotBackups
+from karnataka_window import WindowController
+from karnataka_waits import (default_clock, mark_results_stale, wait_for_court_options,
+                             wait_for_network_idle, wait_for_results, wait_for_value)
 
 # ------------------------------
 # CONFIG
 # ------------------------------
 YEAR = 2025
 BASE_FOLDER = r"D:\banglorehighcourt\bengaluru_causelist"
+LOG_FILE = os.path.join(BASE_FOLDER, "dharwd_log.txt")  # rotated and gzip-compressed by log_setup
 OUTPUT_EXCEL = os.path.join(BASE_FOLDER, f"Bengaluru_bench_from7jun{YEAR}.xlsx")
 PROGRESS_FILE = os.path.join(BASE_FOLDER, f"progress_bengaluru_from7jun{YEAR}.json")
+OUTPUT_DB = os.path.splitext(OUTPUT_EXCEL)[0] + ".sqlite"
+EXPORT_EXCEL = True  # export OUTPUT_EXCEL from the record store when the run ends
 CAUSELIST_URL = "https://judiciary.karnataka.gov.in/causelistSearch.php"
 
 BENCHES = {
@@ -34,16 +49,31 @@ BENCHES = {
 MIN_COURTS_TO_CHECK = 7
 MAX_COURTS = 40
 SPRINT_DAYS = 0  # 0 means daily sprint (same date for from and to)
+ADAPTIVE_SPRINT = False  # narrow a bench's queries within the sprint from recent row counts / response times (never wider than the sprint)
+# Off here: rows get the sprint start as Cause_Date, so any sprint wider than a day would misdate them
+WINDOW_FILE = os.path.join(BASE_FOLDER, f"sprint_windows_{YEAR}.json")
+SESSION_MODE = True  # reuse the loaded form across courts of a bench/sprint; reload only when stale
+STRATEGY_FILE = os.path.join(BASE_FOLDER, "strategy_cache.json")  # date-setting strategy that worked last
+ARCHIVE_HTML = True  # keep every results page (gzip) so the parser can be re-run offline
+ARCHIVE_FOLDER = os.path.join(BASE_FOLDER, f"html_archive_{YEAR}")
+REPARSE_WORKERS = None  # worker processes for --reparse (None = one per CPU)
+NEGATIVE_CACHE = True  # skip (bench, court, date) combinations recently seen with no records
+EMPTY_CACHE_DB = os.path.join(os.path.expanduser("~"), "karnataka_empty_cache.sqlite")  # shared by all Karnataka scripts
 
 BACKUP_FOLDER = os.path.join(BASE_FOLDER, "backups")
 BACKUP_INTERVAL_DAYS = 5
-os.makedirs(BACKUP_FOLDER, exist_ok=True)
+BACKUP_COMPACT_EVERY = 6  # delta snapshots kept before they are folded into a full base
 
 def debug_print(msg):
-    print(msg, flush=True)
+    logging.info(msg)
+
+def debug_detail(msg, *args):
+    """Per-row detail; only formatted when SCRAPER_LOG_LEVEL=DEBUG."""
+    logging.debug(msg, *args)
 
 def ensure_folder():
     os.makedirs(BASE_FOLDER, exist_ok=True)
+    os.makedirs(BACKUP_FOLDER, exist_ok=True)
 
 # Windows: prevent sleep using SetThreadExecutionState in a background thread
 def start_prevent_sleep_thread():
@@ -82,12 +112,18 @@ prevent_sleep_thread_stop = threading.Event()
 # ------------------------------
 # Selenium setup
 # ------------------------------
-chrome_options = Options()
-chrome_options.add_argument("--start-maximized")
-chrome_options.add_argument("--disable-notifications")
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-driver.set_page_load_timeout(60)
-wait = WebDriverWait(driver, 25)
+driver = None
+wait = None
+
+def start_browser():
+    """Launch Chrome for a scraping run; nothing is started at import time."""
+    global driver, wait
+    chrome_options = Options()
+    chrome_options.add_argument("--start-maximized")
+    chrome_options.add_argument("--disable-notifications")
+    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    driver.set_page_load_timeout(60)
+    wait = WebDriverWait(driver, 25)
 
 def dispatch_events_on(el):
     try:
@@ -103,6 +139,10 @@ def dispatch_events_on(el):
 # ------------------------------
 # Date setting helpers
 # ------------------------------
+DATE_STRATEGIES = ["jquery_id", "jquery_name", "js_value", "send_keys"]
+strategy_cache = StrategyCache(STRATEGY_FILE, "judiciary.karnataka.gov.in")
+case_ids = case_recognizer("karnataka")  # "CCC 1176/2024"
+
 def try_jquery_datepicker_set(id_or_selector, date_str):
     try:
         sel = id_or_selector
@@ -123,13 +163,13 @@ def try_jquery_datepicker_set(id_or_selector, date_str):
 def set_date_on_elements(from_el, to_el, from_val, to_val, debug_label=""):
     formats = ["%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d"]
     def read_back_valid(el, expected_day, expected_month):
+        def committed(val):
+            return bool(val) and str(expected_day).zfill(2) in val and str(expected_month).zfill(2) in val
         try:
-            val = (el.get_attribute("value") or "").strip()
-            if not val:
-                return False, val
-            if str(expected_day).zfill(2) in val and str(expected_month).zfill(2) in val:
+            val = wait_for_value(driver, el, committed, label="date")
+            if val is not None:
                 return True, val
-            return False, val
+            return False, (el.get_attribute("value") or "").strip()
         except Exception:
             return False, ""
     try:
@@ -144,44 +184,30 @@ def set_date_on_elements(from_el, to_el, from_val, to_val, debug_label=""):
         except Exception:
             exp_day = None
             exp_month = None
-    try:
-        fid = from_el.get_attribute("id") or ""
-        tid = to_el.get_attribute("id") or ""
-        if fid:
-            for fmt in formats:
-                s_from = datetime.strptime(from_val, formats[0]).strftime(fmt) if fmt != formats[0] else from_val
-                s_to = datetime.strptime(to_val, formats[0]).strftime(fmt) if fmt != formats[0] else to_val
-                ok1 = try_jquery_datepicker_set(f"#{fid}", s_from)
-                ok2 = try_jquery_datepicker_set(f"#{tid}", s_to) if tid else ok1
-                time.sleep(0.2)
-                valid_from, read_from = read_back_valid(from_el, exp_day, exp_month)
-                if ok1 and valid_from:
-                    debug_print(f"      ℹ jQuery datepicker set by id succeeded ({fid}) -> {read_from}")
-                    return True
-    except Exception:
-        pass
-    try:
-        fname = from_el.get_attribute("name") or ""
-        tname = to_el.get_attribute("name") or ""
-        if fname:
-            for fmt in formats:
-                s_from = datetime.strptime(from_val, formats[0]).strftime(fmt) if fmt != formats[0] else from_val
-                s_to = datetime.strptime(to_val, formats[0]).strftime(fmt) if fmt != formats[0] else to_val
-                sel_from = f"input[name='{fname}']"
-                sel_to = f"input[name='{tname}']" if tname else sel_from
-                ok1 = try_jquery_datepicker_set(sel_from, s_from)
-                ok2 = try_jquery_datepicker_set(sel_to, s_to)
-                time.sleep(0.2)
-                valid_from, read_from = read_back_valid(from_el, exp_day, exp_month)
-                if ok1 and valid_from:
-                    debug_print(f"      ℹ jQuery datepicker set by name succeeded ({fname}) -> {read_from}")
-                    return True
-    except Exception:
-        pass
-    for fmt in formats:
-        try:
-            val_from = datetime.strptime(from_val, formats[0]).strftime(fmt) if fmt != formats[0] else from_val
-            val_to = datetime.strptime(to_val, formats[0]).strftime(fmt) if fmt != formats[0] else to_val
+    def as_fmt(val, fmt):
+        return datetime.strptime(val, formats[0]).strftime(fmt) if fmt != formats[0] else val
+    def attempt(strategy, fmt):
+        s_from, s_to = as_fmt(from_val, fmt), as_fmt(to_val, fmt)
+        if strategy == "jquery_id":
+            fid = from_el.get_attribute("id") or ""
+            tid = to_el.get_attribute("id") or ""
+            if not fid:
+                return False, ""
+            ok1 = try_jquery_datepicker_set(f"#{fid}", s_from)
+            if tid:
+                try_jquery_datepicker_set(f"#{tid}", s_to)
+            return read_back_valid(from_el, exp_day, exp_month) if ok1 else (False, "")
+        if strategy == "jquery_name":
+            fname = from_el.get_attribute("name") or ""
+            tname = to_el.get_attribute("name") or ""
+            if not fname:
+                return False, ""
+            sel_from = f"input[name='{fname}']"
+            sel_to = f"input[name='{tname}']" if tname else sel_from
+            ok1 = try_jquery_datepicker_set(sel_from, s_from)
+            try_jquery_datepicker_set(sel_to, s_to)
+            return read_back_valid(from_el, exp_day, exp_month) if ok1 else (False, "")
+        if strategy == "js_value":
             driver.execute_script("""
                 var f = arguments[0], v1 = arguments[1], t = arguments[2], v2 = arguments[3];
                 try { f.value = v1; } catch(e) {}
@@ -190,38 +216,33 @@ def set_date_on_elements(from_el, to_el, from_val, to_val, debug_label=""):
                     try { f.dispatchEvent(new Event(ev, {bubbles:true})); } catch(e) {}
                     try { t.dispatchEvent(new Event(ev, {bubbles:true})); } catch(e) {}
                 });
-            """, from_el, val_from, to_el, val_to)
+            """, from_el, s_from, to_el, s_to)
             dispatch_events_on(from_el)
             dispatch_events_on(to_el)
-            time.sleep(0.4)
-            valid_from, read_from = read_back_valid(from_el, exp_day, exp_month)
-            if valid_from:
-                debug_print(f"      ℹ JS set value succeeded -> {read_from} (fmt={fmt})")
-                return True
+            return read_back_valid(from_el, exp_day, exp_month)
+        # send_keys fallback
+        from_el.clear()
+        from_el.click()
+        from_el.send_keys(s_from)
+        from_el.send_keys(Keys.TAB)
+        wait_for_value(driver, from_el, bool, label="date")
+        to_el.clear()
+        to_el.send_keys(s_to)
+        to_el.send_keys(Keys.TAB)
+        dispatch_events_on(from_el)
+        return read_back_valid(from_el, exp_day, exp_month)
+    # remembered (strategy, format) first, then the full search in the original order
+    candidates = [(s, fmt) for s in DATE_STRATEGIES for fmt in formats]
+    for strategy, fmt in strategy_cache.order("set_date", candidates):
+        try:
+            valid_from, read_from = attempt(strategy, fmt)
         except Exception:
             time.sleep(0.1)
-    try:
-        for fmt in formats:
-            try_val = datetime.strptime(from_val, formats[0]).strftime(fmt) if fmt != formats[0] else from_val
-            try:
-                from_el.clear()
-                from_el.click()
-                from_el.send_keys(try_val)
-                from_el.send_keys(Keys.TAB)
-                time.sleep(0.2)
-                to_el.clear()
-                to_el.send_keys(datetime.strptime(to_val, formats[0]).strftime(fmt) if fmt != formats[0] else to_val)
-                to_el.send_keys(Keys.TAB)
-                time.sleep(0.4)
-                dispatch_events_on(from_el)
-                valid_from, read_from = read_back_valid(from_el, exp_day, exp_month)
-                if valid_from:
-                    debug_print(f"      ℹ send_keys succeeded -> {read_from} (fmt={fmt})")
-                    return True
-            except Exception:
-                time.sleep(0.1)
-    except Exception:
-        pass
+            continue
+        if valid_from:
+            debug_print(f"      ℹ Date set via {strategy} succeeded -> {read_from} (fmt={fmt})")
+            strategy_cache.remember("set_date", (strategy, fmt))
+            return True
     return False
 
 # ------------------------------
@@ -335,18 +356,39 @@ def split_party_and_advocate(text, prefix=None):
 # ------------------------------
 # Page parsing of table rows
 # ------------------------------
-def extract_case_data_from_page(bench_name, date_str, court_no):
+def extract_case_data_from_page(bench_name, date_str, court_no, query=None):
+    state = wait_for_results(driver, timeout=20)
+    if state is None:
+        debug_print(f"      ⚠️ Results did not settle for Court {court_no}, parsing current page")
+    try:
+        html = driver.page_source
+    except Exception as e:
+        debug_print(f"      ⚠️ Could not read page source: {repr(e)}")
+        return []
+    if query and ARCHIVE_HTML:
+        try:
+            response_archive.save(*query, html)
+        except Exception as e:
+            debug_print(f"      ⚠️ Could not archive page: {repr(e)}")
+    records = parse_case_page(parse_html_page(html), bench_name, date_str, court_no)
+    if query and state == "empty" and not records and get_empty_cache():
+        bench_code, _, from_str, to_str, _ = query
+        try:
+            empty_cache.mark_empty(bench_code, court_no, from_str, to_str)
+        except Exception as e:
+            debug_print(f"      ⚠️ Could not update empty-court cache: {repr(e)}")
+    return records
+
+def parse_case_page(page, bench_name, date_str, court_no):
     records = []
     try:
-        time.sleep(1.5)
         try:
-            page_text = driver.find_element(By.TAG_NAME, "body").text
+            page_text = page.text
         except Exception:
             page_text = ""
         judge_name = ""
         try:
-            judge_elem = driver.find_element(By.XPATH, "//*[contains(text(), 'HON') and contains(text(), 'JUSTICE')]")
-            judge_name = judge_elem.text.strip()
+            judge_name = page.line_containing("HON", "JUSTICE")
         except Exception:
             pass
         court_hall_display = str(court_no)
@@ -361,7 +403,7 @@ def extract_case_data_from_page(bench_name, date_str, court_no):
             if "sl.no" not in page_text.lower() and "case no" not in page_text.lower():
                 debug_print(f"      ⚠️ No records found for Court {court_no}")
                 return records
-        tables = driver.find_elements(By.TAG_NAME, "table")
+        tables = page.tables
         debug_print(f"      📍 Total tables found on page: {len(tables)}")
         if not tables:
             debug_print(f"      ⚠️ No table found for Court {court_no}")
@@ -371,7 +413,7 @@ def extract_case_data_from_page(bench_name, date_str, court_no):
         for table in tables:
             table_text = table.text.lower()
             if "sl" in table_text and "case" in table_text:
-                rows = table.find_elements(By.TAG_NAME, "tr")
+                rows = table.rows
                 if len(rows) >= 2:
                     data_table = table
                     debug_print(f"      📊 Found data table with {len(rows)} rows")
@@ -385,18 +427,18 @@ def extract_case_data_from_page(bench_name, date_str, court_no):
         
         for table in tables:
             try:
-                rows = table.find_elements(By.TAG_NAME, "tr")
+                rows = table.rows
                 if len(rows) < 2:
                     continue
                 header_row = None
                 header_indices = {}
                 for idx, row in enumerate(rows):
                     try:
-                        cells = row.find_elements(By.TAG_NAME, "th")
+                        cells = row.th
                         if not cells:
-                            cells = row.find_elements(By.TAG_NAME, "td")
+                            cells = row.td
                         if cells:
-                            header_text = [c.text.strip().lower() for c in cells]
+                            header_text = [c.lower() for c in cells]
                             joined = " ".join(header_text)
                             if "sl.no" in joined or "case no" in joined:
                                 header_row = idx
@@ -415,10 +457,10 @@ def extract_case_data_from_page(bench_name, date_str, court_no):
 
                 for row in rows[header_row+1:] if header_row is not None else rows[1:]:
                     try:
-                        cols = row.find_elements(By.TAG_NAME, "td")
+                        cols = row.td
                         if len(cols) < 2:
                             continue
-                        cell_texts = [c.text.strip() for c in cols]
+                        cell_texts = list(cols)
                         # ✅ FIXED: Extract Sl.No / SI.No / Sl No (Causelist_Slno) correctly
                         causelist_slno = ""
                         try:
@@ -460,14 +502,14 @@ def extract_case_data_from_page(bench_name, date_str, court_no):
                             case_text = cell_texts[header_indices["case_no"]]
                         else:
                             for txt in cell_texts:
-                                if re.search(r'[A-Z]+\s+\d+/\d{4}', txt):
+                                if case_ids.search(txt, with_ia=False):
                                     case_text = txt
                                     break
-                        case_match = re.search(r'([A-Z]+)\s+(\d+)/(\d{4})', case_text)
+                        case_match = case_ids.search(case_text, with_ia=False)
                         if case_match:
-                            record["Case_Type"] = case_match.group(1)
-                            record["Case_No"] = case_match.group(2)
-                            record["Year"] = case_match.group(3)
+                            record["Case_Type"] = case_match.type
+                            record["Case_No"] = case_match.number
+                            record["Year"] = case_match.year
                         pet_cell_text = ""
                         res_cell_text = ""
                         if "petitioner" in header_indices and header_indices["petitioner"] < len(cell_texts):
@@ -498,7 +540,8 @@ def extract_case_data_from_page(bench_name, date_str, court_no):
                             pass
                         if record["Case_No"]:
                             records.append(record)
-                            debug_print(f"      ✓ Extracted: {record['Case_Type']} {record['Case_No']}/{record['Year']} (S/N: {causelist_slno}) | Pet: {record['Petitioner'][:30]} | Resp: {record['Respondent'][:30]}")
+                            debug_detail("      ✓ Extracted: %s %s/%s (S/N: %s) | Pet: %.30s | Resp: %.30s", record['Case_Type'], record['Case_No'],
+                                         record['Year'], causelist_slno, record['Petitioner'], record['Respondent'])
                     except Exception:
                         continue
             except Exception:
@@ -508,67 +551,62 @@ def extract_case_data_from_page(bench_name, date_str, court_no):
         else:
             debug_print(f"      ⚠️ No valid records for Court {court_no}")
     except Exception as e:
-        debug_print(f"      ⚠️ Error in extract_case_data_from_page: {repr(e)}")
+        debug_print(f"      ⚠️ Error in parse_case_page: {repr(e)}")
     return records
 
 # ------------------------------
 # Save / Load progress and auto-save records
 # ------------------------------
-def load_progress():
-    if os.path.exists(PROGRESS_FILE):
-        try:
-            with open(PROGRESS_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {}
-    return {}
-
-def save_progress(progress_obj):
-    try:
-        with open(PROGRESS_FILE, "w", encoding="utf-8") as f:
-            json.dump(progress_obj, f, indent=2)
-    except Exception as e:
-        debug_print(f"⚠️ Failed to save progress: {repr(e)}")
+record_store = None
+response_archive = ResponseArchive(ARCHIVE_FOLDER)
+snapshot_backups = SnapshotBackups(OUTPUT_DB, BACKUP_FOLDER, BACKUP_COMPACT_EVERY, log=debug_print)
+empty_cache = None
+
+def get_record_store():
+    global record_store
+    if record_store is None:
+        record_store = open_record_store(OUTPUT_DB, OUTPUT_EXCEL, log=debug_print)
+    return record_store
+
+def get_empty_cache():
+    global empty_cache
+    if empty_cache is None and NEGATIVE_CACHE:
+        empty_cache = EmptyCache(EMPTY_CACHE_DB)
+        empty_cache.purge_expired()
+    return empty_cache
 
 def autosave_records(records):
     if not records:
-        return
+        return False
     try:
-        df = pd.DataFrame(records)
-
-        if os.path.exists(OUTPUT_EXCEL):
-            existing = pd.read_excel(OUTPUT_EXCEL)
-            combined = pd.concat([existing, df], ignore_index=True).drop_duplicates()
-        else:
-            combined = df
-
-        combined.drop_duplicates(subset=["Bench","Cause_Date","Court_Hall","Case_Type","Case_No","Year"], inplace=True)
-
-        if "ID" in combined.columns:
-            combined = combined.drop(columns=["ID"])
-        combined.insert(0, "ID", range(1, len(combined) + 1))
+        store = get_record_store()
+        inserted = store.add(records)
+        debug_print(f"💾 Auto-saved {inserted} new record(s) to {OUTPUT_DB} ({len(records) - inserted} already stored)")
 
-        combined.to_excel(OUTPUT_EXCEL, index=False)
-        debug_print(f"💾 Auto-saved {len(records)} new record(s) to {OUTPUT_EXCEL}")
-
-        # ✅ Backup every 10 days based on current date
+        # ✅ Snapshot every BACKUP_INTERVAL_DAYS: only the new rows, written by a background thread
         today = datetime.now().date()
         backup_tag = (today - datetime(YEAR, 1, 1).date()).days // BACKUP_INTERVAL_DAYS
-        backup_file = os.path.join(BACKUP_FOLDER, f"backup_{YEAR}_{backup_tag:02d}.xlsx")
-        if not os.path.exists(backup_file):
-            shutil.copy2(OUTPUT_EXCEL, backup_file)
-            debug_print(f"🗂️ Backup created: {backup_file}")
+        if snapshot_backups.request(f"{YEAR}_{backup_tag:02d}"):
+            debug_print(f"🗂️ Snapshot {YEAR}_{backup_tag:02d} queued")
 
+        return True
     except Exception as e:
         debug_print(f"⚠️ Auto-save failed: {repr(e)}")
+        return False
 
 
-def main():
+def main(reparse_only=False, restore_tag=None):
+    if reparse_only:
+        return reparse_main()  # parse ARCHIVE_FOLDER again into the record store, no browser
+    if restore_tag is not None:
+        return restore_main(restore_tag)  # rebuild the store at a snapshot, no browser
     ensure_folder()
+    start_browser()
     start_prevent_sleep_thread()
 
-    all_records = []
-    existing_progress = load_progress()
+    checkpoint = SprintCheckpoint(PROGRESS_FILE, on_error=debug_print)
+    existing_progress = checkpoint.state
+    window = WindowController(WINDOW_FILE, SPRINT_DAYS + 1, max_days=SPRINT_DAYS + 1, on_error=debug_print) if ADAPTIVE_SPRINT else None
     # ✅ Start from 01 jan 2025
     start_date = datetime(YEAR, 6, 7)
     end_date = datetime(YEAR, 12, 31)
@@ -587,102 +625,58 @@ def main():
     try:
         while current <= end_date:
             sprint_end = min(current + timedelta(days=SPRINT_DAYS), end_date)
+            recorded_end = checkpoint.sprint_end(current.strftime("%Y-%m-%d"))
+            if recorded_end:
+                sprint_end = datetime.strptime(recorded_end, "%Y-%m-%d")
             from_str = current.strftime("%d/%m/%Y")
             to_str = sprint_end.strftime("%d/%m/%Y")
             debug_print(f"\n📅 Sprint: {from_str} → {to_str}")
-
-            mode_value = "P" if sprint_end.date() < today.date() else "D"
-            debug_print(f"🔁 Mode: {'Previous' if mode_value=='P' else 'Daily & Advance'}")
+            checkpoint.start_sprint(current.strftime("%Y-%m-%d"), sprint_end.strftime("%Y-%m-%d"))
 
             for bench_code, bench_name in BENCHES.items():
-                debug_print(f"  ➤ {bench_name} | {from_str} → {to_str}")
-                found_data_after_min = False
-                for court_no in range(1, MAX_COURTS + 1):
-                    debug_print(f"    🏛️ Court Hall {court_no}")
-                    try:
-                        driver.get(CAUSELIST_URL)
-                        wait.until(EC.presence_of_all_elements_located((By.TAG_NAME, "form")))
-
-                        form, bench_select = find_form_and_bench_select(driver, bench_code)
-                        if not bench_select:
-                            try:
-                                bench_select = driver.find_element(By.NAME, "bench")
-                                form = bench_select.find_element(By.XPATH, "./ancestor::form[1]")
-                            except Exception:
-                                raise RuntimeError("Bench select not found.")
-
-                        sel = Select(bench_select)
-                        sel.select_by_value(bench_code)
-                        dispatch_events_on(bench_select)
-                        time.sleep(0.6)
+                if checkpoint.bench_done(bench_code):
+                    debug_print(f"    ⏭️ {bench_name} already finished in a previous run")
+                    continue
+                form_ready = False
+                # a bench whose window is narrower than the sprint covers it in several queries
+                for part_start, part_end in (window.bench_windows(bench_code, current, sprint_end) if window
+                                             else [(current, sprint_end)]):
+                    unit = bench_code if part_start == current else f"{bench_code}@{part_start:%Y-%m-%d}"
+                    from_str = part_start.strftime("%d/%m/%Y")
+                    to_str = part_end.strftime("%d/%m/%Y")
+                    mode_value = "P" if part_end.date() < today.date() else "D"
+                    debug_print(f"  ➤ {bench_name} | {from_str} → {to_str} | Mode: {'Previous' if mode_value=='P' else 'Daily & Advance'}")
+                    found_data_after_min = False
+                    for court_no in range(1, MAX_COURTS + 1):
+                        debug_print(f"    🏛️ Court Hall {court_no}")
+                        done_count = checkpoint.court_result(unit, court_no)
+                        if done_count is not None:
+                            debug_print(f"      ⏭️ Already done ({done_count} record(s)), skipping")
+                            if done_count and court_no > MIN_COURTS_TO_CHECK:
+                                found_data_after_min = True
+                            elif not done_count and court_no > MIN_COURTS_TO_CHECK and not found_data_after_min:
+                                debug_print(f"    ⏩ Stopping - no data after {MIN_COURTS_TO_CHECK} courts")
+                                break
+                            continue
 
-                        try:
-                            search_by_select = None
-                            if form:
-                                selects = form.find_elements(By.TAG_NAME, "select")
-                            else:
-                                selects = driver.find_elements(By.TAG_NAME, "select")
-                            for s in selects:
-                                try:
-                                    options = s.find_elements(By.TAG_NAME, "option")
-                                    option_texts = [opt.text.strip() for opt in options]
-                                    if "Court Hall" in option_texts and "Judge" in option_texts:
-                                        search_by_select = s
-                                        break
-                                except Exception:
-                                    continue
-                            if search_by_select:
-                                search_by_sel = Select(search_by_select)
-                                try:
-                                    search_by_sel.select_by_visible_text("Court Hall")
-                                except Exception:
-                                    for opt in search_by_select.find_elements(By.TAG_NAME, "option"):
-                                        if "Court Hall" in (opt.text or ""):
-                                            search_by_sel.select_by_visible_text(opt.text)
-                                            break
-                                dispatch_events_on(search_by_select)
-                                debug_print(f"      ✓ Fixed 'Search By' to 'Court Hall'")
-                                time.sleep(0.5)
-                        except Exception as e:
-                            debug_print(f"      ⚠️ Error setting 'Search By': {repr(e)}")
+                        cache = get_empty_cache()
+                        if cache and cache.is_empty(bench_code, court_no, part_start, part_end):
+                            debug_print(f"      🗃️ Cached as empty, not querying")
+                            checkpoint.mark_court(unit, court_no, 0)
+                            if court_no > MIN_COURTS_TO_CHECK and not found_data_after_min:
+                                debug_print(f"    ⏩ Stopping - no data after {MIN_COURTS_TO_CHECK} courts")
+                                break
+                            continue
 
+                        query_started = time.monotonic()
                         try:
-                            radios = (form.find_elements(By.XPATH, ".//input[@type='radio']") if form else driver.find_elements(By.XPATH, "//input[@type='radio']"))
-                            for r in radios:
-                                if (r.get_attribute("value") or "").strip().upper() == mode_value:
-                                    driver.execute_script("arguments[0].click();", r)
-                                    break
-                        except Exception:
-                            pass
-                        time.sleep(0.4)
-
-                        court_select = find_court_select(form)
-                        if court_select:
-                            try:
-                                court_sel = Select(court_select)
-                                all_options = court_sel.options
-                                court_found = False
-                                for opt in all_options:
-                                    opt_text = opt.text.strip()
-                                    opt_value = (opt.get_attribute("value") or "").strip()
-                                    if (f"COURT HALL - {court_no}" in opt_text.upper() or 
-                                        f"COURT HALL {court_no}" in opt_text.upper() or
-                                        f"HALL - {court_no}" in opt_text.upper() or
-                                        opt_value == str(court_no)):
-                                        try:
-                                            court_sel.select_by_visible_text(opt_text)
-                                            court_found = True
-                                            debug_print(f"      ✓ Selected: {opt_text}")
-                                            break
-                                        except Exception:
-                                            try:
-                                                court_sel.select_by_value(opt_value)
-                                                court_found = True
-                                                debug_print(f"      ✓ Selected Court by value: {opt_value}")
-                                                break
-                                            except Exception:
-                                                continue
-                                if not court_found:
+                            submitted = False
+                            if SESSION_MODE and form_ready:
+                                status, detail = resubmit_court(driver, bench_code, mode_value, from_str, to_str, court_no)
+                                if status == "submitted":
+                                    submitted = True
+                                    debug_print(f"      ✓ Selected: {detail} (form reused)")
+                                elif status == "no_court":
                                     debug_print(f"      ⚠️ Court Hall {court_no} not found")
                                     if court_no <= MIN_COURTS_TO_CHECK:
                                         debug_print(f"      ℹ️ Continuing (court {court_no}/{MIN_COURTS_TO_CHECK} mandatory)")
@@ -690,61 +684,168 @@ def main():
                                     else:
                                         debug_print(f"      ⏩ Stopping - court not available")
                                         break
-                                dispatch_events_on(court_select)
-                                time.sleep(0.5)
-                            except Exception as e:
-                                debug_print(f"      ⚠️ Error selecting Court {court_no}: {repr(e)}")
-                                if court_no <= MIN_COURTS_TO_CHECK:
-                                    debug_print(f"      ℹ️ Continuing despite error")
-                                    continue
                                 else:
+                                    debug_print(f"      ♻️ Form state stale ({detail}), reloading page")
+                                    form_ready = False
+
+                            if not submitted:
+                                driver.get(CAUSELIST_URL)
+                                wait.until(EC.presence_of_all_elements_located((By.TAG_NAME, "form")))
+
+                                form, bench_select = find_form_and_bench_select(driver, bench_code)
+                                if not bench_select:
+                                    try:
+                                        bench_select = driver.find_element(By.NAME, "bench")
+                                        form = bench_select.find_element(By.XPATH, "./ancestor::form[1]")
+                                    except Exception:
+                                        raise RuntimeError("Bench select not found.")
+
+                                sel = Select(bench_select)
+                                sel.select_by_value(bench_code)
+                                dispatch_events_on(bench_select)
+                                wait_for_network_idle(driver, timeout=5, label="bench")
+
+                                try:
+                                    search_by_select = None
+                                    if form:
+                                        selects = form.find_elements(By.TAG_NAME, "select")
+                                    else:
+                                        selects = driver.find_elements(By.TAG_NAME, "select")
+                                    for s in selects:
+                                        try:
+                                            options = s.find_elements(By.TAG_NAME, "option")
+                                            option_texts = [opt.text.strip() for opt in options]
+                                            if "Court Hall" in option_texts and "Judge" in option_texts:
+                                                search_by_select = s
+                                                break
+                                        except Exception:
+                                            continue
+                                    if search_by_select:
+                                        search_by_sel = Select(search_by_select)
+                                        try:
+                                            search_by_sel.select_by_visible_text("Court Hall")
+                                        except Exception:
+                                            for opt in search_by_select.find_elements(By.TAG_NAME, "option"):
+                                                if "Court Hall" in (opt.text or ""):
+                                                    search_by_sel.select_by_visible_text(opt.text)
+                                                    break
+                                        dispatch_events_on(search_by_select)
+                                        debug_print(f"      ✓ Fixed 'Search By' to 'Court Hall'")
+                                        wait_for_network_idle(driver, timeout=5, label="search_by")
+                                except Exception as e:
+                                    debug_print(f"      ⚠️ Error setting 'Search By': {repr(e)}")
+
+                                try:
+                                    radios = (form.find_elements(By.XPATH, ".//input[@type='radio']") if form else driver.find_elements(By.XPATH, "//input[@type='radio']"))
+                                    for r in radios:
+                                        if (r.get_attribute("value") or "").strip().upper() == mode_value:
+                                            driver.execute_script("arguments[0].click();", r)
+                                            break
+                                except Exception:
+                                    pass
+                                wait_for_network_idle(driver, timeout=5, label="mode")
+
+                                wait_for_court_options(driver, form)
+                                court_select = find_court_select(form)
+                                if court_select:
+                                    try:
+                                        court_sel = Select(court_select)
+                                        all_options = court_sel.options
+                                        court_found = False
+                                        for opt in all_options:
+                                            opt_text = opt.text.strip()
+                                            opt_value = (opt.get_attribute("value") or "").strip()
+                                            if is_court_option(opt_text, opt_value, court_no):
+                                                try:
+                                                    court_sel.select_by_visible_text(opt_text)
+                                                    court_found = True
+                                                    debug_print(f"      ✓ Selected: {opt_text}")
+                                                    break
+                                                except Exception:
+                                                    try:
+                                                        court_sel.select_by_value(opt_value)
+                                                        court_found = True
+                                                        debug_print(f"      ✓ Selected Court by value: {opt_value}")
+                                                        break
+                                                    except Exception:
+                                                        continue
+                                        if not court_found:
+                                            debug_print(f"      ⚠️ Court Hall {court_no} not found")
+                                            if court_no <= MIN_COURTS_TO_CHECK:
+                                                debug_print(f"      ℹ️ Continuing (court {court_no}/{MIN_COURTS_TO_CHECK} mandatory)")
+                                                continue
+                                            else:
+                                                debug_print(f"      ⏩ Stopping - court not available")
+                                                break
+                                        dispatch_events_on(court_select)
+                                        wait_for_network_idle(driver, timeout=5, label="court")
+                                    except Exception as e:
+                                        debug_print(f"      ⚠️ Error selecting Court {court_no}: {repr(e)}")
+                                        if court_no <= MIN_COURTS_TO_CHECK:
+                                            debug_print(f"      ℹ️ Continuing despite error")
+                                            continue
+                                        else:
+                                            break
+                                else:
+                                    debug_print(f"      ⚠️ Court select dropdown not found")
+                                    if court_no > 1:
+                                        break
+
+                                if form:
+                                    date_inputs = form.find_elements(By.XPATH, ".//input[@type='text' or @type='date']")
+                                else:
+                                    date_inputs = driver.find_elements(By.XPATH, "//input[@type='text' or @type='date']")
+                                visible_date_inputs = [i for i in date_inputs if i.is_displayed()]
+                                if len(visible_date_inputs) >= 2:
+                                    from_el = visible_date_inputs[0]
+                                    to_el = visible_date_inputs[1]
+                                else:
+                                    raise RuntimeError("Date inputs not found.")
+                                ok = set_date_on_elements(from_el, to_el, from_str, to_str, debug_label=f"{bench_name} Court {court_no}")
+                                if not ok:
+                                    raise RuntimeError(f"Failed to set dates")
+                                wait_for_network_idle(driver, timeout=5, label="dates")
+                                mark_results_stale(driver)
+                                if form:
+                                    form_ready = click_get_button_in_form(form)
+
+                            court_records = extract_case_data_from_page(bench_name, from_str, court_no,
+                                                                        query=(bench_code, court_no, from_str, to_str, mode_value))
+
+                            if window:
+
+                                window.observe(bench_code, len(court_records), time.monotonic() - query_started)
+                            if court_records:
+                                if autosave_records(court_records):
+                                    checkpoint.mark_court(unit, court_no, len(court_records))
+                                if court_no > MIN_COURTS_TO_CHECK:
+                                    found_data_after_min = True
+                                    debug_print(f"      ✅ Found data beyond court {MIN_COURTS_TO_CHECK}")
+                            else:
+                                debug_print(f"      ⚠️ No records for Court {court_no}")
+                                checkpoint.mark_court(unit, court_no, 0)
+                                if court_no > MIN_COURTS_TO_CHECK and not found_data_after_min:
+                                    debug_print(f"    ⏩ Stopping - no data after {MIN_COURTS_TO_CHECK} courts")
                                     break
-                        else:
-                            debug_print(f"      ⚠️ Court select dropdown not found")
-                            if court_no > 1:
+                        except Exception as e:
+                            debug_print(f"    ❌ Error for Court {court_no}: {repr(e)}")
+                            if court_no <= MIN_COURTS_TO_CHECK:
+                                debug_print(f"      ℹ️ Continuing despite error")
+                                continue
+                            else:
+                                debug_print(f"    ⏩ Stopping due to error")
                                 break
+                        finally:
+                            debug_print(f"      {default_clock.summary()}")
+                            default_clock.reset()
 
-                        if form:
-                            date_inputs = form.find_elements(By.XPATH, ".//input[@type='text' or @type='date']")
-                        else:
-                            date_inputs = driver.find_elements(By.XPATH, "//input[@type='text' or @type='date']")
-                        visible_date_inputs = [i for i in date_inputs if i.is_displayed()]
-                        if len(visible_date_inputs) >= 2:
-                            from_el = visible_date_inputs[0]
-                            to_el = visible_date_inputs[1]
-                        else:
-                            raise RuntimeError("Date inputs not found.")
-                        ok = set_date_on_elements(from_el, to_el, from_str, to_str, debug_label=f"{bench_name} Court {court_no}")
-                        if not ok:
-                            raise RuntimeError(f"Failed to set dates")
-                        time.sleep(0.8)
-                        if form:
-                            click_get_button_in_form(form)
-                        time.sleep(1.5)
-
-                        court_records = extract_case_data_from_page(bench_name, from_str, court_no)
-                        if court_records:
-                            all_records.extend(court_records)
-                            autosave_records(court_records)
-                            if court_no > MIN_COURTS_TO_CHECK:
-                                found_data_after_min = True
-                                debug_print(f"      ✅ Found data beyond court {MIN_COURTS_TO_CHECK}")
-                        else:
-                            debug_print(f"      ⚠️ No records for Court {court_no}")
-                            if court_no > MIN_COURTS_TO_CHECK and not found_data_after_min:
-                                debug_print(f"    ⏩ Stopping - no data after {MIN_COURTS_TO_CHECK} courts")
-                                break
-                    except Exception as e:
-                        debug_print(f"    ❌ Error for Court {court_no}: {repr(e)}")
-                        if court_no <= MIN_COURTS_TO_CHECK:
-                            debug_print(f"      ℹ️ Continuing despite error")
-                            continue
-                        else:
-                            debug_print(f"    ⏩ Stopping due to error")
-                            break
+                checkpoint.mark_bench(bench_code)
 
+            if window:
+                windows = window.end_sprint()
+                debug_print(f"📐 Next sprint windows (days): {windows}")
             next_start = (sprint_end + timedelta(days=1)).strftime("%Y-%m-%d")
-            save_progress({"current_date": next_start})
+            checkpoint.finish_sprint(next_start)
             debug_print(f"🔖 Progress saved. Next start will be {next_start}")
             time.sleep(1.0)
             current = sprint_end + timedelta(days=1)
@@ -756,27 +857,62 @@ def main():
         except Exception:
             pass
         stop_prevent_sleep_thread()
+        snapshot_backups.close()
+        if empty_cache is not None:
+            empty_cache.close()
 
-        if all_records:
-            try:
-                df = pd.DataFrame(all_records)
-                if os.path.exists(OUTPUT_EXCEL):
-                    existing = pd.read_excel(OUTPUT_EXCEL)
-                    combined = pd.concat([existing, df], ignore_index=True).drop_duplicates()
-                else:
-                    combined = df
-
-                # ✅ Drop duplicates in final save
-                combined.drop_duplicates(subset=["Bench","Cause_Date","Court_Hall","Case_Type","Case_No","Year"], inplace=True)
-
-                combined.insert(0, "ID", range(1, len(combined) + 1))
-                combined.to_excel(OUTPUT_EXCEL, index=False)
-                debug_print(f"✅ Excel saved with {len(combined)} records: {OUTPUT_EXCEL}")
-            except Exception as e:
-                debug_print(f"⚠️ Final save failed: {repr(e)}")
+        # optional export: rows stream out of the record store, nothing is held in memory
+        if record_store is not None:
+            if EXPORT_EXCEL:
+                try:
+                    total = record_store.export_excel(OUTPUT_EXCEL)
+                    debug_print(f"✅ Excel exported with {total} records: {OUTPUT_EXCEL}")
+                except Exception as e:
+                    debug_print(f"⚠️ Excel export failed: {repr(e)}")
+            record_store.close()
         else:
             debug_print("⚠️ No records extracted in this run. Excel not created/updated.")
 
-if __name__ == "__main__":
-    main()
+# ------------------------------
+# Offline reparse of the HTML archive (no browser)
+# ------------------------------
+def reparse_entry(meta, html):
+    """Parse one archived page with this script's parser (runs in a worker process)."""
+    bench_name = BENCHES.get(meta["bench"], meta["bench"])
+    return parse_case_page(parse_html_page(html), bench_name, meta["from"], meta["court"])
+
+def reparse_main():
+    ensure_folder()
+    store = get_record_store()
+    pages = written = 0
+    try:
+        for meta, records, error in reparse_archive(response_archive, reparse_entry, bench_codes=list(BENCHES),
+                                                    workers=REPARSE_WORKERS):
+            pages += 1
+            if error:
+                debug_print(f"⚠️ Could not reparse {meta.get('path')}: {error}")
+                continue
+            written += store.upsert(records)
+        debug_print(f"✅ Reparsed {pages} archived page(s), {written} record(s) written to {OUTPUT_DB}")
+        if EXPORT_EXCEL:
+            total = store.export_excel(OUTPUT_EXCEL)
+            debug_print(f"✅ Excel exported with {total} records: {OUTPUT_EXCEL}")
+    finally:
+        store.close()
 
+# ------------------------------
+# Restore the record store to a snapshot point (no browser)
+# ------------------------------
+def restore_main(tag):
+    dest = os.path.join(BACKUP_FOLDER, f"restored_{tag}.sqlite")
+    if os.path.exists(dest):
+        debug_print(f"⚠️ {dest} already exists, not overwriting")
+        return
+    total = snapshot_backups.restore(tag, dest)
+    debug_print(f"✅ Restored {total} record(s) from snapshot {tag} into {dest}")
+
+if __name__ == "__main__":
+    setup_queue_logging(LOG_FILE, fmt="%(message)s")
+    args = sys.argv[1:]
+    main(reparse_only="--reparse" in args,
+         restore_tag=args[args.index("--restore") + 1] if "--restore" in args[:-1] else None)
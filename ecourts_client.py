@@ -0,0 +1,241 @@
+import os
+import re
+import json
+import logging
+from contextlib import nullcontext
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ------------------------------
+# Direct HTTP client for the eCourts high court cause list page
+# (hcservices.ecourts.gov.in/ecourtindiaHC/cases/highcourt_causelist.php).
+# GO on that page sends the date and court codes to the site and renders
+# the returned rows. The first time the browser clicks GO, the request it
+# issued is captured (request_capture) and replayed over HTTP; it is
+# adopted only when the replay lists the same Sr Nos as the table the
+# browser showed, and the scripts keep it in their strategy cache. From
+# then on this client sends that request itself for every date, parses the
+# rows into plain descriptors and streams the PDFs over one pooled session.
+# A browser is only needed to capture the request again, or when the site
+# insists on a cookie/token that a plain GET of the page does not hand out.
+# ------------------------------
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0 Safari/537.36")
+CHUNK_SIZE = 64 * 1024
+
+def make_session(pool_size=8, retries=3):
+    """requests.Session with a connection pool and retry/backoff on transient errors."""
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=1.0, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset(["GET", "POST"]))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+def cookies_from_driver(driver, session):
+    """Copy a browser's cookies into session (used only to bootstrap a blocked session)."""
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+
+# ------------------------------
+# Listing parser
+# ------------------------------
+URL_IN_SCRIPT = re.compile(r"""['"]([^'"]+?(?:\.pdf|\.php\?[^'"]*))['"]""", re.IGNORECASE)
+
+class _ListingParser(HTMLParser):
+    """Collects table rows as (cell texts, links found in each cell)."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self.row = None
+        self.cell = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "tr":
+            self.row = []
+            self.rows.append(self.row)
+        elif tag in ("td", "th") and self.row is not None:
+            self.cell = {"text": [], "links": []}
+            self.row.append(self.cell)
+        elif self.cell is not None:
+            for name in ("href", "onclick", "data-url", "src"):
+                value = attrs.get(name) or ""
+                if value and not value.startswith("#"):
+                    self.cell["links"].append(value)
+
+    def handle_endtag(self, tag):
+        if tag in ("td", "th"):
+            self.cell = None
+        elif tag == "tr":
+            self.row = None
+            self.cell = None
+
+    def handle_data(self, data):
+        if self.cell is not None:
+            self.cell["text"].append(data)
+
+def _resolve_link(values, base_url):
+    for value in values:
+        if value.lower().startswith("javascript:") or "(" in value:
+            match = URL_IN_SCRIPT.search(value)
+            if match:
+                return urljoin(base_url, match.group(1))
+            continue
+        return urljoin(base_url, value)
+    return ""
+
+def _html_from_response(text):
+    """The listing comes back as HTML or as JSON wrapping HTML; return the HTML."""
+    stripped = text.lstrip()
+    if not stripped.startswith(("{", "[")):
+        return text
+    try:
+        payload = json.loads(stripped)
+    except ValueError:
+        return text
+    parts = []
+    def walk(value):
+        if isinstance(value, dict):
+            for v in value.values():
+                walk(v)
+        elif isinstance(value, list):
+            for v in value:
+                walk(v)
+        elif isinstance(value, str) and "<" in value:
+            parts.append(value)
+    walk(payload)
+    return "\n".join(parts)
+
+def parse_listing(text, base_url):
+    """Rows of a cause list listing as dicts: sr_no, bench, list_type, url."""
+    parser = _ListingParser()
+    parser.feed(_html_from_response(text))
+    parser.close()
+    entries = []
+    for cells in parser.rows:
+        if len(cells) < 3:
+            continue
+        texts = [re.sub(r"\s+", " ", "".join(c["text"])).strip() for c in cells]
+        if not re.match(r"^\d+", texts[0]):
+            continue   # header or filler row
+        url = _resolve_link(cells[-1]["links"], base_url) or _resolve_link(
+            [link for c in cells for link in c["links"]], base_url)
+        entries.append({"sr_no": texts[0], "bench": texts[1], "list_type": texts[2], "url": url})
+    return entries
+
+# ------------------------------
+# Client
+# ------------------------------
+class EcourtsCauselistClient:
+    """List and download one eCourts high court bench's cause lists over plain HTTP."""
+
+    def __init__(self, page_url, session=None, bootstrap=None, timeout=30, template=None, limiter=None):
+        self.page_url = page_url
+        self.session = session or make_session()
+        self.bootstrap = bootstrap      # bootstrap(session): copy cookies from a browser
+        self.timeout = timeout
+        self.template = template        # captured GO request (request_capture.RequestTemplate), or None
+        self.limiter = limiter          # limiter.slot(url) bounds requests per host (shared by several clients)
+        self.ready = False
+
+    def _slot(self, url):
+        return self.limiter.slot(url) if self.limiter is not None else nullcontext()
+
+    def open(self):
+        """GET the cause list page once so the session holds its cookies."""
+        response = self.session.get(self.page_url, timeout=self.timeout)
+        response.raise_for_status()
+        self.ready = True
+
+    def _replay(self, template, date):
+        """(response text, request url) of template sent for date."""
+        method, url, body = template.build(date)
+        headers = dict(template.headers or {"X-Requested-With": "XMLHttpRequest"}, Referer=self.page_url)
+        with self._slot(url):
+            response = self.session.request(method, url, data=body, headers=headers, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text, url
+
+    def learn_listing(self, candidates, date, sr_nos):
+        """Adopt the first captured request whose replay for date lists exactly sr_nos.
+
+        candidates are the requests the browser issued for GO on date
+        (request_capture.date_requests) and sr_nos the table it showed.
+        Returns True when one was adopted as self.template.
+        """
+        if not sr_nos:
+            return False   # an empty table cannot tell the listing request from any other
+        for template in candidates:
+            try:
+                text, url = self._replay(template, date)
+            except Exception as e:
+                logging.debug("Replay of %s %s failed: %s", template.method, template.url, e)
+                continue
+            if [entry["sr_no"] for entry in parse_listing(text, url)] == list(sr_nos):
+                template.verified = True
+                self.template = template
+                logging.info(f"Listing request captured: {template.method} {template.url}")
+                return True
+        return False
+
+    def list_causelists(self, date):
+        """Descriptors for every cause list published on date (a datetime).
+
+        Returns [] when the date has none, and None when there is no captured
+        listing request or it did not answer with a listing even after a
+        browser bootstrap; the request is then dropped so the caller can
+        capture it again in the browser.
+        """
+        if self.template is None:
+            return None
+        if not self.ready:
+            self.open()
+        text, url = self._replay(self.template, date)
+        entries = parse_listing(text, url)
+        if entries or self._looks_empty(text):
+            return entries
+        if self.bootstrap is not None:
+            logging.warning("Listing response not recognised; bootstrapping session cookies from the browser")
+            self.bootstrap(self.session)
+            text, url = self._replay(self.template, date)
+            entries = parse_listing(text, url)
+            if entries or self._looks_empty(text):
+                return entries
+        self.template = None
+        return None
+
+    @staticmethod
+    def _looks_empty(text):
+        lowered = text.lower()
+        return any(marker in lowered for marker in ("no record", "not found", "no cause list", "no data"))
+
+    def download(self, url, dest_path):
+        """Stream url into dest_path (atomically); returns True for a complete PDF."""
+        tmp_path = dest_path + ".part"
+        try:
+            with self._slot(url), self.session.get(url, stream=True, timeout=self.timeout,
+                                                   headers={"Referer": self.page_url}) as response:
+                response.raise_for_status()
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        f.write(chunk)
+            with open(tmp_path, "rb") as f:
+                if f.read(5) != b"%PDF-":
+                    raise ValueError("response is not a PDF")
+            os.replace(tmp_path, dest_path)
+            return True
+        except Exception as e:
+            logging.error(f"    ❌ HTTP download failed for {url}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
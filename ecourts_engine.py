@@ -0,0 +1,225 @@
+import os
+import re
+import time
+import logging
+import threading
+import importlib.util
+from importlib.machinery import SourceFileLoader
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+from ecourts_client import EcourtsCauselistClient, cookies_from_driver, make_session
+from request_capture import RequestTemplate
+from work_ledger import WorkLedger
+from pdf_store import PdfStore
+from log_setup import setup_queue_logging
+
+# ------------------------------
+# One process for every eCourts high court bench.
+# A bench is a TARGETS entry naming its per-bench script. The script stays
+# the home of the bench's page URL, ledger, PDF store, parser and workbook:
+# every listed date goes through the script's own process_listing(), so a
+# list the engine handles is downloaded, parsed once and stored exactly as
+# if the script had run, and either can pick up where the other stopped.
+# Listing uses the GO request the script captured in the browser (its
+# strategy cache); a bench whose script has not captured one yet is
+# skipped. All benches share one HTTP session (cookies and connection
+# pool) and run side by side, each working through its dates in order; a
+# per-host limit keeps the number of requests in flight to the eCourts
+# host bounded however many benches are configured.
+# ------------------------------
+
+# === CONFIGURATION ===
+BASE_FOLDER = r"C:\Users\Dell\OneDrive\Desktop\ecourts_causelists"
+LOG_FILE = os.path.join(BASE_FOLDER, "ecourts_engine_log.txt")
+
+# Date range configuration
+START_DATE = datetime(2025, 9, 1)
+END_DATE = datetime(2025, 10, 30)
+
+WORKERS = 6            # benches processed at once
+PER_HOST_LIMIT = 3     # requests in flight per host, across all benches
+
+# Adding a bench is one entry here: a script in this folder that defines
+# CAUSELIST_URL, LEDGER_DB, PDF_STORE, EXCEL_FILE, strategy_cache and
+# process_listing(). "name" is the court key the script uses in its ledger.
+TARGETS = [
+    {"name": "orissa", "script": "orissa_causelist_downloadandextraction.py"},
+    {"name": "aizawl", "script": "aizawl_bench"},
+]
+
+# === LOGGING SETUP ===
+def setup_logging():
+    """Create the output folder and start queued logging (called from main, not at import)."""
+    os.makedirs(BASE_FOLDER, exist_ok=True)
+    setup_queue_logging(LOG_FILE, fmt='%(asctime)s - %(levelname)s - %(threadName)s - %(message)s')
+
+# === SCRIPTS ===
+# aizawl_bench has no .py suffix, hence the explicit loader.
+_modules = {}
+_modules_lock = threading.Lock()
+
+def load_script(filename):
+    """Import one of the scraper scripts in this folder by file name."""
+    with _modules_lock:
+        if filename not in _modules:
+            path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+            name = "_ecourts_" + re.sub(r"\W", "_", filename)
+            loader = SourceFileLoader(name, path)
+            spec = importlib.util.spec_from_loader(name, loader)
+            module = importlib.util.module_from_spec(spec)
+            loader.exec_module(module)
+            _modules[filename] = module
+        return _modules[filename]
+
+# === SHARED HTTP STATE ===
+class HostLimiter:
+    """At most `limit` requests in flight per host."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.slots = {}
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            semaphore = self.slots.setdefault(host, threading.BoundedSemaphore(self.limit))
+        with semaphore:
+            yield
+
+class BrowserBootstrap:
+    """One headless Chrome, started only if some target needs browser cookies."""
+
+    def __init__(self):
+        self.driver = None
+        self.lock = threading.Lock()
+
+    def __call__(self, page_url, session):
+        with self.lock:
+            if self.driver is None:
+                from selenium import webdriver
+                from selenium.webdriver.chrome.service import Service
+                from selenium.webdriver.chrome.options import Options
+                from webdriver_manager.chrome import ChromeDriverManager
+                chrome_options = Options()
+                chrome_options.add_argument("--headless=new")
+                chrome_options.add_argument("--no-sandbox")
+                chrome_options.add_argument("--disable-dev-shm-usage")
+                self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+            self.driver.get(page_url)
+            time.sleep(3)
+            cookies_from_driver(self.driver, session)
+
+    def close(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+# === ENGINE ===
+class Bench:
+    """One configured target: its script, a client on the shared session and the bench totals."""
+
+    def __init__(self, config, session, bootstrap, limiter):
+        self.name = config["name"]
+        self.script = load_script(config["script"])
+        page_url = self.script.CAUSELIST_URL
+        saved = self.script.strategy_cache.get("listing_request")
+        self.client = EcourtsCauselistClient(page_url, session=session, bootstrap=lambda s: bootstrap(page_url, s),
+                                             template=RequestTemplate.from_dict(saved) if saved else None,
+                                             limiter=limiter)
+        # aizawl_bench works on its own row dicts, orissa on the listing entries as they are
+        self.rows = getattr(self.script, "causelist_descriptors", list)
+        self.totals = {"pdfs": 0, "cases": 0, "failed": []}
+
+def process_bench(bench, dates):
+    """List and process one bench's dates in order, through its script's ledger, PDF store and workbook."""
+    if bench.client.template is None:
+        logging.warning(f"[{bench.name}] no captured listing request yet; run its script once so GO can be captured")
+        bench.totals["failed"].append("listing request not captured")
+        return
+    ledger = WorkLedger(bench.script.LEDGER_DB, bench.name)
+    pdf_store = PdfStore(bench.script.PDF_STORE)
+    try:
+        for current_date in dates:
+            date_label = current_date.strftime('%d-%m-%Y')
+            if ledger.date_done(current_date):
+                logging.info(f"[{bench.name}] ⏭️ {date_label} already stored, skipping")
+                continue
+            try:
+                entries = bench.client.list_causelists(current_date)
+            except Exception as e:
+                logging.error(f"[{bench.name}] {date_label}: listing failed: {e}")
+                bench.totals["failed"].append(f"{date_label} - listing failed")
+                continue
+            if entries is None:
+                logging.error(f"[{bench.name}] {date_label}: listing request no longer answers; "
+                              "run the script to capture it again")
+                bench.totals["failed"].append(f"{date_label} onwards - listing request stale")
+                return
+            pdfs, cases, failed = bench.script.process_listing(bench.client, None, bench.rows(entries),
+                                                               current_date, ledger, pdf_store)
+            bench.totals["pdfs"] += pdfs
+            bench.totals["cases"] += cases
+            bench.totals["failed"].extend(failed)
+            logging.info(f"[{bench.name}] {date_label}: {len(entries)} list(s), {cases} cases")
+    finally:
+        ledger.close()
+        pdf_store.close()
+
+def run(targets, start_date, end_date, workers=WORKERS, per_host=PER_HOST_LIMIT):
+    """Process every target's date range, benches side by side; returns the Bench objects with their totals."""
+    session = make_session(pool_size=max(workers, per_host))
+    bootstrap = BrowserBootstrap()
+    limiter = HostLimiter(per_host)
+    benches = [Bench(config, session, bootstrap, limiter) for config in targets]
+
+    dates = []
+    current_date = start_date
+    while current_date <= end_date:
+        dates.append(current_date)
+        current_date += timedelta(days=1)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ecourts") as pool:
+            futures = {pool.submit(process_bench, bench, dates): bench for bench in benches}
+            for future in as_completed(futures):
+                bench = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error(f"[{bench.name}] {e}", exc_info=True)
+                    bench.totals["failed"].append(str(e))
+    finally:
+        bootstrap.close()
+        session.close()
+    return benches
+
+# === MAIN EXECUTION ===
+def main():
+    setup_logging()
+    logging.info("=" * 80)
+    logging.info("ECOURTS HIGH COURT CAUSELIST ENGINE")
+    logging.info(f"Targets: {', '.join(t['name'] for t in TARGETS)}")
+    logging.info("=" * 80)
+    benches = run(TARGETS, START_DATE, END_DATE)
+
+    logging.info("\n" + "=" * 80)
+    logging.info("PROCESSING COMPLETED")
+    logging.info("=" * 80)
+    for bench in benches:
+        totals = bench.totals
+        logging.info(f"{bench.name}: {totals['pdfs']} PDFs, {totals['cases']} cases, "
+                     f"{len(totals['failed'])} failed → {bench.script.EXCEL_FILE}")
+        for fail in sorted(totals["failed"]):
+            logging.info(f"  ❌ {fail}")
+
+
+if __name__ == "__main__":
+    main()
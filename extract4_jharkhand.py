@@ -12,6 +12,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
+from browser_downloads import IsolatedDownload
+from log_setup import setup_queue_logging
+from case_numbers import case_recognizer
 
 # === CONFIGURATION ===
 OUTPUT_FOLDER = r"C:\Users\Dell\OneDrive\Desktop\jshc_code\jhc_causelists"
@@ -20,15 +23,10 @@ LOG_FILE = os.path.join(OUTPUT_FOLDER, "scraper_log.txt")
 CAUSELIST_URL = "https://jharkhandhighcourt.nic.in/entire-cause-list.php"
 
 # === LOGGING SETUP ===
-os.makedirs(OUTPUT_FOLDER, exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+def setup_logging():
+    """Create the output folder and start queued logging (called from main, not at import)."""
+    os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+    setup_queue_logging(LOG_FILE)
 
 # === CHROME SETUP ===
 def setup_driver():
@@ -60,17 +58,6 @@ def setup_driver():
     return driver
 
 
-def wait_for_download(download_folder, timeout=40):
-    """Wait until file download completes."""
-    seconds = 0
-    while seconds < timeout:
-        time.sleep(1)
-        if not any(f.endswith('.crdownload') for f in os.listdir(download_folder)):
-            return True
-        seconds += 1
-    return False
-
-
 # === FETCH LINKS ===
 def get_daily_causelist_links(driver):
     """Fetch all DAILY CAUSELIST links from archive section."""
@@ -96,22 +83,25 @@ def get_daily_causelist_links(driver):
 
 # === DOWNLOAD PDF ===
 def download_pdf(driver, link_info):
-    """Download cause list PDF."""
+    """Download cause list PDF; returns its file name in OUTPUT_FOLDER or None."""
     try:
         link_text = link_info["text"]
         pdf_url = link_info["href"]
         logging.info(f"Downloading: {link_text}")
 
-        driver.get(pdf_url)
-        if wait_for_download(OUTPUT_FOLDER, timeout=30):
-            logging.info(f"✅ Download complete: {link_text}")
-            return True
-        else:
-            logging.warning(f"⚠️ Timeout waiting for: {link_text}")
-            return False
+        with IsolatedDownload(driver, OUTPUT_FOLDER) as download:
+            driver.get(pdf_url)
+            if download.wait(timeout=30):
+                # a name already in the folder gets a _N suffix instead of being overwritten
+                saved = download.move_to(os.path.join(OUTPUT_FOLDER, download.filename), rename=True)
+                pdf_name = os.path.basename(saved)
+                logging.info(f"✅ Download complete: {link_text}")
+                return pdf_name
+        logging.warning(f"⚠️ Timeout waiting for: {link_text}")
+        return None
     except Exception as e:
         logging.error(f"Error downloading {link_info['text']}: {e}")
-        return False
+        return None
 
 
 # === PDF TEXT EXTRACTION ===
@@ -169,7 +159,7 @@ def parse_causelist_data(pdf_text, pdf_filename):
                 break
     
     # Parse case rows - looking for tabular data with columns
-    case_pattern = re.compile(r"([A-Z]\.[A-Z]\([A-Z]+\)|[A-Z]+\.[A-Z]+\([A-Z]+\))\s*[/\-]?\s*(\d+)\s*[/\-]?\s*(\d{4})")
+    case_ids = case_recognizer("jharkhand_table")
     
     current_row = []
     all_rows = []
@@ -208,20 +198,21 @@ def parse_causelist_data(pdf_text, pdf_filename):
             rest_text = re.sub(r"Court\s+\d+", "", rest_text, flags=re.IGNORECASE).strip()
         
         # Try to match case number pattern
-        case_match = case_pattern.search(rest_text)
+        # Case number and IA number come from one scan of the row
+        case_match = case_ids.search(rest_text)
         if not case_match:
             logging.debug(f"Skipping row {sno} - no valid case number found")
             continue  # Skip if no case number found
         
-        case_type = case_match.group(1).strip()
-        case_number = case_match.group(2).strip()
-        case_year = case_match.group(3).strip()
+        case_type = case_match.type
+        case_number = case_match.number
+        case_year = case_match.year
         
         # Split text into columns by looking for multiple spaces or specific patterns
         # The structure is: [Serial] [Court] [Case] [Petitioner vs Respondent] [Pet Advocate] [Resp Advocate]
         
         # Remove case number pattern from text to parse parties
-        text_after_case = rest_text[case_match.end():].strip()
+        text_after_case = rest_text[case_match.end:].strip()
         
         # Extract petitioner and respondent by splitting on VS
         petitioner = "N/A"
@@ -260,12 +251,11 @@ def parse_causelist_data(pdf_text, pdf_filename):
             if len(parts) >= 4:
                 respondent_advocate = parts[3].strip()
         
-        # Extract IA, Subject, and Act information
-        ia_match = re.search(r"IA\s*NO\.?\s*([0-9/]+)", full_text, re.IGNORECASE)
+        # Extract Subject and Act information
         subject_match = re.search(r"SUBJECT\s*[:-]?\s*([A-Z\s,]+)", full_text, re.IGNORECASE)
         act_match = re.search(r"ACT\s*[:-]?\s*(.+)", full_text, re.IGNORECASE)
         
-        ia_no = ia_match.group(1).strip() if ia_match else "N/A"
+        ia_no = case_match.ia
         subject = subject_match.group(1).strip() if subject_match else "N/A"
         act = act_match.group(1).strip() if act_match else "N/A"
         
@@ -337,6 +327,7 @@ def save_to_excel(cases_data, excel_path):
 
 # === MAIN EXECUTION ===
 def main():
+    setup_logging()
     logging.info("=== JHARKHAND HIGH COURT CAUSELIST SCRAPER STARTED ===")
 
     driver = setup_driver()
@@ -352,18 +343,14 @@ def main():
             logging.info(f"Processing {i}/{len(links)} → {link['text']}")
             logging.info(f"{'='*70}")
 
-            if download_pdf(driver, link):
-                pdfs = [f for f in os.listdir(OUTPUT_FOLDER) if f.lower().endswith(".pdf")]
-                pdfs.sort(key=lambda x: os.path.getmtime(os.path.join(OUTPUT_FOLDER, x)), reverse=True)
-                latest_pdf = pdfs[0] if pdfs else None
-
-                if latest_pdf:
-                    pdf_path = os.path.join(OUTPUT_FOLDER, latest_pdf)
-                    text = extract_text_from_pdf(pdf_path)
-                    cases = parse_causelist_data(text, latest_pdf)
-                    if cases:
-                        save_to_excel(cases, EXCEL_OUTPUT)
-                        total_cases += len(cases)
+            latest_pdf = download_pdf(driver, link)
+            if latest_pdf:
+                pdf_path = os.path.join(OUTPUT_FOLDER, latest_pdf)
+                text = extract_text_from_pdf(pdf_path)
+                cases = parse_causelist_data(text, latest_pdf)
+                if cases:
+                    save_to_excel(cases, EXCEL_OUTPUT)
+                    total_cases += len(cases)
             else:
                 logging.warning(f"Skipping {link['text']} due to download failure.")
 
@@ -3,6 +3,7 @@ import time
 import requests
 import re
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -15,6 +16,14 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
 import PyPDF2
+from work_ledger import WorkLedger
+from log_setup import setup_queue_logging
+from strategy_cache import StrategyCache
+from ecourts_client import make_session, cookies_from_driver
+from case_numbers import case_recognizer
+from party_tokenizer import BlockBudget, tokenize, extract_parties, extract_advocates
+from request_capture import (RequestTemplate, enable_performance_log, drain_performance_log,
+                             install_request_hook, capture_template, fetch_pdf)
 
 # === CONFIGURATION ===
 START_DATE = datetime(2025, 1, 1)
@@ -22,19 +31,23 @@ END_DATE = datetime(2025, 12, 31)
 OUTPUT_FOLDER = r"C:\Users\Dell\OneDrive\Desktop\ghc_script\GHC_CauseLists"
 EXCEL_OUTPUT = os.path.join(OUTPUT_FOLDER, "GHC_Complete_Cases.xlsx")
 LOG_FILE = os.path.join(OUTPUT_FOLDER, "scraper_log.txt")
+LEDGER_DB = os.path.join(OUTPUT_FOLDER, "ghc_ledger.sqlite")  # resume state per date
+LIST_SR_NO = "1"  # one complete cause list per date, so one ledger unit per date
+STRATEGY_FILE = os.path.join(OUTPUT_FOLDER, "strategy_cache.json")  # captured GET CAUSELIST request
+DIRECT_MODE = True  # replay the captured GET CAUSELIST request over HTTP; the browser only bootstraps the session
+PARSE_WORKERS = 1  # worker processes for court-room sections (1 = serial, None = one per CPU); serial unless measured faster
+PARALLEL_MIN_SECTIONS = 4  # fewer court rooms than this are parsed in this process
+PARALLEL_MIN_CHARS = 500_000  # smaller lists are parsed in this process; shipping sections to workers costs more
 
 URL = "https://gujarathc-casestatus.nic.in/gujarathc/#"
 
+strategy_cache = StrategyCache(STRATEGY_FILE, "gujarathc")
+
 # Setup logging
-os.makedirs(OUTPUT_FOLDER, exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
+def setup_logging():
+    """Create the output folder and start queued logging (called from main, not at import)."""
+    os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+    setup_queue_logging(LOG_FILE)
 
 # === CHROME SETUP ===
 def setup_driver():
@@ -51,6 +64,7 @@ def setup_driver():
         "plugins.always_open_pdf_externally": True
     }
     chrome_options.add_experimental_option("prefs", prefs)
+    enable_performance_log(chrome_options)  # lets DIRECT_MODE see the request behind GET CAUSELIST
     
     driver = webdriver.Chrome(
         service=Service(ChromeDriverManager().install()),
@@ -75,60 +89,108 @@ def extract_text_from_pdf(pdf_path):
         return None
 
 # === DATA PARSING FUNCTIONS ===
-def parse_causelist_data(pdf_text, cause_date, pdf_filename):
-    """Parse the causelist text and extract case information"""
-    cases = []
-    
+def split_court_sections(pdf_text):
+    """(court_room, chief_justice, section_text) for each court room, in document order.
+
+    A section without its own judge line keeps the judge of the one before it.
+    """
     court_sections = re.split(r'COURT\s+ROOM\s+NO[:\s]*(\d+)', pdf_text, flags=re.IGNORECASE)
     
-    current_court_room = "N/A"
-    current_chief_justice = "N/A"
+    cj_patterns = [
+        r'(CHIEF JUSTICE[^:\n]+)',
+        r'(MRS?\.\s+JUSTICE[^:\n]+)',
+        r"(HON['']BLE[^:\n]+JUSTICE[^:\n]+)",
+    ]
     
+    sections = []
+    current_chief_justice = "N/A"
     for i in range(1, len(court_sections), 2):
-        if i >= len(court_sections):
-            break
-            
         current_court_room = court_sections[i].strip()
         section_text = court_sections[i + 1] if i + 1 < len(court_sections) else ""
         
-        cj_patterns = [
-            r'(CHIEF JUSTICE[^:\n]+)',
-            r'(MRS?\.\s+JUSTICE[^:\n]+)',
-            r"(HON['']BLE[^:\n]+JUSTICE[^:\n]+)",
-        ]
-        
         for pattern in cj_patterns:
             cj_match = re.search(pattern, section_text, re.IGNORECASE)
             if cj_match:
                 current_chief_justice = cj_match.group(1).strip()
                 break
         
-        lines = section_text.split('\n')
-        
-        current_sno = None
-        current_case_block = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            sno_match = re.match(r'^(\d+)\s+', line)
-            
-            if sno_match:
-                if current_sno and current_case_block:
-                    process_case_block(current_sno, current_case_block, current_court_room, 
-                                     current_chief_justice, cause_date, pdf_filename, cases)
-                
-                current_sno = sno_match.group(1)
-                current_case_block = [line]
-            elif current_sno:
-                current_case_block.append(line)
-        
-        if current_sno and current_case_block:
-            process_case_block(current_sno, current_case_block, current_court_room, 
-                             current_chief_justice, cause_date, pdf_filename, cases)
+        sections.append((current_court_room, current_chief_justice, section_text))
+    return sections
+
+def parse_court_section(court_room, chief_justice, section_text, cause_date, pdf_filename):
+    """CaseBlock records of one court-room section"""
+    cases = []
+    current_sno = None
+    current_case_block = []
+    
+    for line in section_text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        
+        sno_match = re.match(r'^(\d+)\s+', line)
+        
+        if sno_match:
+            if current_sno and current_case_block:
+                process_case_block(current_sno, current_case_block, court_room, 
+                                 chief_justice, cause_date, pdf_filename, cases)
+            
+            current_sno = sno_match.group(1)
+            current_case_block = [line]
+        elif current_sno:
+            current_case_block.append(line)
     
+    if current_sno and current_case_block:
+        process_case_block(current_sno, current_case_block, court_room, 
+                         chief_justice, cause_date, pdf_filename, cases)
+    return cases
+
+def _parse_section_args(args):
+    return parse_court_section(*args)
+
+_section_pool = None
+
+def section_pool():
+    """Worker pool for court-room sections, started on first use and kept for later dates"""
+    global _section_pool
+    if _section_pool is None:
+        _section_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+    return _section_pool
+
+def shutdown_section_pool():
+    global _section_pool
+    if _section_pool is not None:
+        _section_pool.shutdown()
+        _section_pool = None
+
+def parse_causelist_data(pdf_text, cause_date, pdf_filename):
+    """Parse the causelist text and extract case information.
+
+    Court-room sections are independent, so with PARSE_WORKERS other than 1 a
+    large full-court list is parsed on a process pool, several sections per
+    task; results are merged in section order, giving the same rows as a
+    serial parse. Returns CaseBlock records; ids are assigned by position
+    when they are expanded for export.
+    """
+    sections = split_court_sections(pdf_text)
+    jobs = [(court_room, chief_justice, section_text, cause_date, pdf_filename)
+            for court_room, chief_justice, section_text in sections]
+    
+    if PARSE_WORKERS == 1 or len(jobs) < PARALLEL_MIN_SECTIONS or len(pdf_text) < PARALLEL_MIN_CHARS:
+        results = map(_parse_section_args, jobs)
+    else:
+        try:
+            workers = PARSE_WORKERS or os.cpu_count() or 1
+            chunksize = max(1, len(jobs) // (workers * 4))
+            results = list(section_pool().map(_parse_section_args, jobs, chunksize=chunksize))
+        except Exception as e:
+            logging.warning(f"Parallel parse failed ({e}), parsing serially")
+            shutdown_section_pool()
+            results = map(_parse_section_args, jobs)
+    
+    cases = []
+    for section_cases in results:
+        cases.extend(section_cases)
     return cases
 
 def process_case_block(sno, case_lines, court_room, chief_justice, cause_date, pdf_filename, cases):
@@ -139,18 +201,16 @@ def process_case_block(sno, case_lines, court_room, chief_justice, cause_date, p
     listed_match = re.search(r'LISTED\s+(\d+)\s+TIME[S]?', full_text, re.IGNORECASE)
     num_listings = int(listed_match.group(1)) if listed_match else 1
     
-    case_numbers = re.findall(r'([A-Z]+)/(\d+)/(\d+)', full_text)
-    
-    vs_matches = re.finditer(r'([A-Z][A-Z\s\.\,\&\(\)]+?)\s+V[/\\]?S\s+([A-Z][A-Z\s\.\,\&\(\)]+?)(?=\s+MR|MS|ADVOCATE|\n|$)', full_text, re.IGNORECASE)
+    case_numbers = case_recognizer("gujarat").findall(full_text)
     
-    parties_list = []
-    for match in vs_matches:
-        petitioner = match.group(1).strip()
-        respondent = match.group(2).strip()
-        parties_list.append((petitioner, respondent))
-    
-    advocate_pattern = r'(MR\.?|MS\.?|MRS\.?|ADVOCATE)\s+([A-Z][A-Z\s\.]+?)(?=\s+\d+|\s+MR|MS|FOR|LISTED|$)'
-    advocates = re.findall(advocate_pattern, full_text, re.IGNORECASE)
+    # Parties and advocates come from one linear pass over the block's words;
+    # the budget stops a malformed block from holding up the whole list
+    budget = BlockBudget()
+    tokens = tokenize(case_lines)
+    parties_list = extract_parties(tokens, budget)
+    advocates = extract_advocates(tokens, budget)
+    if budget.exceeded:
+        logging.warning(f"Case block {sno} in court room {court_room} hit the parse time budget; parties/advocates may be incomplete")
     
     remarks_patterns = [
         r'(FOR\s+[A-Z\s]+)',
@@ -167,90 +227,131 @@ def process_case_block(sno, case_lines, court_room, chief_justice, cause_date, p
             remarks = remarks_match.group(1).strip()
             break
     
-    for listing_idx in range(num_listings):
-        case_sl_no = f"{sno}.{listing_idx + 1}" if num_listings > 1 else sno
-        
-        case_number = "N/A"
-        case_type = "N/A"
-        
-        if listing_idx < len(case_numbers):
-            case_type = case_numbers[listing_idx][0]
-            case_number = case_numbers[listing_idx][1]
-        elif case_numbers:
-            case_type = case_numbers[0][0]
-            case_number = case_numbers[0][1]
-        
-        petitioner = "N/A"
-        respondent = "N/A"
-        
-        if parties_list:
-            petitioner = parties_list[0][0]
-            respondent = parties_list[0][1]
-        
-        petitioner_advocate = "N/A"
-        respondent_advocate = "N/A"
-        
-        if len(advocates) >= 1:
-            petitioner_advocate = f"{advocates[0][0]} {advocates[0][1]}".strip()
-        if len(advocates) >= 2:
-            respondent_advocate = f"{advocates[1][0]} {advocates[1][1]}".strip()
-        
-        if num_listings > 1:
-            listed_times = f"LISTED {num_listings} TIMES"
-        else:
-            listed_times = "LISTED 1 TIME"
-        
-        case_data = {
-            'id': len(cases) + 1,
-            'causelist_slno': case_sl_no,
-            'court_hall_number': court_room,
-            'Case_number': case_number,
-            'Case_type': case_type,
-            'bench_name': chief_justice if chief_justice != "N/A" else "GUJARAT",
-            'cause_date': cause_date,
-            'chief_justice': chief_justice,
-            'petitioner': petitioner,
-            'respondent': respondent,
-            'petitioner_advocate': petitioner_advocate,
-            'respondent_advocate': respondent_advocate,
-            'particulars': 'list downloaded',
-            'Pdf_name': pdf_filename,
-            'listed_times': listed_times,
-            'remarks': remarks
-        }
-        
-        cases.append(case_data)
+    petitioner = "N/A"
+    respondent = "N/A"
+    
+    if parties_list:
+        petitioner = parties_list[0][0]
+        respondent = parties_list[0][1]
+    
+    petitioner_advocate = "N/A"
+    respondent_advocate = "N/A"
+    
+    if len(advocates) >= 1:
+        petitioner_advocate = f"{advocates[0][0]} {advocates[0][1]}".strip()
+    if len(advocates) >= 2:
+        respondent_advocate = f"{advocates[1][0]} {advocates[1][1]}".strip()
+    
+    if num_listings > 1:
+        listed_times = f"LISTED {num_listings} TIMES"
+    else:
+        listed_times = "LISTED 1 TIME"
+    
+    # One record per block; its listings are expanded into rows only on export
+    fields = (
+        court_room,
+        chief_justice if chief_justice != "N/A" else "GUJARAT",
+        cause_date,
+        chief_justice,
+        petitioner,
+        respondent,
+        petitioner_advocate,
+        respondent_advocate,
+        'list downloaded',
+        pdf_filename,
+        listed_times,
+        remarks,
+    )
+    cases.append(CaseBlock(sno, num_listings, [(c[0], c[1]) for c in case_numbers[:num_listings]], fields))
+
+# === CASE RECORDS ===
+CASE_COLUMNS = [
+    'id', 'causelist_slno', 'court_hall_number', 'Case_number', 'Case_type', 
+    'bench_name', 'cause_date', 'chief_justice', 'petitioner', 'respondent', 
+    'petitioner_advocate', 'respondent_advocate', 'particulars', 'Pdf_name', 
+    'listed_times', 'remarks'
+]
+# CaseBlock.fields, in CASE_COLUMNS order without the per-listing columns
+BLOCK_COLUMNS = ('court_hall_number', 'bench_name', 'cause_date', 'chief_justice', 'petitioner', 'respondent',
+                 'petitioner_advocate', 'respondent_advocate', 'particulars', 'Pdf_name', 'listed_times', 'remarks')
+
+class CaseBlock:
+    """A case block listed one or more times: shared fields stored once, plus a case number per listing.
+
+    A block "LISTED n TIMES" yields n rows that differ only in their serial
+    number and case number, so only those are kept per listing.
+    """
+    __slots__ = ("sno", "listings", "case_numbers", "fields")
+
+    def __init__(self, sno, listings, case_numbers, fields):
+        self.sno = sno
+        self.listings = listings
+        self.case_numbers = case_numbers  # (Case_type, Case_number) of the first `listings` case numbers
+        self.fields = fields              # values for BLOCK_COLUMNS
+
+    def __len__(self):
+        return self.listings
+
+    def rows(self):
+        """(causelist_slno, Case_number, Case_type) of each listing"""
+        for listing_idx in range(self.listings):
+            case_sl_no = f"{self.sno}.{listing_idx + 1}" if self.listings > 1 else self.sno
+            case_type, case_number = "N/A", "N/A"
+            if listing_idx < len(self.case_numbers):
+                case_type, case_number = self.case_numbers[listing_idx]
+            elif self.case_numbers:
+                case_type, case_number = self.case_numbers[0]
+            yield case_sl_no, case_number, case_type
+
+def count_cases(blocks):
+    """Number of rows the blocks expand to"""
+    return sum(len(block) for block in blocks)
+
+def expand_cases(blocks, first_id=1):
+    """Export rows in CASE_COLUMNS order, generated one listing at a time"""
+    case_id = first_id
+    for block in blocks:
+        court_room, rest = block.fields[0], block.fields[1:]
+        for case_sl_no, case_number, case_type in block.rows():
+            yield (case_id, case_sl_no, court_room, case_number, case_type) + rest
+            case_id += 1
 
 # === EXCEL MANAGEMENT ===
 def save_to_excel(cases_data, excel_path):
-    """Save or append data to Excel file"""
+    """Save or append data to Excel file (cases_data is a list of CaseBlock, expanded here)"""
     try:
-        columns = [
-            'id', 'causelist_slno', 'court_hall_number', 'Case_number', 'Case_type', 
-            'bench_name', 'cause_date', 'chief_justice', 'petitioner', 'respondent', 
-            'petitioner_advocate', 'respondent_advocate', 'particulars', 'Pdf_name', 
-            'listed_times', 'remarks'
-        ]
+        columns = CASE_COLUMNS
         
         if os.path.exists(excel_path):
             existing_df = pd.read_excel(excel_path)
-            new_df = pd.DataFrame(cases_data)
+            new_df = pd.DataFrame.from_records(expand_cases(cases_data), columns=columns)
             combined_df = pd.concat([existing_df, new_df], ignore_index=True)
             combined_df['id'] = range(1, len(combined_df) + 1)
             combined_df = combined_df[columns]
             combined_df.to_excel(excel_path, index=False)
-            logging.info(f"Appended {len(cases_data)} cases to existing Excel file")
+            logging.info(f"Appended {len(new_df)} cases to existing Excel file")
         else:
-            df = pd.DataFrame(cases_data)
-            df = df[columns]
+            df = pd.DataFrame.from_records(expand_cases(cases_data), columns=columns)
             df.to_excel(excel_path, index=False)
-            logging.info(f"Created new Excel file with {len(cases_data)} cases")
+            logging.info(f"Created new Excel file with {len(df)} cases")
         
         return True
     except Exception as e:
         logging.error(f"Error saving to Excel: {e}")
         return False
 
+def causelist_filename(date):
+    """Name the site gives the complete causelist download, e.g. Complete_Causelist_1st_January_2025.pdf"""
+    day_num = date.day
+    day_suffix = "th"
+    if day_num in [1, 21, 31]:
+        day_suffix = "st"
+    elif day_num in [2, 22]:
+        day_suffix = "nd"
+    elif day_num in [3, 23]:
+        day_suffix = "rd"
+    return f"Complete_Causelist_{day_num}{day_suffix}_{date.strftime('%B')}_{date.strftime('%Y')}.pdf"
+
 # === MAIN SCRAPING FUNCTION ===
 def navigate_to_causelist_page(driver):
     """Navigate to the causelist page from main page"""
@@ -309,13 +410,108 @@ def navigate_to_causelist_page(driver):
         logging.error(f"Error navigating to causelist page: {e}")
         return False
 
-def download_and_process_causelist(driver, date):
-    """Download causelist for a specific date and extract data"""
+def process_causelist_pdf(pdf_path, date, ledger):
+    """Extract, parse and store one downloaded causelist PDF, recording progress in the ledger"""
+    date_str = date.strftime("%d/%m/%Y")
+    try:
+        pdf_text = extract_text_from_pdf(pdf_path)
+        
+        if pdf_text:
+            # Use the actual filename without extension
+            pdf_filename = os.path.splitext(os.path.basename(pdf_path))[0]
+            cases = parse_causelist_data(pdf_text, date_str, pdf_filename)
+            
+            if count_cases(cases):
+                ledger.advance(date, LIST_SR_NO, "parsed")
+                if save_to_excel(cases, EXCEL_OUTPUT):
+                    ledger.advance(date, LIST_SR_NO, "stored")
+                    ledger.close_date(date)
+                else:
+                    ledger.fail(date, LIST_SR_NO, "Excel save failed")
+                logging.info(f"Extracted {count_cases(cases)} cases ({len(cases)} blocks) for {date_str}")
+                return True
+            else:
+                logging.warning(f"No cases extracted from PDF for {date_str}")
+                ledger.fail(date, LIST_SR_NO, "no cases extracted")
+                return False
+        else:
+            logging.error(f"Could not extract text from PDF for {date_str}")
+            ledger.fail(date, LIST_SR_NO, "no text in PDF")
+            return False
+            
+    except Exception as e:
+        logging.error(f"Error processing PDF for {date_str}: {e}")
+        ledger.fail(date, LIST_SR_NO, e)
+        return False
+
+def reuse_downloaded_pdf(date, ledger):
+    """Parse a PDF downloaded for date by an earlier run; None if there is none"""
+    ledger.record_listing(date, [LIST_SR_NO])
+    state, pdf_name = ledger.unit(date, LIST_SR_NO)
+    if state in ("downloaded", "parsed") and pdf_name and os.path.exists(os.path.join(OUTPUT_FOLDER, pdf_name)):
+        logging.info(f"Reusing {pdf_name} from an earlier run")
+        return process_causelist_pdf(os.path.join(OUTPUT_FOLDER, pdf_name), date, ledger)
+    return None
+
+def download_causelist_direct(driver, session, date, ledger):
+    """Fetch the complete causelist for date with the captured GET CAUSELIST request.
+
+    Returns True/False like the browser flow, or None when there is no usable
+    captured request and the browser has to click through (and capture) again.
+    """
+    saved = strategy_cache.get("causelist_request")
+    if not saved:
+        return None
+    date_str = date.strftime("%d/%m/%Y")
+    logging.info(f"Processing date: {date_str} (direct)")
+    
+    reused = reuse_downloaded_pdf(date, ledger)
+    if reused is not None:
+        return reused
+    
+    template = RequestTemplate.from_dict(saved)
+    verified = template.verified
+    pdf_path = os.path.join(OUTPUT_FOLDER, causelist_filename(date))
+    outcome = fetch_pdf(session, template, date, pdf_path)
+    if outcome == "error":
+        # Session probably expired: let the browser log in again and retry once
+        logging.info("Refreshing session cookies from the browser")
+        if navigate_to_causelist_page(driver):
+            cookies_from_driver(driver, session)
+            outcome = fetch_pdf(session, template, date, pdf_path)
+    if outcome == "error":
+        return None
+    if outcome == "empty" and not template.verified:
+        # no PDF has ever come back for this request: it may not be the download at all
+        logging.warning(f"Captured request gave no PDF for {date_str}, using the browser to check")
+        return None
+    if template.verified and not verified:
+        strategy_cache.remember("causelist_request", template.to_dict())
+    if outcome == "empty":
+        logging.warning(f"No causelist published for {date_str}")
+        ledger.fail(date, LIST_SR_NO, "no PDF downloaded")
+        return False
+    
+    logging.info(f"Downloaded {os.path.basename(pdf_path)} directly")
+    ledger.advance(date, LIST_SR_NO, "downloaded", pdf=os.path.basename(pdf_path))
+    return process_causelist_pdf(pdf_path, date, ledger)
+
+def download_and_process_causelist(driver, date, ledger, session=None):
+    """Download causelist for a specific date and extract data.
+
+    With a session (DIRECT_MODE) the request behind GET CAUSELIST is captured
+    and the PDF fetched over HTTP, so later dates can skip the browser.
+    """
     date_str = date.strftime("%d/%m/%Y")
     date_filename = date.strftime("%d_%m_%Y")
     
     logging.info(f"Processing date: {date_str}")
     
+    # A PDF downloaded by an earlier run is parsed again without the browser
+    reused = reuse_downloaded_pdf(date, ledger)
+    if reused is not None:
+        return reused
+    
     # Get list of existing PDFs before download
     existing_pdfs = set()
     try:
@@ -562,6 +758,10 @@ def download_and_process_causelist(driver, date):
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", get_causelist_button)
             time.sleep(1)
             
+            if session is not None:
+                drain_performance_log(driver)
+                install_request_hook(driver)
+            
             # Try multiple click methods
             try:
                 # First try JavaScript click
@@ -577,13 +777,34 @@ def download_and_process_causelist(driver, date):
                     driver.save_screenshot(os.path.join(OUTPUT_FOLDER, f"error_click_causelist_{date_filename}.png"))
                     return False
             
-            time.sleep(8)  # Wait for PDF to load/download
+            if session is None:
+                time.sleep(8)  # Wait for PDF to load/download
             
         except Exception as e:
             logging.error(f"Error with GET CAUSELIST button: {e}")
             driver.save_screenshot(os.path.join(OUTPUT_FOLDER, f"error_causelist_button_{date_filename}.png"))
             return False
         
+        # Capture the request the click issued and fetch the PDF over HTTP with it
+        if session is not None:
+            template = capture_template(driver, date)
+            if template is not None:
+                cookies_from_driver(driver, session)
+                pdf_path = os.path.join(OUTPUT_FOLDER, causelist_filename(date))
+                outcome = fetch_pdf(session, template, date, pdf_path)
+                if template.verified:
+                    strategy_cache.remember("causelist_request", template.to_dict())
+                if outcome == "ok":
+                    if len(driver.window_handles) > 1:
+                        for handle in driver.window_handles[1:]:
+                            driver.switch_to.window(handle)
+                            driver.close()
+                        driver.switch_to.window(driver.window_handles[0])
+                    logging.info(f"Downloaded {os.path.basename(pdf_path)} directly")
+                    ledger.advance(date, LIST_SR_NO, "downloaded", pdf=os.path.basename(pdf_path))
+                    return process_causelist_pdf(pdf_path, date, ledger)
+            logging.warning(f"Could not capture the GET CAUSELIST request for {date_str}, waiting for the browser download")
+        
         # Wait for PDF to download to folder
         # The PDF is downloaded directly, not opened in a new tab
         logging.info(f"Waiting for PDF to download for {date_str}")
@@ -598,22 +819,8 @@ def download_and_process_causelist(driver, date):
             f"Complete_Causelist_{date_filename}.pdf"
         ]
         
-        # Also try to construct the date in word format
-        date_obj = datetime.strptime(date_str, "%d/%m/%Y")
-        day_suffix = "th"
-        day_num = date_obj.day
-        if day_num in [1, 21, 31]:
-            day_suffix = "st"
-        elif day_num in [2, 22]:
-            day_suffix = "nd"
-        elif day_num in [3, 23]:
-            day_suffix = "rd"
-        
-        month_name = date_obj.strftime("%B")
-        year_name = date_obj.strftime("%Y")
-        formatted_date = f"{day_num}{day_suffix}_{month_name}_{year_name}"
-        
-        possible_filenames.insert(0, f"Complete_Causelist_{formatted_date}.pdf")
+        # Also try the date in word format
+        possible_filenames.insert(0, causelist_filename(date))
         
         # Wait for file to appear and download to complete
         max_wait_time = 30  # seconds
@@ -667,6 +874,7 @@ def download_and_process_causelist(driver, date):
         
         if not downloaded_file:
             logging.warning(f"No PDF downloaded for {date_str} after {max_wait_time} seconds")
+            ledger.fail(date, LIST_SR_NO, "no PDF downloaded")
             # Close any extra windows/tabs
             if len(driver.window_handles) > 1:
                 for handle in driver.window_handles[1:]:
@@ -683,31 +891,12 @@ def download_and_process_causelist(driver, date):
             driver.switch_to.window(driver.window_handles[0])
         
         # Extract and parse PDF
-        try:
-            pdf_text = extract_text_from_pdf(downloaded_file)
-            
-            if pdf_text:
-                # Use the actual filename without extension
-                pdf_filename = os.path.splitext(os.path.basename(downloaded_file))[0]
-                cases = parse_causelist_data(pdf_text, date_str, pdf_filename)
-                
-                if cases:
-                    save_to_excel(cases, EXCEL_OUTPUT)
-                    logging.info(f"Extracted {len(cases)} cases for {date_str}")
-                    return True
-                else:
-                    logging.warning(f"No cases extracted from PDF for {date_str}")
-                    return False
-            else:
-                logging.error(f"Could not extract text from PDF for {date_str}")
-                return False
-                
-        except Exception as e:
-            logging.error(f"Error processing PDF for {date_str}: {e}")
-            return False
+        ledger.advance(date, LIST_SR_NO, "downloaded", pdf=os.path.basename(downloaded_file))
+        return process_causelist_pdf(downloaded_file, date, ledger)
             
     except Exception as e:
         logging.error(f"Error processing {date_str}: {e}")
+        ledger.fail(date, LIST_SR_NO, e)
         if len(driver.window_handles) > 1:
             driver.close()
             driver.switch_to.window(driver.window_handles[0])
@@ -715,10 +904,13 @@ def download_and_process_causelist(driver, date):
 
 # === MAIN EXECUTION ===
 def main():
+    setup_logging()
     logging.info("Starting Gujarat High Court Cause List Scraper")
     logging.info(f"Date range: {START_DATE.strftime('%d/%m/%Y')} to {END_DATE.strftime('%d/%m/%Y')}")
     
     driver = setup_driver()
+    ledger = WorkLedger(LEDGER_DB, "gujarat")
+    session = make_session() if DIRECT_MODE else None
     
     try:
         # Navigate to causelist page first
@@ -726,13 +918,26 @@ def main():
             logging.error("Failed to navigate to causelist page. Exiting.")
             driver.quit()
             return
+        if session is not None:
+            cookies_from_driver(driver, session)
         
         current_date = START_DATE
         success_count = 0
         failure_count = 0
         
         while current_date <= END_DATE:
-            result = download_and_process_causelist(driver, current_date)
+            if ledger.date_done(current_date):
+                logging.info(f"Skipping {current_date.strftime('%d/%m/%Y')}: already stored")
+                current_date += timedelta(days=1)
+                continue
+            
+            result = None
+            if session is not None:
+                result = download_causelist_direct(driver, session, current_date, ledger)
+            if result is None:
+                result = download_and_process_causelist(driver, current_date, ledger, session)
+                # Small delay between browser runs
+                time.sleep(2)
             
             if result:
                 success_count += 1
@@ -741,15 +946,17 @@ def main():
             
             # Move to next day
             current_date += timedelta(days=1)
-            
-            # Small delay between requests
-            time.sleep(2)
         
         logging.info(f"Scraping completed. Success: {success_count}, Failed: {failure_count}")
+        logging.info(f"Ledger (all runs): {ledger.summary()}")
         
     except Exception as e:
         logging.error(f"Critical error in main loop: {e}")
     finally:
+        ledger.close()
+        shutdown_section_pool()
+        if session is not None:
+            session.close()
         driver.quit()
         logging.info("Browser closed. Script finished.")
 
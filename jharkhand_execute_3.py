@@ -12,6 +12,10 @@ from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
 import PyPDF2
+from browser_downloads import IsolatedDownload
+from advocate_gazetteer import AdvocateMatcher
+from case_numbers import case_recognizer
+from log_setup import setup_queue_logging
 
 # === CONFIGURATION ===
 OUTPUT_FOLDER = r"C:\Users\Dell\OneDrive\Desktop\jshc_code\jhc_causelists"
@@ -19,16 +23,26 @@ EXCEL_OUTPUT = os.path.join(OUTPUT_FOLDER, "JHC_Complete_Cases.xlsx")
 LOG_FILE = os.path.join(OUTPUT_FOLDER, "scraper_log.txt")
 CAUSELIST_URL = "https://jharkhandhighcourt.nic.in/entire-cause-list.php"
 
+# Advocate names end in one of these surnames, or are one of these designations.
+# Entries can be added freely: they are compiled into one matcher at startup.
+ADVOCATE_SURNAMES = [
+    "KUMAR", "SINGH", "PRASAD", "VERMA", "MISHRA", "SHARMA", "YADAV", "MEHTA",
+    "ROY", "ALAM", "KHAN", "PATI", "DUBEY", "TIWARI", "HASSAN", "NARAYAN",
+]
+ADVOCATE_DESIGNATIONS = [
+    "A.A.G.", "AAG", "A.G.", "G.A.", "G.P.", "GP", "S.C.", "SC", "J.C.", "JC",
+    "A.P.P.", "APP", "SPL. P.P.", "ASGI", "CGC", "ADVOCATE GENERAL",
+]
+advocate_matcher = AdvocateMatcher(ADVOCATE_SURNAMES, ADVOCATE_DESIGNATIONS)
+# Where the respondent ends: the line or column ends, or counsel / a field starts
+RESPONDENT_END = re.compile(r"\n|[ \t]{2,}|\bIA\s+NO\b|\bSUBJECT\b|\bACT\b|\b(?:MRS?|MS)\b\.?(?=\s)", re.IGNORECASE)
+case_ids = case_recognizer("jharkhand")
+
 # Setup logging
-os.makedirs(OUTPUT_FOLDER, exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+def setup_logging():
+    """Create the output folder and start queued logging (called from main, not at import)."""
+    os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+    setup_queue_logging(LOG_FILE)
 
 # === CHROME SETUP ===
 def setup_driver():
@@ -61,21 +75,6 @@ def setup_driver():
     )
     return driver
 
-def wait_for_download(download_folder, timeout=30):
-    """Wait for download to complete"""
-    seconds = 0
-    while seconds < timeout:
-        time.sleep(1)
-        downloading = False
-        for filename in os.listdir(download_folder):
-            if filename.endswith('.crdownload'):
-                downloading = True
-                break
-        if not downloading:
-            return True
-        seconds += 1
-    return False
-
 def get_daily_causelist_links(driver):
     """Get all DAILY CAUSELIST links from the ARCHIVES section"""
     try:
@@ -123,7 +122,7 @@ def get_daily_causelist_links(driver):
         return []
 
 def download_pdf_from_viewer(driver, link_info):
-    """Navigate to PDF viewer URL and download the PDF"""
+    """Navigate to PDF viewer URL and download the PDF; returns its file name or None"""
     try:
         link_text = link_info['text']
         link_href = link_info['href']
@@ -146,22 +145,26 @@ def download_pdf_from_viewer(driver, link_info):
                 if open_elements:
                     for elem in open_elements:
                         if elem.is_displayed():
-                            driver.execute_script("arguments[0].click();", elem)
-                            driver.switch_to.default_content()
-                            
-                            if wait_for_download(OUTPUT_FOLDER, timeout=20):
-                                logging.info(f"SUCCESS: Downloaded {link_text}")
-                                return True
+                            with IsolatedDownload(driver, OUTPUT_FOLDER) as download:
+                                driver.execute_script("arguments[0].click();", elem)
+                                driver.switch_to.default_content()
+                                
+                                if download.wait(timeout=20):
+                                    # a name already in the folder gets a _N suffix instead of being overwritten
+                                    saved = download.move_to(os.path.join(OUTPUT_FOLDER, download.filename), rename=True)
+                                    pdf_name = os.path.basename(saved)
+                                    logging.info(f"SUCCESS: Downloaded {link_text}")
+                                    return pdf_name
                 
                 driver.switch_to.default_content()
             except:
                 driver.switch_to.default_content()
                 continue
         
-        return False
+        return None
     except Exception as e:
         logging.error(f"Error processing '{link_info['text']}': {e}")
-        return False
+        return None
 
 # === PDF EXTRACTION FUNCTIONS ===
 def extract_text_from_pdf(pdf_path):
@@ -229,7 +232,7 @@ def parse_causelist_data(pdf_text, pdf_filename):
             if current_sno and current_case_lines:
                 case_counter += 1
                 process_case_block_fixed(
-                    case_counter, current_sno, ' '.join(current_case_lines),
+                    case_counter, current_sno, '\n'.join(current_case_lines),
                     court_no, bench_name, chief_justice,
                     cause_date, time_val, pdf_filename, cases
                 )
@@ -247,7 +250,7 @@ def parse_causelist_data(pdf_text, pdf_filename):
     if current_sno and current_case_lines:
         case_counter += 1
         process_case_block_fixed(
-            case_counter, current_sno, ' '.join(current_case_lines),
+            case_counter, current_sno, '\n'.join(current_case_lines),
             court_no, bench_name, chief_justice,
             cause_date, time_val, pdf_filename, cases
         )
@@ -258,52 +261,45 @@ def parse_causelist_data(pdf_text, pdf_filename):
 
 def process_case_block_fixed(id_no, sno, case_text, court_number, bench_name,
                              chief_justice, cause_date, time_val, pdf_filename, cases):
-    """Extract details from one case entry cleanly"""
+    """Extract details from one case entry cleanly (case_text keeps the entry's line breaks)"""
     raw = ' '.join(case_text.split())
 
-    # Extract case type, number, year
-    case_type = case_number = case_year = "N/A"
-    m = re.search(r'([A-Za-z\.\(\)/]+)\s*/\s*(\d+)\s*/\s*(\d{4})', raw)
+    # Extract case type, number, year and IA NO in one scan
+    case_type, case_number, case_year, ia_no = case_ids.identify(raw)
+
+    # Extract SUBJECT and ACT (each runs to the end of its line)
+    subject = "N/A"
+    m = re.search(r'SUBJECT\s*[:-]?\s*([A-Z][A-Z ,.]*?)\s*(?=\bACT\b|\n|$)', case_text, re.IGNORECASE)
     if m:
-        case_type, case_number, case_year = m.group(1).strip(), m.group(2).strip(), m.group(3).strip()
+        subject = m.group(1).strip()
 
-    # Extract Petitioner vs Respondent
+    act = "N/A"
+    m = re.search(r'ACT\s*[:-]?\s*([A-Za-z0-9 ,.()/-]+)', case_text, re.IGNORECASE)
+    if m:
+        act = m.group(1).strip()
+
+    # Extract Petitioner vs Respondent from the text after the case number
     petitioner = respondent = "N/A"
-    m = re.search(r'(.+?)\s+(?:VS|V/S|Vs|vs)\s+(.+)', raw, re.IGNORECASE)
+    adv_text = ""
+    case_match = case_ids.search(case_text, with_ia=False)
+    party_text = case_text[case_match.end:] if case_match else case_text
+    m = re.search(r'(.+?)\s+(?:VS|V/S|Vs|vs)\s+(.+)', party_text, re.IGNORECASE | re.DOTALL)
     if m:
-        petitioner = m.group(1).strip()
-        respondent = re.split(r'\s{2,}|IA\s+NO|SUBJECT|ACT', m.group(2), 1, re.IGNORECASE)[0].strip()
+        petitioner = ' '.join(m.group(1).split())
+        respondent_part = RESPONDENT_END.split(m.group(2), 1)[0]
+        respondent = ' '.join(respondent_part.split())
+        adv_text = ' '.join(m.group(2)[len(respondent_part):].split())  # the rest of the case after the respondent
 
-    # Extract Advocates
+    # Extract Advocates (one pass of the surname/designation matcher); words of the
+    # respondent, subject and act are never read as an advocate's given names
     petitioner_adv = respondent_adv = "N/A"
-    adv_text = raw[m.end():] if m else ""
-    adv_names = re.findall(
-        r'\b([A-Z][A-Z\s\.]+(?:KUMAR|SINGH|PRASAD|VERMA|MISHRA|SHARMA|YADAV|MEHTA|ROY|ALAM|KHAN|PATI|DUBEY|TIWARI|HASSAN|NARAYAN))\b',
-        adv_text, re.IGNORECASE)
-    adv_names = [a.strip() for a in adv_names]
+    field_words = f"{respondent} {subject} {act}".split()
+    adv_names = advocate_matcher.find(adv_text, exclude=field_words)
     if adv_names:
         petitioner_adv = adv_names[0]
         if len(adv_names) > 1:
             respondent_adv = adv_names[1]
 
-    # Extract IA NO
-    ia_no = "N/A"
-    m = re.search(r'IA\s+NO\.?\s*([0-9/]+)', raw, re.IGNORECASE)
-    if m:
-        ia_no = m.group(1).strip()
-
-    # Extract SUBJECT
-    subject = "N/A"
-    m = re.search(r'SUBJECT\s*[:-]?\s*([A-Z][A-Z\s,\.]+)', raw, re.IGNORECASE)
-    if m:
-        subject = m.group(1).strip()
-
-    # Extract ACT
-    act = "N/A"
-    m = re.search(r'ACT\s*[:-]?\s*([A-Za-z0-9\s,\.()/-]+)', raw, re.IGNORECASE)
-    if m:
-        act = m.group(1).strip()
-
     # Append clean structured data
     case_data = {
         'id': id_no,
@@ -329,7 +325,7 @@ def process_case_block_fixed(id_no, sno, case_text, court_number, bench_name,
     }
 
     cases.append(case_data)
-    logging.info(f"[Court {court_number} | {time_val}] Case {sno} → {case_type}/{case_number}/{case_year}")
+    logging.debug("[Court %s | %s] Case %s → %s/%s/%s", court_number, time_val, sno, case_type, case_number, case_year)
 # ==========================
 # UPDATED FUNCTIONS END
 # ==========================
@@ -366,6 +362,7 @@ def save_to_excel(cases_data, excel_path):
 
 # === MAIN EXECUTION ===
 def main():
+    setup_logging()
     logging.info("=== JHARKHAND HIGH COURT CAUSELIST SCRAPER ===")
     
     driver = setup_driver()
@@ -387,31 +384,24 @@ def main():
             logging.info(f"Processing {idx}/{len(daily_links)}: {link_info['text']}")
             logging.info(f"{'='*60}")
             
-            if download_pdf_from_viewer(driver, link_info):
+            latest_pdf = download_pdf_from_viewer(driver, link_info)
+            if latest_pdf:
                 success_count += 1
-                time.sleep(2)
+                pdf_path = os.path.join(OUTPUT_FOLDER, latest_pdf)
                 
-                pdf_files = [f for f in os.listdir(OUTPUT_FOLDER) if f.endswith('.pdf')]
-                if pdf_files:
-                    pdf_files.sort(key=lambda x: os.path.getmtime(os.path.join(OUTPUT_FOLDER, x)), reverse=True)
-                    latest_pdf = pdf_files[0]
-                    pdf_path = os.path.join(OUTPUT_FOLDER, latest_pdf)
-                    
-                    logging.info(f"Extracting data from: {latest_pdf}")
-                    pdf_text = extract_text_from_pdf(pdf_path)
-                    if pdf_text:
-                        cases = parse_causelist_data(pdf_text, latest_pdf)
-                        if cases:
-                            logging.info(f"Extracted {len(cases)} cases from {latest_pdf}")
-                            save_to_excel(cases, EXCEL_OUTPUT)
-                            total_cases_extracted += len(cases)
-                            logging.info(f"✓ Total cases in Excel so far: {total_cases_extracted}")
-                        else:
-                            logging.warning(f"No cases extracted from {latest_pdf}")
+                logging.info(f"Extracting data from: {latest_pdf}")
+                pdf_text = extract_text_from_pdf(pdf_path)
+                if pdf_text:
+                    cases = parse_causelist_data(pdf_text, latest_pdf)
+                    if cases:
+                        logging.info(f"Extracted {len(cases)} cases from {latest_pdf}")
+                        save_to_excel(cases, EXCEL_OUTPUT)
+                        total_cases_extracted += len(cases)
+                        logging.info(f"✓ Total cases in Excel so far: {total_cases_extracted}")
                     else:
-                        logging.error(f"Could not extract text from {latest_pdf}")
+                        logging.warning(f"No cases extracted from {latest_pdf}")
                 else:
-                    logging.warning("No PDF file found after download")
+                    logging.error(f"Could not extract text from {latest_pdf}")
             else:
                 logging.error(f"Failed to download: {link_info['text']}")
             
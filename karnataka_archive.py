@@ -0,0 +1,223 @@
+import os
+import re
+import gzip
+import json
+from datetime import datetime
+from functools import partial
+from html.parser import HTMLParser
+from concurrent.futures import ProcessPoolExecutor
+
+# ------------------------------
+# Raw result-page archive for the Karnataka scrapers.
+# Every results page is stored gzip-compressed under
+# <folder>/<bench>/<from>_<to>_<mode>/court_NN.html.gz, with a one-line JSON
+# header (bench, court, dates, mode) ahead of the HTML. The same HTML is what
+# the live run parses, so the archive can be parsed again offline with a
+# fixed parser, in worker processes and without a browser.
+# ------------------------------
+SKIP_TAGS = {"script", "style", "head", "noscript", "template"}
+BLOCK_TAGS = {"p", "div", "li", "ul", "ol", "form", "center", "hr", "section", "thead", "tbody",
+              "tfoot", "caption", "h1", "h2", "h3", "h4", "h5", "h6", "header", "footer", "pre"}
+BREAK = "\x00"   # structural line break; source newlines inside text are plain whitespace
+
+def _clean(parts):
+    """Rendered-style text: one line per block, whitespace collapsed, blank lines dropped."""
+    lines = "".join(parts).replace("\xa0", " ").split(BREAK)
+    return "\n".join(line for line in (re.sub(r"\s+", " ", l).strip() for l in lines) if line)
+
+class TableRow:
+    def __init__(self, depth):
+        self.depth = depth
+        self.th = []
+        self.td = []
+
+class PageTable:
+    def __init__(self):
+        self.parts = []
+        self.rows = []
+        self.text = ""
+
+class HtmlPage:
+    """Text and tables of a results page, shaped like what the scrapers read from the DOM."""
+
+    def __init__(self, text, tables):
+        self.text = text
+        self.tables = tables
+
+    def line_containing(self, *words):
+        for line in self.text.split("\n"):
+            if all(w in line for w in words):
+                return line.strip()
+        return ""
+
+class _PageBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.skip = 0
+        self.body = []
+        self.tables = []
+        self.open_tables = []
+        self.open_rows = []
+        self.open_cells = []   # (depth, tag, parts)
+
+    def _push(self, text):
+        self.body.append(text)
+        for table in self.open_tables:
+            table.parts.append(text)
+        for _, _, parts in self.open_cells:
+            parts.append(text)
+
+    def _close_cells(self, depth):
+        while self.open_cells and self.open_cells[-1][0] >= depth:
+            cell_depth, tag, parts = self.open_cells.pop()
+            if self.open_rows and self.open_rows[-1].depth == cell_depth:
+                getattr(self.open_rows[-1], tag).append(_clean(parts))
+            self._push(" ")
+
+    def _close_rows(self, depth):
+        self._close_cells(depth)
+        while self.open_rows and self.open_rows[-1].depth >= depth:
+            self.open_rows.pop()
+            self._push(BREAK)
+
+    def _open_row(self, depth):
+        self._close_rows(depth)
+        row = TableRow(depth)
+        self.open_rows.append(row)
+        for table in self.open_tables:
+            table.rows.append(row)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self.skip += 1
+            return
+        if self.skip:
+            return
+        depth = len(self.open_tables)
+        if tag == "br" or tag in BLOCK_TAGS:
+            self._push(BREAK)
+        elif tag == "table":
+            self._push(BREAK)
+            table = PageTable()
+            self.tables.append(table)
+            self.open_tables.append(table)
+        elif tag == "tr" and depth:
+            self._open_row(depth)
+        elif tag in ("td", "th") and depth:
+            self._close_cells(depth)
+            if not self.open_rows or self.open_rows[-1].depth != depth:
+                self._open_row(depth)
+            self.open_cells.append((depth, tag, []))
+
+    def handle_startendtag(self, tag, attrs):
+        if tag == "br" and not self.skip:
+            self._push(BREAK)
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self.skip = max(0, self.skip - 1)
+            return
+        if self.skip:
+            return
+        depth = len(self.open_tables)
+        if tag in ("td", "th") and depth:
+            self._close_cells(depth)
+        elif tag == "tr" and depth:
+            self._close_rows(depth)
+        elif tag == "table" and depth:
+            self._close_rows(depth)
+            table = self.open_tables.pop()
+            table.text = _clean(table.parts)
+            table.parts = []
+            self._push(BREAK)
+        elif tag in BLOCK_TAGS:
+            self._push(BREAK)
+
+    def handle_data(self, data):
+        if not self.skip:
+            self._push(data)
+
+    def page(self):
+        self._close_rows(1)
+        while self.open_tables:
+            table = self.open_tables.pop()
+            table.text = _clean(table.parts)
+            table.parts = []
+        return HtmlPage(_clean(self.body), self.tables)
+
+def parse_html_page(html):
+    """Build an HtmlPage from page source (live driver.page_source or an archived copy)."""
+    builder = _PageBuilder()
+    builder.feed(html or "")
+    builder.close()
+    return builder.page()
+
+# ------------------------------
+# Archive on disk
+# ------------------------------
+def _iso(date_str):
+    day, month, year = date_str.split("/")
+    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+
+class ResponseArchive:
+    """Compressed result pages keyed by bench, court, date range and mode."""
+
+    def __init__(self, folder):
+        self.folder = folder
+
+    def path_for(self, bench_code, court_no, from_str, to_str, mode):
+        return os.path.join(self.folder, str(bench_code), f"{_iso(from_str)}_{_iso(to_str)}_{mode}",
+                            f"court_{int(court_no):02d}.html.gz")
+
+    def save(self, bench_code, court_no, from_str, to_str, mode, html):
+        """Store (or replace) the page for this key; returns its path."""
+        path = self.path_for(bench_code, court_no, from_str, to_str, mode)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        meta = {"bench": bench_code, "court": int(court_no), "from": from_str, "to": to_str,
+                "mode": mode, "saved_at": datetime.now().isoformat(timespec="seconds")}
+        tmp_path = path + ".tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+            f.write(json.dumps(meta) + "\n")
+            f.write(html or "")
+        os.replace(tmp_path, path)
+        return path
+
+    @staticmethod
+    def load(path):
+        """Return (meta, html) for an archived page."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            meta = json.loads(f.readline())
+            return meta, f.read()
+
+    def paths(self, bench_codes=None):
+        """Archived page paths, optionally only for the given benches."""
+        roots = [os.path.join(self.folder, str(b)) for b in bench_codes] if bench_codes else [self.folder]
+        found = []
+        for top in roots:
+            for root, _, files in os.walk(top):
+                found.extend(os.path.join(root, name) for name in files if name.endswith(".html.gz"))
+        return sorted(found)
+
+# ------------------------------
+# Offline reparse
+# ------------------------------
+def _reparse_file(parse, path):
+    try:
+        meta, html = ResponseArchive.load(path)
+        return meta, parse(meta, html), None
+    except Exception as e:
+        return {"path": path}, [], repr(e)
+
+def reparse_archive(archive, parse, bench_codes=None, workers=None, chunksize=8):
+    """Run parse(meta, html) over every archived page; yields (meta, records, error).
+
+    parse must be a module-level function so worker processes can import it.
+    workers=1 parses in this process.
+    """
+    paths = archive.paths(bench_codes)
+    if workers == 1:
+        for path in paths:
+            yield _reparse_file(parse, path)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(partial(_reparse_file, parse), paths, chunksize=chunksize)
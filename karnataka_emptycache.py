@@ -0,0 +1,77 @@
+import os
+import time
+import sqlite3
+from datetime import datetime, date, timedelta
+
+# ------------------------------
+# Negative cache of empty court halls for the Karnataka scrapers.
+# A court query that came back "no record" marks every date of its range
+# as empty for that (bench, court). Entries expire: dates that are recent or
+# still ahead can be published later, so they only stick for a few hours;
+# dates months in the past are settled and stick for a long time. The file
+# is SQLite so overlapping runs of the different scripts can share it.
+# ------------------------------
+RECENT_DAYS = 7                   # dates this close to today (or in the future)...
+RECENT_TTL = timedelta(hours=6)   # ...are only trusted for a few hours
+SETTLED_DAYS = 60                 # dates older than this are settled
+SETTLED_TTL = timedelta(days=90)
+DEFAULT_TTL = timedelta(days=3)   # everything in between
+
+def _day(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%d/%m/%Y").date()
+
+def _days(start, end):
+    start, end = _day(start), _day(end)
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+class EmptyCache:
+    """(bench, court, date) entries known to return no records, each with its own expiry."""
+
+    def __init__(self, path):
+        self.path = path
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS empty (bench TEXT NOT NULL, court INTEGER NOT NULL, "
+                          "day TEXT NOT NULL, expires_at REAL NOT NULL, PRIMARY KEY (bench, court, day))")
+
+    @staticmethod
+    def ttl_for(day, today=None):
+        age = ((today or date.today()) - day).days
+        if age <= RECENT_DAYS:
+            return RECENT_TTL
+        if age > SETTLED_DAYS:
+            return SETTLED_TTL
+        return DEFAULT_TTL
+
+    def is_empty(self, bench_code, court_no, start, end):
+        """True when every date from start to end is cached as empty and not expired."""
+        days = _days(start, end)
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM empty WHERE bench = ? AND court = ? AND day BETWEEN ? AND ? AND expires_at > ?",
+            (str(bench_code), int(court_no), days[0].isoformat(), days[-1].isoformat(), time.time())).fetchone()
+        return row[0] == len(days)
+
+    def mark_empty(self, bench_code, court_no, start, end):
+        now = time.time()
+        today = date.today()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO empty (bench, court, day, expires_at) VALUES (?, ?, ?, ?)",
+                [(str(bench_code), int(court_no), d.isoformat(), now + self.ttl_for(d, today).total_seconds())
+                 for d in _days(start, end)])
+
+    def purge_expired(self):
+        with self.conn:
+            return self.conn.execute("DELETE FROM empty WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def close(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass
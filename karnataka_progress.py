@@ -0,0 +1,88 @@
+import os
+import json
+import tempfile
+
+# ------------------------------
+# Resume checkpoints for the Karnataka scrapers.
+# The progress file keeps the next sprint start ("current_date", as before)
+# plus, for the sprint in flight, every finished court per bench and every
+# finished bench, so a restart skips exactly the units already done.
+# ------------------------------
+def atomic_write_json(path, obj):
+    """Write obj as JSON so readers only ever see the old or the new file."""
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=".json", dir=folder)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def load_json(path, default=None):
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            pass
+    return {} if default is None else default
+
+class SprintCheckpoint:
+    """Progress at (sprint, bench, court) granularity, saved after every unit."""
+
+    def __init__(self, path, on_error=None):
+        self.path = path
+        self.on_error = on_error or print
+        self.state = load_json(path)
+
+    def _save(self):
+        try:
+            atomic_write_json(self.path, self.state)
+        except Exception as e:
+            self.on_error(f"⚠️ Failed to save progress: {repr(e)}")
+
+    def _bench(self, bench_code):
+        return self.state.setdefault("benches", {}).setdefault(bench_code, {"courts": {}, "complete": False})
+
+    def resume_date(self):
+        return self.state.get("current_date")
+
+    def sprint_end(self, sprint_start):
+        """The end date recorded for sprint_start, if that sprint is in flight."""
+        if self.state.get("sprint_start") == sprint_start:
+            return self.state.get("sprint_end")
+        return None
+
+    def start_sprint(self, sprint_start, sprint_end):
+        if self.state.get("sprint_start") == sprint_start and self.state.get("sprint_end") == sprint_end:
+            return
+        self.state["sprint_start"] = sprint_start
+        self.state["sprint_end"] = sprint_end
+        self.state["benches"] = {}
+        self._save()
+
+    def bench_done(self, bench_code):
+        return self.state.get("benches", {}).get(bench_code, {}).get("complete", False)
+
+    def court_result(self, bench_code, court_no):
+        """Number of records saved for a finished court, or None if not finished."""
+        return self.state.get("benches", {}).get(bench_code, {}).get("courts", {}).get(str(court_no))
+
+    def mark_court(self, bench_code, court_no, record_count):
+        self._bench(bench_code)["courts"][str(court_no)] = record_count
+        self._save()
+
+    def mark_bench(self, bench_code):
+        self._bench(bench_code)["complete"] = True
+        self._save()
+
+    def finish_sprint(self, next_start):
+        self.state = {"current_date": next_start}
+        self._save()
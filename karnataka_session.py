@@ -0,0 +1,121 @@
+import re
+
+from karnataka_waits import mark_results_stale, wait_for_network_idle
+
+# ------------------------------
+# Form-state reuse for the Karnataka search page.
+# Once bench, search-by, mode and dates have been set through the full
+# reload path, later courts of the same bench and sprint only change the
+# court select and resubmit. The form is checked in a single script call;
+# anything unexpected is reported as "stale" and the caller reloads.
+# ------------------------------
+SELECT_COURT_JS = """
+    var benchCode = arguments[0], mode = arguments[1], courtNo = String(arguments[2]);
+    var fromParts = arguments[3], toParts = arguments[4];
+    function text(o) { return (o.text || '').trim(); }
+    function hasValue(sel, v) {
+        for (var i = 0; i < sel.options.length; i++) {
+            if ((sel.options[i].value || '').trim() === v) { return true; }
+        }
+        return false;
+    }
+    function holds(value, parts) {
+        return !!value && value.indexOf(parts[0]) !== -1 && value.indexOf(parts[1]) !== -1;
+    }
+    var bench = null, all = document.getElementsByTagName('select');
+    for (var i = 0; i < all.length; i++) {
+        if (hasValue(all[i], benchCode)) { bench = all[i]; break; }
+    }
+    if (!bench || !bench.form) { return {status: 'stale', reason: 'bench select missing'}; }
+    if ((bench.value || '').trim() !== benchCode) { return {status: 'stale', reason: 'bench changed'}; }
+    var form = bench.form, searchBy = null, court = null;
+    var selects = form.getElementsByTagName('select');
+    for (var i = 0; i < selects.length; i++) {
+        var texts = [], halls = 0;
+        for (var j = 0; j < selects[i].options.length; j++) {
+            var t = text(selects[i].options[j]);
+            texts.push(t);
+            var up = t.toUpperCase();
+            if (up.indexOf('COURT HALL -') !== -1 || up.indexOf('COURT HALL-') !== -1) { halls++; }
+        }
+        if (texts.indexOf('Court Hall') !== -1 && texts.indexOf('Judge') !== -1) { searchBy = selects[i]; }
+        else if (halls >= 2 && !court) { court = selects[i]; }
+    }
+    if (!court) { return {status: 'stale', reason: 'court select missing'}; }
+    if (searchBy && searchBy.selectedIndex >= 0 && text(searchBy.options[searchBy.selectedIndex]).indexOf('Court Hall') === -1) {
+        return {status: 'stale', reason: 'search by changed'};
+    }
+    var radios = form.querySelectorAll("input[type='radio']");
+    for (var i = 0; i < radios.length; i++) {
+        if ((radios[i].value || '').trim().toUpperCase() === mode && !radios[i].checked) {
+            return {status: 'stale', reason: 'mode changed'};
+        }
+    }
+    var inputs = form.querySelectorAll("input[type='text'], input[type='date']"), dates = [];
+    for (var i = 0; i < inputs.length; i++) {
+        if (inputs[i].getClientRects().length > 0) { dates.push((inputs[i].value || '').trim()); }
+    }
+    if (dates.length < 2 || !holds(dates[0], fromParts) || !holds(dates[1], toParts)) {
+        return {status: 'stale', reason: 'dates changed'};
+    }
+    for (var i = 0; i < court.options.length; i++) {
+        // whole trimmed text or value, so court 1 never picks "COURT HALL - 10"
+        var o = court.options[i], hall = /^(?:COURT\\s+)?HALL\\s*-?\\s*0*(\\d+)$/i.exec(text(o));
+        if ((hall && hall[1] === courtNo) || (o.value || '').trim() === courtNo) {
+            court.selectedIndex = i;
+            ['input', 'change', 'blur'].forEach(function(ev) {
+                try { court.dispatchEvent(new Event(ev, {bubbles: true})); } catch (e) {}
+            });
+            return {status: 'selected', text: text(o), form: form};
+        }
+    }
+    return {status: 'no_court'};
+"""
+
+CLICK_GET_JS = """
+    var form = arguments[0];
+    var candidates = form.querySelectorAll("input[type='button'], button, input[type='submit']");
+    for (var i = 0; i < candidates.length; i++) {
+        var t = (candidates[i].value || candidates[i].textContent || '').trim().toLowerCase();
+        if (t && (t.indexOf('get') !== -1 || t.indexOf('details') !== -1 || t.indexOf('search') !== -1)) {
+            candidates[i].click();
+            return true;
+        }
+    }
+    return false;
+"""
+
+COURT_OPTION = re.compile(r"(?:COURT\s+)?HALL\s*-?\s*0*(\d+)", re.IGNORECASE)  # "COURT HALL - 1", "Hall-01"
+
+def is_court_option(text, value, court_no):
+    """True when a court select option (trimmed text or value) is exactly court_no."""
+    hall = COURT_OPTION.fullmatch((text or "").strip())
+    return (hall is not None and hall.group(1) == str(court_no)) or (value or "").strip() == str(court_no)
+
+def _day_month(date_str):
+    parts = date_str.split("/")
+    return [parts[0].zfill(2), parts[1].zfill(2)]
+
+def resubmit_court(driver, bench_code, mode_value, from_str, to_str, court_no):
+    """Change only the court select on an already prepared form and press GET.
+
+    Returns (status, detail): ("submitted", option text), ("no_court", "")
+    when the court is not listed, or ("stale", reason) when the form has to
+    be reloaded.
+    """
+    try:
+        result = driver.execute_script(SELECT_COURT_JS, bench_code, mode_value, court_no,
+                                       _day_month(from_str), _day_month(to_str))
+    except Exception as e:
+        return "stale", repr(e)
+    status = (result or {}).get("status", "stale")
+    if status != "selected":
+        return status, (result or {}).get("reason", "")
+    wait_for_network_idle(driver, timeout=5, label="court")
+    mark_results_stale(driver)
+    try:
+        if not driver.execute_script(CLICK_GET_JS, result["form"]):
+            return "stale", "GET button missing"
+    except Exception as e:
+        return "stale", repr(e)
+    return "submitted", result.get("text", "")
@@ -0,0 +1,146 @@
+import os
+import queue
+import sqlite3
+import threading
+from datetime import datetime
+from karnataka_progress import atomic_write_json, load_json
+from karnataka_store import RecordStore, store_rewrites
+
+# ------------------------------
+# Incremental snapshot backups of the record store.
+# Record IDs only grow, so a snapshot point is just "every row up to ID n".
+# Each snapshot writes only the rows added since the previous one (a delta
+# file); every few deltas they are folded into one full base file. The
+# manifest keeps every point, so any of them can still be restored from the
+# base plus the deltas. An upsert (--reparse) changes rows in place, which a
+# delta cannot carry, so the first snapshot after one is a full base; points
+# older than the current base then restore with the base's field values.
+# Snapshots are taken by a background thread with its own connection and
+# never block the scraper.
+# ------------------------------
+COMPACT_EVERY = 6   # deltas kept before they are folded into a new base
+
+class SnapshotBackups:
+    """Background delta snapshots of a RecordStore database, restorable to any point."""
+
+    def __init__(self, db_path, folder, compact_every=COMPACT_EVERY, log=print):
+        self.db_path = db_path
+        self.folder = folder
+        self.compact_every = compact_every
+        self.log = log
+        self.manifest_path = os.path.join(folder, "manifest.json")
+        self._manifest = None   # read on first use, not at construction
+        self.requested = set()
+        self.queue = queue.Queue()
+        self.thread = None
+
+    @property
+    def manifest(self):
+        if self._manifest is None:
+            self._manifest = load_json(self.manifest_path, {"points": [], "files": []})
+            self.requested.update(p["tag"] for p in self._manifest["points"])
+        return self._manifest
+
+    def request(self, tag):
+        """Queue a snapshot for tag unless one was already taken; never blocks."""
+        self.manifest   # loads the tags already taken into self.requested
+        if tag in self.requested:
+            return False
+        self.requested.add(tag)
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="snapshot-backups", daemon=True)
+            self.thread.start()
+        self.queue.put(tag)
+        return True
+
+    def close(self):
+        """Finish queued snapshots and stop the thread."""
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def _run(self):
+        while True:
+            tag = self.queue.get()
+            if tag is None:
+                return
+            try:
+                self._snapshot(tag)
+            except Exception as e:
+                self.log(f"⚠️ Snapshot {tag} failed: {repr(e)}")
+
+    def _copy_range(self, conn, name, lo, hi):
+        path = os.path.join(self.folder, name)
+        tmp_path = path + ".tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        conn.execute("ATTACH DATABASE ? AS seg", (tmp_path,))
+        try:
+            conn.execute("CREATE TABLE seg.records AS SELECT * FROM main.records WHERE ID > ? AND ID <= ?", (lo, hi))
+            conn.commit()
+        finally:
+            conn.execute("DETACH DATABASE seg")
+        os.replace(tmp_path, path)
+
+    def _snapshot(self, tag):
+        os.makedirs(self.folder, exist_ok=True)
+        points, files = self.manifest["points"], self.manifest["files"]
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            max_id = conn.execute("SELECT COALESCE(MAX(ID), 0) FROM records").fetchone()[0]
+            rewrites = store_rewrites(conn)
+            last_id = points[-1]["max_id"] if points else 0
+            rewritten = rewrites != (points[-1].get("rewrites", 0) if points else 0)
+            deltas = [f for f in files if f["kind"] == "delta"]
+            obsolete = []
+            if not files or len(deltas) >= self.compact_every or rewritten:
+                name = f"base_{tag}.sqlite"
+                self._copy_range(conn, name, 0, max_id)
+                obsolete = [f["file"] for f in files]
+                files[:] = [{"file": name, "kind": "full", "from_id": 0, "to_id": max_id}]
+                kind = "full"
+            elif max_id > last_id:
+                name = f"delta_{tag}.sqlite"
+                self._copy_range(conn, name, last_id, max_id)
+                files.append({"file": name, "kind": "delta", "from_id": last_id, "to_id": max_id})
+                kind = "delta"
+            else:
+                kind = "unchanged"
+        finally:
+            conn.close()
+        points.append({"tag": tag, "max_id": max_id, "rewrites": rewrites,
+                       "created_at": datetime.now().isoformat(timespec="seconds")})
+        atomic_write_json(self.manifest_path, self.manifest)
+        for name in obsolete:
+            try:
+                os.remove(os.path.join(self.folder, name))
+            except OSError:
+                pass
+        self.log(f"🗂️ Snapshot {tag} ({kind}) taken up to record {max_id}")
+
+    def restore(self, tag, dest_path, batch_size=5000):
+        """Rebuild the store as it was at snapshot tag into dest_path; returns rows restored."""
+        point = next((p for p in self.manifest["points"] if str(p["tag"]) == str(tag)), None)
+        if point is None:
+            raise KeyError(f"No snapshot {tag}")
+        store = RecordStore(dest_path)
+        total = 0
+        try:
+            for entry in self.manifest["files"]:
+                if entry["from_id"] >= point["max_id"]:
+                    continue
+                src = sqlite3.connect(os.path.join(self.folder, entry["file"]))
+                try:
+                    cursor = src.execute("SELECT * FROM records WHERE ID <= ? ORDER BY ID", (point["max_id"],))
+                    names = [d[0] for d in cursor.description]
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        total += store.add([dict(zip(names, row)) for row in rows])
+                finally:
+                    src.close()
+        finally:
+            store.close()
+        return total
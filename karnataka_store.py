@@ -0,0 +1,187 @@
+import os
+import sqlite3
+
+# ------------------------------
+# Keyed record store for the Karnataka scrapers.
+# Rows go into SQLite with a unique index on the case key, so every save
+# is INSERT OR IGNORE of the new rows only and the index does the dedupe.
+# The Excel workbook is exported from here instead of being rewritten on
+# every court. An upsert that overwrites stored rows bumps a "rewrites"
+# counter in store_state, so incremental backups know IDs alone no longer
+# describe what changed.
+# ------------------------------
+KEY_COLUMNS = ["Bench", "Cause_Date", "Court_Hall", "Case_Type", "Case_No", "Year"]
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+def _as_text(value):
+    """Normalise a cell to the text the scraper produces ("2024", not 2024.0 or nan)."""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        if value != value:
+            return ""
+        if value.is_integer():
+            return str(int(value))
+    return str(value).strip()
+
+def store_rewrites(conn):
+    """How many upserts have overwritten stored rows (0 for a store that never had one)."""
+    try:
+        row = conn.execute("SELECT value FROM store_state WHERE name = 'rewrites'").fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] if row else 0
+
+class RecordStore:
+    """SQLite table of case records, unique on KEY_COLUMNS."""
+
+    def __init__(self, path, key_columns=KEY_COLUMNS):
+        self.path = path
+        self.key_columns = list(key_columns)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.columns = self._existing_columns()
+
+    def _existing_columns(self):
+        rows = self.conn.execute("PRAGMA table_info(records)").fetchall()
+        return [r[1] for r in rows if r[1] != "ID"]
+
+    def _ensure_columns(self, names):
+        if not self.columns:
+            ordered = list(names)
+            for key in self.key_columns:
+                if key not in ordered:
+                    ordered.append(key)
+            cols = ", ".join(f"{_quote(c)} TEXT NOT NULL DEFAULT ''" for c in ordered)
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS records (ID INTEGER PRIMARY KEY, {cols})")
+            keys = ", ".join(_quote(k) for k in self.key_columns)
+            self.conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS records_key ON records ({keys})")
+            self.columns = ordered
+            return
+        for name in names:
+            if name not in self.columns and name != "ID":
+                self.conn.execute(f"ALTER TABLE records ADD COLUMN {_quote(name)} TEXT NOT NULL DEFAULT ''")
+                self.columns.append(name)
+
+    def add(self, records):
+        """Insert records, ignoring ones whose key is already stored; returns rows inserted."""
+        if not records:
+            return 0
+        names = []
+        for rec in records:
+            for name in rec:
+                if name not in names and name != "ID":
+                    names.append(name)
+        self._ensure_columns(names)
+        cols = ", ".join(_quote(c) for c in names)
+        marks = ", ".join("?" for _ in names)
+        before = self.conn.total_changes
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR IGNORE INTO records ({cols}) VALUES ({marks})",
+                ([_as_text(rec.get(c)) for c in names] for rec in records))
+        return self.conn.total_changes - before
+
+    def upsert(self, records):
+        """Insert records, overwriting the stored fields of ones whose key already exists."""
+        if not records:
+            return 0
+        names = []
+        for rec in records:
+            for name in rec:
+                if name not in names and name != "ID":
+                    names.append(name)
+        self._ensure_columns(names)
+        cols = ", ".join(_quote(c) for c in names)
+        marks = ", ".join("?" for _ in names)
+        keys = ", ".join(_quote(k) for k in self.key_columns)
+        fields = [_quote(c) for c in names if c not in self.key_columns]
+        updates = ", ".join(f"{c} = excluded.{c}" for c in fields)
+        # rows whose fields are unchanged are left alone, so they add no change
+        differs = " OR ".join(f"records.{c} IS NOT excluded.{c}" for c in fields)
+        action = f"DO UPDATE SET {updates} WHERE {differs}" if fields else "DO NOTHING"
+        max_id = "SELECT COALESCE(MAX(ID), 0) FROM records"
+        before = self.conn.total_changes
+        with self.conn:
+            first_new = self.conn.execute(max_id).fetchone()[0]
+            self.conn.executemany(
+                f"INSERT INTO records ({cols}) VALUES ({marks}) ON CONFLICT ({keys}) {action}",
+                ([_as_text(rec.get(c)) for c in names] for rec in records))
+            changed = self.conn.total_changes - before
+            # new rows get new IDs; any other change rewrote a stored row's fields
+            if changed > self.conn.execute(max_id).fetchone()[0] - first_new:
+                self.conn.execute("CREATE TABLE IF NOT EXISTS store_state (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+                self.conn.execute("INSERT INTO store_state VALUES ('rewrites', 1) "
+                                  "ON CONFLICT (name) DO UPDATE SET value = value + 1")
+        return changed
+
+    def count(self):
+        if not self.columns:
+            return 0
+        return self.conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def import_excel(self, excel_path, batch_size=5000):
+        """Seed the store from a workbook written by the old autosave; returns rows inserted."""
+        from openpyxl import load_workbook
+        wb = load_workbook(excel_path, read_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            header = [str(h) if h is not None else "" for h in next(rows, ())]
+            total, batch = 0, []
+            for row in rows:
+                batch.append({h: v for h, v in zip(header, row) if h and h != "ID"})
+                if len(batch) >= batch_size:
+                    total += self.add(batch)
+                    batch = []
+            return total + self.add(batch)
+        finally:
+            wb.close()
+
+    def export_excel(self, excel_path, sheet_name="Sheet1"):
+        """Stream every stored record into excel_path with a fresh 1..n ID column.
+
+        Rows go straight from the SQLite cursor into a write-only workbook, so
+        memory stays flat however large the year gets. Returns the row count.
+        """
+        from openpyxl import Workbook
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name)
+        ws.append(["ID"] + self.columns)
+        total = 0
+        if self.columns:
+            cols = ", ".join(_quote(c) for c in self.columns)
+            for total, row in enumerate(self.conn.execute(f"SELECT {cols} FROM records ORDER BY ID"), start=1):
+                ws.append([total] + list(row))
+        tmp_path = excel_path + ".tmp.xlsx"
+        wb.save(tmp_path)
+        os.replace(tmp_path, excel_path)
+        return total
+
+    def backup(self, dest_path):
+        """Consistent copy of the whole store (safe while the scraper keeps writing)."""
+        dest = sqlite3.connect(dest_path)
+        try:
+            self.conn.backup(dest)
+        finally:
+            dest.close()
+
+    def close(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+def open_record_store(db_path, excel_path=None, log=print):
+    """Open the store, seeding it once from an existing workbook."""
+    fresh = not os.path.exists(db_path)
+    store = RecordStore(db_path)
+    if fresh and excel_path and os.path.exists(excel_path):
+        try:
+            seeded = store.import_excel(excel_path)
+            log(f"📥 Seeded record store with {seeded} row(s) from {excel_path}")
+        except Exception as e:
+            log(f"⚠️ Could not seed record store from {excel_path}: {repr(e)}")
+    return store
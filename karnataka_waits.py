@@ -0,0 +1,162 @@
+import time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+
+# ------------------------------
+# Condition-based waits for the Karnataka cause list search page.
+# Every wait polls a condition instead of sleeping a fixed time, gives up
+# after its timeout, and books the time it actually spent into a WaitClock.
+# ------------------------------
+POLL_INTERVAL = 0.05
+
+class WaitClock:
+    """Accumulates the time actually spent inside waits, per label."""
+
+    def __init__(self):
+        self.spent = {}
+        self.timeouts = 0
+
+    def record(self, label, seconds, timed_out=False):
+        self.spent[label] = self.spent.get(label, 0.0) + seconds
+        if timed_out:
+            self.timeouts += 1
+
+    def total(self):
+        return sum(self.spent.values())
+
+    def summary(self):
+        parts = ", ".join(f"{label} {secs:.2f}s" for label, secs in self.spent.items())
+        text = f"⏱️ Waited {self.total():.2f}s"
+        if parts:
+            text += f" ({parts})"
+        if self.timeouts:
+            text += f" | {self.timeouts} timeout(s)"
+        return text
+
+    def reset(self):
+        self.spent = {}
+        self.timeouts = 0
+
+default_clock = WaitClock()
+
+def wait_until(driver, condition, timeout, label, clock=None):
+    """Poll condition(driver) until it returns a truthy value; None on timeout."""
+    clock = clock or default_clock
+    started = time.monotonic()
+    try:
+        result = WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL,
+                               ignored_exceptions=(StaleElementReferenceException,)).until(condition)
+        clock.record(label, time.monotonic() - started)
+        return result
+    except TimeoutException:
+        clock.record(label, time.monotonic() - started, timed_out=True)
+        return None
+
+# ------------------------------
+# Page-level conditions
+# ------------------------------
+NETWORK_IDLE_JS = """
+    if (document.readyState !== 'complete') { return false; }
+    if (window.jQuery && window.jQuery.active > 0) { return false; }
+    return true;
+"""
+
+MESSAGES_JS = """
+    function messages() {
+        var found = [], body = document.body;
+        if (!body) { return found; }
+        var walker = document.createTreeWalker(body, NodeFilter.SHOW_TEXT, null, false), node;
+        while ((node = walker.nextNode())) {
+            var el = node.parentElement, t = (node.nodeValue || '').toLowerCase();
+            if (!el || el.tagName === 'SCRIPT' || el.tagName === 'STYLE') { continue; }
+            if ((t.indexOf('no record') !== -1 || t.indexOf('no data') !== -1) && found.indexOf(el) === -1) {
+                found.push(el);
+            }
+        }
+        return found;
+    }
+"""
+
+# A shown "no record" message gets an empty sentinel child. Whatever puts up
+# the next answer (page load, AJAX replacing the container or the message
+# text) drops it, so a message without a sentinel is the fresh one, even when
+# two courts in a row show the very same text.
+MARK_STALE_JS = MESSAGES_JS + """
+    var tables = document.getElementsByTagName('table');
+    for (var i = 0; i < tables.length; i++) { tables[i].setAttribute('data-cl-stale', '1'); }
+    var found = messages();
+    for (var i = 0; i < found.length; i++) {
+        if (found[i].querySelector('[data-cl-sentinel]')) { continue; }
+        var sentinel = document.createElement('span');
+        sentinel.setAttribute('data-cl-sentinel', '1');
+        sentinel.style.display = 'none';
+        found[i].appendChild(sentinel);
+    }
+"""
+
+RESULTS_STATE_JS = MESSAGES_JS + """
+    if (document.readyState !== 'complete') { return null; }
+    if (window.jQuery && window.jQuery.active > 0) { return null; }
+    if (!document.body) { return null; }
+    var tables = document.getElementsByTagName('table');
+    for (var i = 0; i < tables.length; i++) {
+        if (tables[i].getAttribute('data-cl-stale') === '1') { continue; }
+        var t = (tables[i].innerText || '').toLowerCase();
+        if ((t.indexOf('sl') !== -1 && t.indexOf('case') !== -1) && tables[i].getElementsByTagName('tr').length >= 2) {
+            return 'table';
+        }
+    }
+    var found = messages();
+    for (var i = 0; i < found.length; i++) {
+        if (found[i].getClientRects().length > 0 && !found[i].querySelector('[data-cl-sentinel]')) {
+            return 'empty';
+        }
+    }
+    return null;
+"""
+
+def wait_for_network_idle(driver, timeout=10, label="network", clock=None):
+    """Wait until the document is loaded and no jQuery requests are in flight."""
+    return bool(wait_until(driver, lambda d: d.execute_script(NETWORK_IDLE_JS), timeout, label, clock))
+
+def mark_results_stale(driver):
+    """Tag the current page so wait_for_results ignores whatever it shows now."""
+    try:
+        driver.execute_script(MARK_STALE_JS)
+    except Exception:
+        pass
+
+def wait_for_results(driver, timeout=20, label="results", clock=None):
+    """Wait for a results table or a "no record" marker.
+
+    Returns "table", "empty", or None when neither showed up in time.
+    """
+    return wait_until(driver, lambda d: d.execute_script(RESULTS_STATE_JS), timeout, label, clock)
+
+# ------------------------------
+# Element-level conditions
+# ------------------------------
+COURT_OPTIONS_JS = """
+    var root = arguments[0] || document;
+    var selects = root.getElementsByTagName('select');
+    for (var i = 0; i < selects.length; i++) {
+        var count = 0;
+        for (var j = 0; j < selects[i].options.length; j++) {
+            var t = (selects[i].options[j].text || '').toUpperCase();
+            if (t.indexOf('COURT HALL -') !== -1 || t.indexOf('COURT HALL-') !== -1) { count++; }
+        }
+        if (count >= 2) { return true; }
+    }
+    return false;
+"""
+
+def wait_for_court_options(driver, form=None, timeout=5, label="court_options", clock=None):
+    """Wait until a select (inside form, if given) is populated with court hall options."""
+    return bool(wait_until(driver, lambda d: d.execute_script(COURT_OPTIONS_JS, form), timeout, label, clock))
+
+def wait_for_value(driver, el, predicate, timeout=0.4, label="value", clock=None):
+    """Wait until predicate(el.value) holds; returns the committed value or None."""
+    def committed(d):
+        value = (el.get_attribute("value") or "").strip()
+        return value if predicate(value) else None
+    return wait_until(driver, committed, timeout, label, clock)
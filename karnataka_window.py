@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+from karnataka_progress import atomic_write_json, load_json
+
+# ------------------------------
+# Adaptive sprint window for the Karnataka date ranges.
+# Each bench remembers its preferred window (in days). After a sprint the
+# window widens when the court queries came back small and shrinks when a
+# query returned too many rows or took too long. Sprints stay on the
+# scripts' fixed SPRINT_DAYS grid, since Cause_Date and the store keys come
+# from the query start; a window never exceeds the sprint, and a bench with
+# a narrower one covers the sprint in several queries of its own, so one
+# busy bench does not shrink the queries of the others.
+# ------------------------------
+MIN_WINDOW_DAYS = 1
+MAX_WINDOW_DAYS = 7    # one SPRINT_DAYS sprint
+TARGET_ROWS_PER_QUERY = 250   # rows per court query we aim for
+MAX_ROWS_PER_QUERY = 600      # above this a page is too big (or at risk of truncation)
+SLOW_QUERY_SECONDS = 20.0     # above this a query is too slow
+
+class WindowController:
+    """Per-bench sprint window sizing, persisted between runs."""
+
+    def __init__(self, path, initial_days, min_days=MIN_WINDOW_DAYS, max_days=MAX_WINDOW_DAYS,
+                 target_rows=TARGET_ROWS_PER_QUERY, max_rows=MAX_ROWS_PER_QUERY,
+                 slow_seconds=SLOW_QUERY_SECONDS, on_error=print):
+        self.path = path
+        self.min_days = min_days
+        self.max_days = max_days
+        self.initial_days = self._clamp(initial_days)
+        self.target_rows = target_rows
+        self.max_rows = max_rows
+        self.slow_seconds = slow_seconds
+        self.on_error = on_error
+        self.windows = load_json(path)
+        self.observed = {}
+
+    def _clamp(self, days):
+        return max(self.min_days, min(self.max_days, int(days)))
+
+    def window_days(self, bench_code):
+        return self._clamp(self.windows.get(bench_code, self.initial_days))
+
+    def bench_windows(self, bench_code, sprint_start, sprint_end):
+        """(from, to) dates covering the sprint in queries of this bench's window."""
+        step = timedelta(days=self.window_days(bench_code))
+        windows = []
+        start = sprint_start
+        while start <= sprint_end:
+            end = min(start + step - timedelta(days=1), sprint_end)
+            windows.append((start, end))
+            start = end + timedelta(days=1)
+        return windows
+
+    def observe(self, bench_code, rows, seconds):
+        """Record one court query of the current sprint."""
+        self.observed.setdefault(bench_code, []).append((rows, seconds))
+
+    def _next_window(self, days, observations):
+        peak_rows = max(r for r, _ in observations)
+        peak_secs = max(s for _, s in observations)
+        if peak_rows > self.max_rows or peak_secs > self.slow_seconds:
+            return days // 2
+        if peak_rows == 0:
+            return days * 2
+        ideal = int(self.target_rows * days / peak_rows)
+        # grow at most 2x per sprint, shrink straight to the ideal size
+        return min(ideal, days * 2)
+
+    def end_sprint(self):
+        """Adapt every bench observed in the sprint from the window it queried with; returns the new windows."""
+        for bench_code, observations in self.observed.items():
+            days = self.window_days(bench_code)
+            self.windows[bench_code] = self._clamp(self._next_window(days, observations))
+        self.observed = {}
+        try:
+            atomic_write_json(self.path, self.windows)
+        except Exception as e:
+            self.on_error(f"⚠️ Failed to save sprint windows: {repr(e)}")
+        return dict(self.windows)
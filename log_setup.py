@@ -0,0 +1,73 @@
+import os
+import gzip
+import queue
+import atexit
+import shutil
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# ------------------------------
+# Shared logging setup for the scrapers.
+# Callers only put records on an in-memory queue. A background listener
+# thread writes them to the console and to a size-rotated log file, and
+# rotated files are gzip-compressed. Per-case detail is logged at DEBUG
+# with %-style arguments, so under the default INFO level it is dropped
+# before any formatting. Set SCRAPER_LOG_LEVEL=DEBUG to see it.
+# ------------------------------
+LOG_LEVEL = os.environ.get("SCRAPER_LOG_LEVEL", "INFO").upper()
+DEFAULT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+MAX_BYTES = 10 * 1024 * 1024   # rotate the log file at this size
+BACKUP_COUNT = 5               # compressed rotations kept
+
+_listener = None
+
+def _gzip_namer(name):
+    return name + ".gz"
+
+def _gzip_rotator(source, dest):
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+def setup_queue_logging(log_file=None, fmt=DEFAULT_FORMAT, level=None, console=True,
+                        max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+    """Send all logging through a queue to a background writer; returns the QueueListener.
+
+    Calling it again returns the running listener unchanged.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    formatter = logging.Formatter(fmt)
+    handlers = []
+    if log_file:
+        os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+        file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                           encoding="utf-8", delay=True)
+        file_handler.namer = _gzip_namer
+        file_handler.rotator = _gzip_rotator
+        handlers.append(file_handler)
+    if console:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    records = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(records)]
+    root.setLevel(level or LOG_LEVEL)
+
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_queue_logging)
+    return _listener
+
+def stop_queue_logging():
+    """Flush everything still queued and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
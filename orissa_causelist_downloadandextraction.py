@@ -3,6 +3,7 @@ import re
 import time
 import logging
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
 import PyPDF2
 from datetime import datetime, timedelta
@@ -15,10 +16,22 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
+from strategy_cache import StrategyCache
+from log_setup import setup_queue_logging
+from work_ledger import WorkLedger
+from pdf_store import PdfStore
+from case_numbers import case_recognizer
+from browser_downloads import IsolatedDownload
+from ecourts_client import EcourtsCauselistClient, cookies_from_driver, parse_listing
+from request_capture import (RequestTemplate, enable_performance_log, drain_performance_log,
+                             install_request_hook, date_requests)
 
 # === CONFIGURATION ===
 OUTPUT_FOLDER = r"C:\Users\Dell\OneDrive\Desktop\orissa_causelists"
 LOG_FILE = os.path.join(OUTPUT_FOLDER, "orissa_download_log.txt")
+STRATEGY_FILE = os.path.join(OUTPUT_FOLDER, "strategy_cache.json")  # selectors that worked last run
+LEDGER_DB = os.path.join(OUTPUT_FOLDER, "orissa_ledger.sqlite")  # resume state per (date, list)
+PDF_STORE = os.path.join(OUTPUT_FOLDER, "pdf_store")  # each distinct PDF stored and parsed once
 EXCEL_FILE = os.path.join(OUTPUT_FOLDER, "orissa_causelists_data.xlsx")
 CAUSELIST_URL = "https://hcservices.ecourts.gov.in/ecourtindiaHC/cases/highcourt_causelist.php?state_cd=11&dist_cd=1&court_code=1&stateNm=Odisha"
 
@@ -26,16 +39,16 @@ CAUSELIST_URL = "https://hcservices.ecourts.gov.in/ecourtindiaHC/cases/highcourt
 START_DATE = datetime(2025, 9, 1)
 END_DATE = datetime(2025, 10, 30)
 
+HTTP_MODE = True  # list cause lists over HTTP with the GO request captured in the browser (once it reproduced the table); PDFs are fetched over HTTP either way
+DOWNLOAD_WORKERS = 4  # PDFs of one date fetched at once
+
+strategy_cache = StrategyCache(STRATEGY_FILE, "ecourts_hc_orissa")
+
 # === LOGGING SETUP ===
-os.makedirs(OUTPUT_FOLDER, exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+def setup_logging():
+    """Create the output folder and start queued logging (called from main, not at import)."""
+    os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+    setup_queue_logging(LOG_FILE)
 
 # === CHROME DRIVER SETUP ===
 def setup_driver():
@@ -62,6 +75,7 @@ def setup_driver():
         "safebrowsing.enabled": True
     }
     chrome_options.add_experimental_option("prefs", prefs)
+    enable_performance_log(chrome_options)  # lets the GO request be captured for HTTP listing
     
     driver = webdriver.Chrome(
         service=Service(ChromeDriverManager().install()),
@@ -70,29 +84,6 @@ def setup_driver():
     return driver
 
 
-def wait_for_download(download_folder, timeout=60):
-    """Wait for download to complete."""
-    seconds = 0
-    while seconds < timeout:
-        time.sleep(1)
-        files = os.listdir(download_folder)
-        if not any(f.endswith('.crdownload') or f.endswith('.tmp') for f in files):
-            time.sleep(2)
-            return True
-        seconds += 1
-    logging.warning(f"Download timeout after {timeout} seconds")
-    return False
-
-
-def get_latest_pdf(folder):
-    """Get the most recently downloaded PDF."""
-    pdf_files = [f for f in os.listdir(folder) if f.lower().endswith('.pdf')]
-    if not pdf_files:
-        return None
-    pdf_files.sort(key=lambda x: os.path.getmtime(os.path.join(folder, x)), reverse=True)
-    return pdf_files[0]
-
-
 def select_date_in_picker(driver, target_date):
     """Select a specific date in the date picker."""
     try:
@@ -109,10 +100,11 @@ def select_date_in_picker(driver, target_date):
         ]
         
         date_input = None
-        for by_type, selector in selectors:
+        for by_type, selector in strategy_cache.order("date_input", selectors):
             try:
                 date_input = wait.until(EC.element_to_be_clickable((by_type, selector)))
                 logging.info(f"Found date input using: {by_type} = {selector}")
+                strategy_cache.remember("date_input", (by_type, selector))
                 break
             except:
                 continue
@@ -152,9 +144,10 @@ def click_go_button(driver):
         ]
         
         go_button = None
-        for by_type, selector in selectors:
+        for by_type, selector in strategy_cache.order("go_button", selectors):
             try:
                 go_button = wait.until(EC.element_to_be_clickable((by_type, selector)))
+                strategy_cache.remember("go_button", (by_type, selector))
                 break
             except:
                 continue
@@ -174,7 +167,11 @@ def click_go_button(driver):
 
 
 def get_causelist_table_rows(driver):
-    """Extract all rows from the causelist table."""
+    """Snapshot the causelist table into plain descriptors (sr_no, bench, list_type, url).
+
+    The table's HTML is read once and parsed offline, so nothing downstream
+    holds a WebElement that can go stale and the PDFs can be fetched in parallel.
+    """
     try:
         wait = WebDriverWait(driver, 10)
         
@@ -183,25 +180,16 @@ def get_causelist_table_rows(driver):
             EC.presence_of_element_located((By.XPATH, "//table[contains(@class, 'table') or .//th[contains(text(), 'Bench')] or .//th[contains(text(), 'Sr No')]]"))
         )
         
-        # Get all rows - try different approaches
-        try:
-            # Method 1: Get tbody rows
-            tbody = table.find_element(By.TAG_NAME, "tbody")
-            rows = tbody.find_elements(By.TAG_NAME, "tr")
-        except:
-            # Method 2: Get all tr except first (header)
-            all_rows = table.find_elements(By.TAG_NAME, "tr")
-            rows = all_rows[1:] if len(all_rows) > 1 else all_rows
+        # Read every row in one round trip (header rows are dropped by the parser)
+        entries = parse_listing(table.get_attribute("outerHTML"), driver.current_url)
         
-        logging.info(f"Found {len(rows)} causelist entries in table")
+        logging.info(f"Found {len(entries)} causelist entries in table")
         
         # Log first few rows for debugging
-        for i, row in enumerate(rows[:3], start=1):
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if cells:
-                logging.info(f"  Row {i}: {len(cells)} columns - First cell: '{cells[0].text.strip()}'")
+        for i, entry in enumerate(entries[:3], start=1):
+            logging.info(f"  Row {i}: Sr No '{entry['sr_no']}' - {'link resolved' if entry['url'] else 'no direct link'}")
         
-        return rows
+        return entries
         
     except TimeoutException:
         logging.warning("No causelist table found for this date")
@@ -211,29 +199,36 @@ def get_causelist_table_rows(driver):
         return []
 
 
-def download_causelist_pdf(driver, row, sr_no, current_date):
-    """Download PDF for a specific causelist row.
+def find_listing_row(driver, sr_no_text):
+    """Locate the live table row of a listed Sr No (looked up fresh, so it is never stale)."""
+    if "'" in sr_no_text:
+        return None
+    rows = driver.find_elements(By.XPATH, f"//table//tr[td[1][normalize-space()='{sr_no_text}']]")
+    return rows[0] if rows else None
+
+
+def download_causelist_pdf(driver, entry, sr_no, current_date):
+    """Download PDF for a listed causelist row by clicking through it in the browser.
 
     **CHANGES MADE HERE**
     - Always returns two values: (pdf_filename, bench_name) or (None, bench_name)/(None, None)
     - Sanitizes new filename to remove illegal Windows characters/newlines to avoid WinError 123.
+    - Takes a listing descriptor; only used for rows whose link could not be fetched over HTTP.
     """
     try:
-        # Get all cells in the row
-        cells = row.find_elements(By.TAG_NAME, "td")
+        # Typically: [Sr No, Bench, Causelist Type, View Causelist]
+        sr_no_text = entry["sr_no"]
+        bench_name = entry["bench"] or "Unknown"
+        causelist_type = entry["list_type"] or "Unknown"
         
-        if len(cells) < 3:
-            logging.warning(f"  Sr No {sr_no}: Row has insufficient columns ({len(cells)})")
-            # return two values so unpacking doesn't fail
-            return None, None
+        logging.info(f"  Sr No {sr_no_text}: Bench - {bench_name}, Type - {causelist_type} (browser)")
         
-        # Extract information from cells
-        # Typically: [Sr No, Bench, Causelist Type, View Causelist]
-        sr_no_text = cells[0].text.strip()
-        bench_name = cells[1].text.strip() if len(cells) > 1 else "Unknown"
-        causelist_type = cells[2].text.strip() if len(cells) > 2 else "Unknown"
+        row = find_listing_row(driver, sr_no_text)
+        cells = row.find_elements(By.TAG_NAME, "td") if row is not None else []
         
-        logging.info(f"  Sr No {sr_no_text}: Bench - {bench_name}, Type - {causelist_type}")
+        if len(cells) < 3:
+            logging.warning(f"  Sr No {sr_no}: Row not found or has insufficient columns ({len(cells)})")
+            return None, bench_name
         
         # Find the View link - try multiple approaches
         view_link = None
@@ -259,118 +254,78 @@ def download_causelist_pdf(driver, row, sr_no, current_date):
         # Store current window handle
         main_window = driver.current_window_handle
         
-        # Click View link
-        view_link.click()
-        time.sleep(3)
-        
-        # Check if new window/tab opened
-        if len(driver.window_handles) > 1:
-            driver.switch_to.window(driver.window_handles[-1])
-            time.sleep(2)
+        # The click downloads into its own temporary folder, so the file that
+        # arrives there is this row's PDF and nothing else's
+        with IsolatedDownload(driver, OUTPUT_FOLDER) as download:
+            # Click View link
+            view_link.click()
+            time.sleep(3)
             
-            # Try to find and click download button
-            try:
-                # Try multiple selectors for download button
-                download_selectors = [
-                    (By.XPATH, "//button[contains(@title, 'Download')]"),
-                    (By.XPATH, "//button[contains(@class, 'download')]"),
-                    (By.XPATH, "//a[contains(@title, 'Download')]"),
-                    (By.XPATH, "//button[contains(text(), 'Download')]"),
-                    (By.ID, "download"),
-                    (By.CSS_SELECTOR, "button[title*='Download']")
-                ]
-                
-                download_btn = None
-                for by_type, selector in download_selectors:
-                    try:
-                        download_btn = WebDriverWait(driver, 5).until(
-                            EC.element_to_be_clickable((by_type, selector))
-                        )
-                        break
-                    except:
-                        continue
-                
-                if download_btn:
-                    download_btn.click()
-                    logging.info(f"    ✅ Clicked download button for Sr No {sr_no_text}")
-                else:
-                    logging.info(f"    📄 PDF opened (auto-download expected) for Sr No {sr_no_text}")
+            # Check if new window/tab opened
+            new_tab = len(driver.window_handles) > 1
+            if new_tab:
+                driver.switch_to.window(driver.window_handles[-1])
+                time.sleep(2)
                 
-            except TimeoutException:
-                logging.info(f"    📄 PDF auto-downloading for Sr No {sr_no_text}")
-            
-            # Wait for download to complete
-            if wait_for_download(OUTPUT_FOLDER, timeout=40):
-                latest_pdf = get_latest_pdf(OUTPUT_FOLDER)
-                if latest_pdf:
-                    # Create new filename with proper format
-                    date_str = current_date.strftime("%d-%m-%Y")  # DD-MM-YYYY format
-                    new_name = f"causelist_{date_str}_{sr_no_text}.pdf"
-                    
-                    # sanitize filename to avoid invalid characters/newlines
-                    # remove characters: \ / : * ? " < > | and newline/carriage returns
-                    safe_name = re.sub(r'[\\/:*?"<>|\r\n]+', '_', new_name).strip()
-                    
-                    old_path = os.path.join(OUTPUT_FOLDER, latest_pdf)
-                    new_path = os.path.join(OUTPUT_FOLDER, safe_name)
+                # Try to find and click download button
+                try:
+                    # Try multiple selectors for download button
+                    download_selectors = [
+                        (By.XPATH, "//button[contains(@title, 'Download')]"),
+                        (By.XPATH, "//button[contains(@class, 'download')]"),
+                        (By.XPATH, "//a[contains(@title, 'Download')]"),
+                        (By.XPATH, "//button[contains(text(), 'Download')]"),
+                        (By.ID, "download"),
+                        (By.CSS_SELECTOR, "button[title*='Download']")
+                    ]
                     
-                    # Check if file already exists
-                    if os.path.exists(new_path):
-                        logging.info(f"    ⚠️ PDF already exists: {safe_name}")
-                        # Delete the duplicate download
+                    download_btn = None
+                    for by_type, selector in download_selectors:
                         try:
-                            os.remove(old_path)
+                            download_btn = WebDriverWait(driver, 5).until(
+                                EC.element_to_be_clickable((by_type, selector))
+                            )
+                            break
                         except:
-                            pass
+                            continue
+                    
+                    if download_btn:
+                        download_btn.click()
+                        logging.info(f"    ✅ Clicked download button for Sr No {sr_no_text}")
                     else:
-                        # Rename the file
-                        try:
-                            os.rename(old_path, new_path)
-                            logging.info(f"    ✅ Downloaded: {safe_name}")
-                            new_name = safe_name
-                        except Exception as e:
-                            logging.error(f"    ❌ Error renaming file: {e}")
-                            # fallback to existing filename
-                            new_name = latest_pdf
+                        logging.info(f"    📄 PDF opened (auto-download expected) for Sr No {sr_no_text}")
                     
-                    # Close the PDF tab and switch back
-                    driver.close()
-                    driver.switch_to.window(main_window)
-                    time.sleep(1)
-                    # RETURN TWO VALUES (fixed)
-                    return new_name, bench_name
+                except TimeoutException:
+                    logging.info(f"    📄 PDF auto-downloading for Sr No {sr_no_text}")
             
-            # Close the PDF tab and switch back
-            driver.close()
-            driver.switch_to.window(main_window)
-            time.sleep(1)
-        else:
-            # PDF might have downloaded directly without opening new window
-            if wait_for_download(OUTPUT_FOLDER, timeout=30):
-                latest_pdf = get_latest_pdf(OUTPUT_FOLDER)
-                if latest_pdf:
-                    date_str = current_date.strftime("%d-%m-%Y")
-                    new_name = f"causelist_{date_str}_{sr_no_text}.pdf"
-                    
-                    # sanitize filename
-                    safe_name = re.sub(r'[\\/:*?"<>|\r\n]+', '_', new_name).strip()
-                    
-                    old_path = os.path.join(OUTPUT_FOLDER, latest_pdf)
-                    new_path = os.path.join(OUTPUT_FOLDER, safe_name)
-                    
-                    if not os.path.exists(new_path):
-                        try:
-                            os.rename(old_path, new_path)
-                            logging.info(f"    ✅ Downloaded: {safe_name}")
-                            # RETURN TWO VALUES (fixed)
-                            return safe_name, bench_name
-                        except Exception as e:
-                            logging.error(f"    ❌ Error renaming file: {e}")
-                            # fallback return existing name
-                            return latest_pdf, bench_name
-        
-        # If nothing downloaded
-        return None, bench_name
+            # Wait for this download to complete (and pass the PDF integrity check)
+            downloaded = download.wait(timeout=40 if new_tab else 30)
+            new_name = None
+            if downloaded:
+                # Create new filename with proper format
+                date_str = current_date.strftime("%d-%m-%Y")  # DD-MM-YYYY format
+                new_name = f"causelist_{date_str}_{sr_no_text}.pdf"
+                
+                # sanitize filename to avoid invalid characters/newlines
+                # remove characters: \ / : * ? " < > | and newline/carriage returns
+                new_name = re.sub(r'[\\/:*?"<>|\r\n]+', '_', new_name).strip()
+                
+                if download.move_to(os.path.join(OUTPUT_FOLDER, new_name)):
+                    logging.info(f"    ✅ Downloaded: {new_name}")
+                else:
+                    # the duplicate download is dropped with the temporary folder
+                    logging.info(f"    ⚠️ PDF already exists: {new_name}")
+            else:
+                logging.warning(f"    ⚠️ Download did not complete for Sr No {sr_no_text}")
+            
+            if new_tab:
+                # Close the PDF tab and switch back
+                driver.close()
+                driver.switch_to.window(main_window)
+                time.sleep(1)
+        
+        # RETURN TWO VALUES (None if nothing downloaded)
+        return new_name, bench_name
         
     except Exception as e:
         logging.error(f"    ❌ Error downloading Sr No {sr_no}: {e}")
@@ -384,6 +339,49 @@ def download_causelist_pdf(driver, row, sr_no, current_date):
         # RETURN TWO VALUES (fixed)
         return None, None
 
+def download_causelist_over_http(client, entry, current_date):
+    """Fetch one listed cause list with the HTTP client; returns (pdf_filename, bench_name) like the browser path."""
+    sr_no_text = entry["sr_no"]
+    bench_name = entry["bench"] or "Unknown"
+    logging.info(f"  Sr No {sr_no_text}: Bench - {bench_name}, Type - {entry['list_type']}")
+    
+    date_str = current_date.strftime("%d-%m-%Y")
+    safe_name = re.sub(r'[\\/:*?"<>|\r\n]+', '_', f"causelist_{date_str}_{sr_no_text}.pdf").strip()
+    new_path = os.path.join(OUTPUT_FOLDER, safe_name)
+    
+    if os.path.exists(new_path):
+        logging.info(f"    ⚠️ PDF already exists: {safe_name}")
+        return safe_name, bench_name
+    if not entry["url"]:
+        logging.info(f"    No direct link for Sr No {sr_no_text}, needs the browser")
+        return None, bench_name
+    if client.download(entry["url"], new_path):
+        logging.info(f"    ✅ Downloaded: {safe_name}")
+        return safe_name, bench_name
+    return None, bench_name
+
+def fetch_causelist_pdfs(client, driver, entries, current_date):
+    """Download every listed PDF; returns (pdf_filename, bench_name) per entry, in listing order.
+
+    PDFs already on disk are reused. Entries with a resolved link are fetched
+    in parallel over HTTP (carrying the browser's cookies when the listing came
+    from the browser). Entries without one, or whose HTTP fetch failed, are
+    clicked through in the browser if it is open.
+    """
+    results = [(None, entry["bench"] or "Unknown") for entry in entries]
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+        futures = {pool.submit(download_causelist_over_http, client, entry, current_date): idx
+                   for idx, entry in enumerate(entries)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    if driver is not None:
+        for idx, entry in enumerate(entries):
+            if results[idx][0] is None:
+                results[idx] = download_causelist_pdf(driver, entry, idx + 1, current_date)
+                time.sleep(2)
+    return results
+
 # === PDF TEXT EXTRACTION WITH LAYOUT PRESERVATION ===
 def extract_text_from_pdf_with_layout(pdf_path):
     """Extract text from PDF maintaining layout structure."""
@@ -440,25 +438,12 @@ def extract_court_hall_and_justice_and_time(first_page_text):
 
 
 def parse_case_identifier(case_id_text):
-    """Parse case type, number, year, and IA number."""
-    case_type = "N/A"
-    case_number = "N/A"
-    case_year = "N/A"
-    ia_no = "N/A"
-    
-    # Pattern: WP(C)/31043/2024 or RVWPET/193/2025 or CONTC/7667/2024
-    match = re.search(r'([A-Z]+(?:\([A-Z]+\))?)/(\d+)/(\d{4})', case_id_text)
-    if match:
-        case_type = match.group(1)
-        case_number = match.group(2)
-        case_year = match.group(3)
-    
-    # Extract IA number: IA No.328/2025
-    ia_match = re.search(r'IA\s*No\.?(\d+/\d{4})', case_id_text, re.IGNORECASE)
-    if ia_match:
-        ia_no = ia_match.group(1)
-    
-    return case_type, case_number, case_year, ia_no
+    """Parse case type, number, year, and IA number.
+
+    WP(C)/31043/2024, RVWPET/193/2025 or CONTC/7667/2024, plus IA No.328/2025,
+    read in one pass by the shared recognizer.
+    """
+    return case_recognizer("orissa").identify(case_id_text)
 
 
 def parse_orissa_causelist_structured(pdf_path, pdf_filename, cause_date, bench_name_from_table):
@@ -709,81 +694,154 @@ def save_to_excel(cases_data, excel_path):
         return False
 
 
+def process_listing(client, driver, entries, current_date, ledger, pdf_store):
+    """Download, parse and store one date's listed cause lists through the ledger and PDF store.
+
+    Shared by main() and ecourts_engine, so a list is worked on the same way
+    whoever listed it. Returns (PDFs downloaded, cases extracted, failures).
+    """
+    if not entries:
+        logging.warning(f"No cause lists for {current_date.strftime('%d-%m-%Y')}")
+        ledger.close_date(current_date, allow_empty=current_date.date() < datetime.now().date())
+        return 0, 0, []
+    
+    # Only lists not yet stored by an earlier run are worked on
+    ledger.record_listing(current_date, [entry["sr_no"] for entry in entries])
+    stored = [entry for entry in entries if ledger.state(current_date, entry["sr_no"]) == "stored"]
+    entries = [entry for entry in entries if entry not in stored]
+    if stored:
+        logging.info(f"⏭️ {len(stored)} cause list(s) already stored for this date")
+    
+    date_pdfs = 0
+    date_cases = []
+    parsed = []
+    failed = []
+    
+    downloads = fetch_causelist_pdfs(client, driver, entries, current_date)
+    
+    for entry, (pdf_filename, bench_name) in zip(entries, downloads):
+        if pdf_filename:
+            date_pdfs += 1
+            ledger.advance(current_date, entry["sr_no"], "downloaded", pdf=pdf_filename)
+            
+            # Extract data from downloaded PDF
+            pdf_path = os.path.join(OUTPUT_FOLDER, pdf_filename)
+            if os.path.exists(pdf_path):
+                # Identical PDFs (same list behind several rows or dates) are parsed once
+                sha = pdf_store.add(pdf_path, "orissa", current_date, entry["sr_no"])
+                cases = pdf_store.parse_once(
+                    sha,
+                    lambda: parse_orissa_causelist_structured(pdf_path, pdf_filename, current_date, bench_name),
+                    {"bench_name": bench_name or "Orissa High Court",
+                     "cause_date": current_date.strftime("%d-%m-%Y"),
+                     "Pdf_name": pdf_filename}
+                )
+                date_cases.extend(cases)
+                ledger.advance(current_date, entry["sr_no"], "parsed")
+                parsed.append(entry["sr_no"])
+            else:
+                logging.warning(f"PDF file not found: {pdf_path}")
+                ledger.fail(current_date, entry["sr_no"], "PDF file not found")
+        else:
+            failed.append(f"{current_date.strftime('%d-%m-%Y')} - Sr No {entry['sr_no']}")
+            ledger.fail(current_date, entry["sr_no"], "download failed")
+    
+    # Save extracted cases to Excel
+    if not date_cases or save_to_excel(date_cases, EXCEL_FILE):
+        for sr_no in parsed:
+            ledger.advance(current_date, sr_no, "stored")
+    ledger.close_date(current_date)
+    
+    logging.info(f"Downloaded {date_pdfs} PDFs, Extracted {len(date_cases)} cases")
+    return date_pdfs, len(date_cases), failed
+
+
 # === MAIN EXECUTION ===
 def main():
+    setup_logging()
     logging.info("=" * 80)
     logging.info("ORISSA HIGH COURT CAUSELIST DOWNLOADER & EXTRACTOR")
     logging.info("=" * 80)
     
-    driver = setup_driver()
+    driver = None
     total_pdfs_downloaded = 0
     total_cases_extracted = 0
     failed_downloads = []
     
+    def open_browser():
+        """Start Chrome on the cause list page (only when HTTP mode cannot do the job)."""
+        nonlocal driver
+        if driver is None:
+            driver = setup_driver()
+            driver.get(CAUSELIST_URL)
+            time.sleep(3)
+            logging.info(f"Opened URL: {CAUSELIST_URL}")
+        return driver
+    
+    # Fetches every PDF; also lists over HTTP once the GO request has been captured (HTTP_MODE)
+    saved = strategy_cache.get("listing_request") if HTTP_MODE else None
+    client = EcourtsCauselistClient(CAUSELIST_URL, bootstrap=lambda session: cookies_from_driver(open_browser(), session),
+                                    template=RequestTemplate.from_dict(saved) if saved else None)
+    ledger = WorkLedger(LEDGER_DB, "orissa")
+    pdf_store = PdfStore(PDF_STORE)
+    
     try:
-        driver.get(CAUSELIST_URL)
-        time.sleep(3)
-        logging.info(f"Opened URL: {CAUSELIST_URL}")
-        
         current_date = START_DATE
         
         while current_date <= END_DATE:
-            logging.info("\n" + "=" * 80)
-            logging.info(f"PROCESSING DATE: {current_date.strftime('%d-%m-%Y')}")
-            logging.info("=" * 80)
-            
-            if not select_date_in_picker(driver, current_date):
-                logging.error(f"Failed to select date: {current_date}")
-                failed_downloads.append(f"{current_date.strftime('%d-%m-%Y')} - Date selection failed")
-                current_date += timedelta(days=1)
-                continue
-            
-            if not click_go_button(driver):
-                logging.error("Failed to click GO button")
-                failed_downloads.append(f"{current_date.strftime('%d-%m-%Y')} - GO button failed")
+            if ledger.date_done(current_date):
+                logging.info(f"⏭️ {current_date.strftime('%d-%m-%Y')} already stored, skipping")
                 current_date += timedelta(days=1)
                 continue
             
-            rows = get_causelist_table_rows(driver)
-            
-            if not rows:
-                logging.warning(f"No cause lists for {current_date.strftime('%d-%m-%Y')}")
-                current_date += timedelta(days=1)
-                continue
+            logging.info("\n" + "=" * 80)
+            logging.info(f"PROCESSING DATE: {current_date.strftime('%d-%m-%Y')}")
+            logging.info("=" * 80)
             
-            date_pdfs = 0
-            date_cases = []
+            entries = None
+            if client.template is not None:
+                try:
+                    entries = client.list_causelists(current_date)
+                except Exception as e:
+                    logging.warning(f"HTTP listing failed: {e}")
+                if entries is None:
+                    logging.warning("⚠️ HTTP listing unusable for this date, listing in the browser")
+            listed_in_browser = entries is None
             
-            for idx, row in enumerate(rows, start=1):
-                pdf_filename, bench_name = download_causelist_pdf(driver, row, idx, current_date)
+            if entries is None:
+                open_browser()
+                if not select_date_in_picker(driver, current_date):
+                    logging.error(f"Failed to select date: {current_date}")
+                    failed_downloads.append(f"{current_date.strftime('%d-%m-%Y')} - Date selection failed")
+                    current_date += timedelta(days=1)
+                    continue
                 
-                if pdf_filename:
-                    total_pdfs_downloaded += 1
-                    date_pdfs += 1
-                    
-                    # Extract data from downloaded PDF
-                    pdf_path = os.path.join(OUTPUT_FOLDER, pdf_filename)
-                    if os.path.exists(pdf_path):
-                        cases = parse_orissa_causelist_structured(
-                            pdf_path, pdf_filename, current_date, bench_name
-                        )
-                        date_cases.extend(cases)
-                        total_cases_extracted += len(cases)
-                    else:
-                        logging.warning(f"PDF file not found: {pdf_path}")
-                else:
-                    failed_downloads.append(f"{current_date.strftime('%d-%m-%Y')} - Sr No {idx}")
+                capture = HTTP_MODE and client.template is None
+                if capture:
+                    drain_performance_log(driver)
+                    install_request_hook(driver)
+                if not click_go_button(driver):
+                    logging.error("Failed to click GO button")
+                    failed_downloads.append(f"{current_date.strftime('%d-%m-%Y')} - GO button failed")
+                    current_date += timedelta(days=1)
+                    continue
                 
-                time.sleep(2)
-            
-            # Save extracted cases to Excel
-            if date_cases:
-                save_to_excel(date_cases, EXCEL_FILE)
+                entries = get_causelist_table_rows(driver)
+                cookies_from_driver(driver, client.session)
+                # Adopt the request behind GO once its replay lists the same Sr Nos as the table
+                if capture and client.learn_listing(date_requests(driver, current_date), current_date,
+                                                    [entry["sr_no"] for entry in entries]):
+                    strategy_cache.remember("listing_request", client.template.to_dict())
+                    logging.info("✅ GO request captured; later dates are listed over HTTP")
             
-            logging.info(f"Downloaded {date_pdfs} PDFs, Extracted {len(date_cases)} cases")
+            pdfs, cases, failed = process_listing(client, driver, entries, current_date, ledger, pdf_store)
+            total_pdfs_downloaded += pdfs
+            total_cases_extracted += cases
+            failed_downloads.extend(failed)
             
             current_date += timedelta(days=1)
-            time.sleep(3)
+            if listed_in_browser:
+                time.sleep(3)
         
         logging.info("\n" + "=" * 80)
         logging.info("PROCESSING COMPLETED")
@@ -791,6 +849,8 @@ def main():
         logging.info(f"Total PDFs Downloaded: {total_pdfs_downloaded}")
         logging.info(f"Total Cases Extracted: {total_cases_extracted}")
         logging.info(f"Failed Downloads: {len(failed_downloads)}")
+        logging.info(f"Ledger (all runs): {ledger.summary()}")
+        logging.info(f"PDF store (all runs): {pdf_store.stats()}")
         
         if failed_downloads:
             logging.info("\nFailed Downloads:")
@@ -805,8 +865,12 @@ def main():
         logging.error(f"Critical error: {e}", exc_info=True)
         
     finally:
-        driver.quit()
-        logging.info("\nBrowser closed. Processing finished.")
+        ledger.close()
+        pdf_store.close()
+        if driver is not None:
+            driver.quit()
+            logging.info("\nBrowser closed.")
+        logging.info("Processing finished.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,152 @@
+import re
+import time
+
+# ------------------------------
+# Linear-time party and advocate extraction for cause list case blocks.
+# A block is split into whitespace tokens once. Each token is classified by
+# anchored matches on the token alone, and the parties ("X V/S Y") and
+# counsel ("MR. A B SHAH") are read in a single left-to-right pass. Nothing
+# is re-scanned, so a long block without a match costs one pass instead of
+# the backtracking a lazy regex with a lookahead does. A BlockBudget caps the
+# time spent on one block, so a malformed page cannot stall a run.
+# Compared with the regexes this replaced, parties and counsel are now found
+# on blocks where those always gave "N/A", and "M/S", "WD/O", "@" aliases and
+# "& 1 OTHER(S)" stay part of a name. A respondent wrapped onto the next line
+# is followed there unless that line starts with a counsel title, a remark
+# (FOR/UNDER/LISTED/WITH) or holds a party pair of its own.
+# ------------------------------
+EOL = "\n"                                          # token between the block's lines
+SEPARATORS = {"V/S", "VS", "V\\S", "VS.", "V/S."}
+TITLES = {"MR", "MR.", "MS", "MS.", "MRS", "MRS.", "ADVOCATE"}
+ADVOCATE_STOPS = {"FOR", "LISTED"}
+REMARK_WORDS = {"FOR", "UNDER", "LISTED", "WITH"}   # first words of a line that is not a wrapped name
+PARTY_WORD = re.compile(r"[A-Za-z.,&()/@]+")        # characters a party name may contain
+OTHERS = re.compile(r"(?:OTHERS?|ORS)\.?(?:\(S\))?", re.IGNORECASE)  # the "OTHER(S)" in "& 1 OTHER(S)"
+ADVOCATE_WORD = re.compile(r"[A-Za-z.]+")           # characters an advocate name may contain
+BLOCK_BUDGET = 0.25                                 # seconds per block before extraction gives up
+CHECK_EVERY = 256                                   # tokens between clock reads
+
+class BlockBudget:
+    """Time allowance for one case block; `exceeded` is set once it runs out."""
+
+    def __init__(self, seconds=BLOCK_BUDGET):
+        self.deadline = time.perf_counter() + seconds
+        self.exceeded = False
+
+    def expired(self):
+        if not self.exceeded and time.perf_counter() > self.deadline:
+            self.exceeded = True
+        return self.exceeded
+
+def tokenize(lines):
+    """Whitespace tokens of the block's lines, with EOL between lines."""
+    tokens = []
+    for line in lines:
+        words = line.split()
+        if words:
+            if tokens:
+                tokens.append(EOL)
+            tokens.extend(words)
+    return tokens
+
+def _is_party_word(token):
+    return PARTY_WORD.fullmatch(token) is not None
+
+def _party_text(words):
+    """Join a run of party words, starting at its first letter."""
+    text = " ".join(words)
+    for i, ch in enumerate(text):
+        if ch.isalpha():
+            return text[i:].rstrip(" ,&")
+    return ""
+
+def _continues_name(tokens, k):
+    """Whether the line starting at tokens[k] carries on a wrapped respondent."""
+    n = len(tokens)
+    if k >= n or not _is_party_word(tokens[k]) or tokens[k].upper() in TITLES or tokens[k].upper() in REMARK_WORDS:
+        return False
+    while k < n and tokens[k] != EOL and tokens[k].upper() not in TITLES:
+        if tokens[k].upper() in SEPARATORS:
+            return False
+        k += 1
+    return True
+
+def _respondent_end(tokens, j):
+    """Index just past the respondent starting at tokens[j]."""
+    n = len(tokens)
+    while j < n:
+        token = tokens[j]
+        if token == EOL:
+            if not _continues_name(tokens, j + 1):
+                break
+        elif token.upper() in TITLES or token.upper() in SEPARATORS:
+            break
+        elif not _is_party_word(token):
+            # a count is part of the name only in "& 1 OTHER(S)"
+            if not (token.isdigit() and j + 1 < n and OTHERS.fullmatch(tokens[j + 1])):
+                break
+        j += 1
+    return j
+
+def extract_parties(tokens, budget=None):
+    """(petitioner, respondent) pairs, one per V/S separator.
+
+    The petitioner is the run of name words right before the separator; the
+    respondent runs from the separator to the next counsel title, remark,
+    line holding another pair, or word that cannot be part of a name (a
+    number or case code).
+    """
+    parties = []
+    run_start = 0            # first token of the current run of party words
+    i, n, steps = 0, len(tokens), 0
+    while i < n:
+        steps += 1
+        if budget is not None and steps % CHECK_EVERY == 0 and budget.expired():
+            break
+        token = tokens[i]
+        if token.upper() in SEPARATORS:
+            petitioner = _party_text(t for t in tokens[run_start:i] if t != EOL)
+            j = _respondent_end(tokens, i + 1)
+            respondent = _party_text(t for t in tokens[i + 1:j] if t != EOL)
+            if petitioner and respondent:
+                parties.append((petitioner, respondent))
+                i = j
+                run_start = j
+                continue
+            run_start = i + 1
+        elif token != EOL and not _is_party_word(token):
+            run_start = i + 1
+        i += 1
+    return parties
+
+def extract_advocates(tokens, budget=None):
+    """(title, name) for each counsel title followed by a name.
+
+    The name ends at a number, another title, FOR/LISTED, a line end, or the
+    first character that cannot be part of a name (e.g. "SHAH(1234)").
+    """
+    advocates = []
+    i, n, steps = 0, len(tokens), 0
+    while i < n:
+        steps += 1
+        if budget is not None and steps % CHECK_EVERY == 0 and budget.expired():
+            break
+        title = tokens[i]
+        i += 1
+        if title.upper() not in TITLES:
+            continue
+        words = []
+        while i < n:
+            token = tokens[i]
+            if token == EOL or token.upper() in TITLES or token.upper() in ADVOCATE_STOPS:
+                break
+            match = ADVOCATE_WORD.match(token)
+            if not match or not match.group(0)[0].isalpha():
+                break
+            words.append(match.group(0))
+            i += 1
+            if match.end() != len(token):
+                break
+        if words:
+            advocates.append((title, " ".join(words).strip()))
+    return advocates
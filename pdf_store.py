@@ -0,0 +1,113 @@
+import os
+import json
+import time
+import shutil
+import sqlite3
+import hashlib
+from datetime import datetime, date
+
+# ------------------------------
+# Content-addressed store for downloaded cause list PDFs.
+# Every download is hashed (SHA-256) on arrival and its bytes are kept once,
+# under blobs/<first two hex digits>/<hash>.pdf. The usual per-listing file
+# name in the output folder becomes a hard link to the blob (a copy where
+# links are not supported), and a reference row ties (court, date, sr_no)
+# to the hash. Parsed cases are cached per hash, so a PDF linked from
+# several rows, or served again on a later date, is parsed once. Each
+# listing gets the cached cases with its own listing fields (date, bench,
+# file name) filled in.
+# ------------------------------
+HASH_CHUNK = 1024 * 1024
+
+def _day(value):
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class PdfStore:
+    """Deduplicated PDF blobs, their (court, date, sr_no) references and per-blob parse results."""
+
+    def __init__(self, folder):
+        self.folder = folder
+        os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(folder, "pdf_store.sqlite"), timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS refs (court TEXT NOT NULL, day TEXT NOT NULL, "
+                          "sr_no TEXT NOT NULL, sha256 TEXT NOT NULL, name TEXT NOT NULL, added_at REAL NOT NULL, "
+                          "PRIMARY KEY (court, day, sr_no))")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS refs_sha ON refs (sha256)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS parsed (sha256 TEXT PRIMARY KEY, cases TEXT NOT NULL)")
+
+    def blob_path(self, sha):
+        return os.path.join(self.folder, "blobs", sha[:2], sha + ".pdf")
+
+    def _link(self, blob, path):
+        try:
+            os.link(blob, path)
+        except OSError:
+            shutil.copyfile(blob, path)
+
+    def add(self, path, court, day, sr_no):
+        """Take in a freshly downloaded file at path and reference it from (court, day, sr_no).
+
+        The bytes move into the store (or are dropped if the store already has
+        them) and path is recreated as a link to the blob. Returns the hash.
+        """
+        row = self.conn.execute("SELECT sha256 FROM refs WHERE court = ? AND day = ? AND sr_no = ?",
+                                (court, _day(day), str(sr_no))).fetchone()
+        if row and os.path.exists(self.blob_path(row[0])) and os.path.samefile(path, self.blob_path(row[0])):
+            return row[0]   # already taken in by an earlier run
+
+        sha = file_sha256(path)
+        blob = self.blob_path(sha)
+        if os.path.exists(blob):
+            os.remove(path)
+        else:
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            os.replace(path, blob)
+        self._link(blob, path)
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO refs (court, day, sr_no, sha256, name, added_at) "
+                              "VALUES (?, ?, ?, ?, ?, ?)",
+                              (court, _day(day), str(sr_no), sha, os.path.basename(path), time.time()))
+        return sha
+
+    def references(self, sha):
+        """Every (court, day, sr_no, name) that points at sha."""
+        return self.conn.execute("SELECT court, day, sr_no, name FROM refs WHERE sha256 = ? ORDER BY day, sr_no",
+                                 (sha,)).fetchall()
+
+    def parse_once(self, sha, parse, listing_fields):
+        """Cases of blob sha, with listing_fields applied; parse() only runs for an unseen hash.
+
+        Empty results are not cached, so a PDF that failed to parse is tried again.
+        """
+        row = self.conn.execute("SELECT cases FROM parsed WHERE sha256 = ?", (sha,)).fetchone()
+        if row:
+            cases = json.loads(row[0])
+        else:
+            cases = parse()
+            if cases:
+                with self.conn:
+                    self.conn.execute("INSERT OR REPLACE INTO parsed (sha256, cases) VALUES (?, ?)",
+                                      (sha, json.dumps(cases, default=str)))
+        return [dict(case, **listing_fields) for case in cases]
+
+    def stats(self):
+        refs, blobs = self.conn.execute("SELECT COUNT(*), COUNT(DISTINCT sha256) FROM refs").fetchone()
+        return {"references": refs, "unique_pdfs": blobs}
+
+    def close(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass
@@ -0,0 +1,257 @@
+import os
+import re
+import json
+import time
+import base64
+import logging
+
+# ------------------------------
+# Capture the HTTP request behind a browser button and replay it directly.
+# Chrome's performance log records every request the page issues
+# (Network.requestWillBeSent) and the MIME type of each response. When the
+# page hands the PDF over through a blob or window.open, a small JS hook on
+# fetch/XMLHttpRequest/window.open catches what the log misses. The request
+# carrying the date that was typed in becomes a template. The date is
+# swapped for a placeholder, so every later date is one plain HTTP request
+# on a session that holds the browser's cookies. A template counts as
+# verified once a PDF came back for it; until then a reply without a PDF
+# may just mean the wrong request was captured.
+# ------------------------------
+DATE_PLACEHOLDER = "__DATE__"
+DATE_FORMATS = ("%d%%2F%m%%2F%Y", "%d%%2f%m%%2f%Y", "%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d", "%d.%m.%Y",
+                "%d%m%Y", "%Y%m%d")
+PDF_TYPES = ("application/pdf", "application/octet-stream", "application/force-download")
+DROP_HEADERS = {"cookie", "content-length", "host", "connection", "accept-encoding"}
+PDF_BASE64 = re.compile(r"JVBERi0[A-Za-z0-9+/=\s]{100,}")   # "%PDF-" in base64
+
+HOOK_SCRIPT = """
+if (!window.__capturedRequests) {
+    window.__capturedRequests = [];
+    var record = function(method, url, body) {
+        try { url = new URL(url, document.baseURI).href; } catch (e) {}
+        window.__capturedRequests.push({method: (method || 'GET').toUpperCase(), url: String(url),
+                                        body: typeof body === 'string' ? body : null});
+    };
+    var open = XMLHttpRequest.prototype.open, send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function(method, url) {
+        this.__capture = [method, url];
+        return open.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function(body) {
+        if (this.__capture) { record(this.__capture[0], this.__capture[1], body); }
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function(input, init) {
+            init = init || {};
+            record(init.method || (input && input.method), input && input.url ? input.url : input, init.body);
+            return fetch.apply(this, arguments);
+        };
+    }
+    var windowOpen = window.open;
+    window.open = function(url) {
+        if (url) { record('GET', url, null); }
+        return windowOpen.apply(this, arguments);
+    };
+}
+"""
+
+def enable_performance_log(chrome_options):
+    """Ask chromedriver to keep the network events that capture reads."""
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+def drain_performance_log(driver):
+    """Discard events recorded so far, so the next capture only sees the click."""
+    try:
+        driver.get_log("performance")
+    except Exception:
+        pass
+
+def install_request_hook(driver):
+    """Record fetch/XHR/window.open calls made by the current page."""
+    try:
+        driver.execute_script(HOOK_SCRIPT + "window.__capturedRequests.length = 0;")
+    except Exception as e:
+        logging.debug("Request hook not installed: %s", e)
+
+def read_network_events(driver, requests_by_id, mime_types):
+    """Add the requests and response MIME types logged since the last read to the two dicts."""
+    try:
+        entries = driver.get_log("performance")
+    except Exception as e:
+        logging.debug("Performance log unavailable: %s", e)
+        return
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError, TypeError):
+            continue
+        params = message.get("params", {})
+        if message.get("method") == "Network.requestWillBeSent":
+            request = params.get("request", {})
+            requests_by_id[params.get("requestId")] = {
+                "method": request.get("method", "GET"), "url": request.get("url", ""),
+                "body": request.get("postData"), "headers": request.get("headers", {}),
+                "type": params.get("type", "")}
+        elif message.get("method") == "Network.responseReceived":
+            mime_types[params.get("requestId")] = params.get("response", {}).get("mimeType", "")
+
+def hooked_requests(driver):
+    try:
+        return driver.execute_script("return window.__capturedRequests || [];") or []
+    except Exception:
+        return []
+
+def _date_pattern(text):
+    """text not run into other digits, so "01012025" is not found inside a longer token."""
+    return re.compile(r"(?<!\d)" + re.escape(text) + r"(?!\d)")
+
+def _date_format(request, date):
+    """The DATE_FORMATS entry whose rendering of date appears in the request, or None."""
+    for fmt in DATE_FORMATS:
+        pattern = _date_pattern(date.strftime(fmt))
+        if pattern.search(request["url"]) or pattern.search(request.get("body") or ""):
+            return fmt
+    return None
+
+class RequestTemplate:
+    """A captured request with its date replaced by a placeholder."""
+
+    def __init__(self, method, url, body=None, headers=None, date_format="%d/%m/%Y", verified=False):
+        self.method = method
+        self.url = url
+        self.body = body
+        self.headers = headers or {}
+        self.date_format = date_format
+        self.verified = verified   # a PDF has come back for this request
+
+    @classmethod
+    def from_request(cls, request, date, verified=False):
+        fmt = _date_format(request, date)
+        if fmt is None:
+            return None
+        pattern = _date_pattern(date.strftime(fmt))
+        headers = {k: v for k, v in (request.get("headers") or {}).items()
+                   if k.lower() not in DROP_HEADERS and not k.startswith(":")}
+        body = request.get("body")
+        return cls(request["method"], pattern.sub(DATE_PLACEHOLDER, request["url"]),
+                   pattern.sub(DATE_PLACEHOLDER, body) if body else body, headers, fmt, verified)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["method"], data["url"], data.get("body"), data.get("headers"), data["date_format"],
+                   data.get("verified", False))
+
+    def to_dict(self):
+        return {"method": self.method, "url": self.url, "body": self.body,
+                "headers": self.headers, "date_format": self.date_format, "verified": self.verified}
+
+    def build(self, date):
+        """(method, url, body) for date."""
+        text = date.strftime(self.date_format)
+        body = self.body.replace(DATE_PLACEHOLDER, text) if self.body else None
+        return self.method, self.url.replace(DATE_PLACEHOLDER, text), body
+
+def capture_template(driver, date, timeout=15, grace=3):
+    """Template for the request the last click issued for date, or None.
+
+    A logged request answered with a PDF wins and comes back verified.
+    Otherwise the first logged or hooked request carrying the date is
+    returned unverified once grace seconds have passed without a PDF
+    response; it may be the search request rather than the download, so the
+    caller keeps it only after a replay of it returned a PDF.
+    """
+    requests_by_id, mime_types = {}, {}
+    deadline = time.monotonic() + timeout
+    fallback, fallback_since = None, None
+    while time.monotonic() < deadline:
+        read_network_events(driver, requests_by_id, mime_types)
+        logged = [dict(r, mime_type=mime_types.get(i, "")) for i, r in requests_by_id.items()]
+        for request in logged:
+            if request["mime_type"] in PDF_TYPES and request["url"].startswith("http"):
+                template = RequestTemplate.from_request(request, date, verified=True)
+                if template is not None:
+                    logging.info(f"Captured request: {template.method} {template.url}")
+                    return template
+        if fallback is None:
+            others = [r for r in logged if r["type"] in ("XHR", "Fetch", "Document")] + hooked_requests(driver)
+            for request in others:
+                if request.get("url", "").startswith("http"):   # blob: and data: URLs cannot be replayed
+                    fallback = RequestTemplate.from_request(request, date)
+                    if fallback is not None:
+                        fallback_since = time.monotonic()
+                        break
+        elif time.monotonic() - fallback_since >= grace:
+            break
+        time.sleep(0.5)
+    if fallback is not None:
+        logging.info(f"Captured unverified request: {fallback.method} {fallback.url}")
+    return fallback
+
+def date_requests(driver, date):
+    """Unverified templates for every logged or hooked request since the last drain that carries date.
+
+    For requests that answer with a page rather than a PDF (a listing behind
+    a GO button); the caller replays each one and keeps the one whose
+    response it recognises.
+    """
+    requests_by_id, mime_types = {}, {}
+    read_network_events(driver, requests_by_id, mime_types)
+    logged = [r for r in requests_by_id.values() if r["type"] in ("XHR", "Fetch", "Document")]
+    templates, seen = [], set()
+    for request in logged + hooked_requests(driver):
+        if not request.get("url", "").startswith("http"):
+            continue
+        template = RequestTemplate.from_request(request, date)
+        key = template and (template.method, template.url, template.body)
+        if template is not None and key not in seen:
+            seen.add(key)
+            templates.append(template)
+    return templates
+
+def pdf_bytes(response):
+    """The PDF in a response: the body itself, or a base64 PDF inside a JSON/text body."""
+    content = response.content
+    if content[:5] == b"%PDF-":
+        return content
+    match = PDF_BASE64.search(response.text) if content else None
+    if match:
+        try:
+            data = base64.b64decode(re.sub(r"\s+", "", match.group(0)))
+            if data[:5] == b"%PDF-":
+                return data
+        except ValueError:
+            pass
+    return None
+
+def fetch_pdf(session, template, date, dest_path, timeout=60):
+    """Replay template for date and write the PDF to dest_path.
+
+    Returns "ok" (and marks template verified), "empty" when the server
+    answered without a PDF (no list published that day, if the template is
+    verified) or "error" when the request itself failed (expired session,
+    changed endpoint), in which case the caller should capture again.
+    """
+    method, url, body = template.build(date)
+    try:
+        response = session.request(method, url, data=body, headers=template.headers, timeout=timeout)
+    except Exception as e:
+        logging.warning(f"Direct request failed for {date:%d/%m/%Y}: {e}")
+        return "error"
+    if response.status_code >= 400:
+        logging.warning(f"Direct request for {date:%d/%m/%Y} returned HTTP {response.status_code}")
+        return "error"
+    data = pdf_bytes(response)
+    if data is None:
+        # an HTML answer is usually a login or error page; anything else means no list for the day
+        return "error" if "html" in response.headers.get("Content-Type", "") else "empty"
+    if b"%%EOF" not in data[-2048:]:
+        logging.warning(f"Truncated PDF for {date:%d/%m/%Y}")
+        return "error"
+    tmp_path = dest_path + ".part"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, dest_path)
+    template.verified = True
+    return "ok"
@@ -0,0 +1,55 @@
+import os
+import json
+
+# ------------------------------
+# Persisted "what worked last time" for page interactions.
+# Date pickers and buttons are found by trying several strategies or
+# selectors in turn. The cache remembers the winner per site and action so
+# the next call tries it first; the full search only runs when it fails.
+# ------------------------------
+def _same(a, b):
+    return json.dumps(a) == json.dumps(b)
+
+class StrategyCache:
+    """Winning strategy per (site, action), kept in a small JSON file."""
+
+    def __init__(self, path, site):
+        self.path = path
+        self.site = site
+        self._data = None   # read on first use, not at construction
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._data = json.load(f)
+                except Exception:
+                    self._data = {}
+        return self._data
+
+    def get(self, action):
+        return self.data.get(self.site, {}).get(action)
+
+    def order(self, action, candidates):
+        """candidates with the remembered winner (if it is one of them) moved to the front."""
+        known = self.get(action)
+        if known is None:
+            return list(candidates)
+        first = [c for c in candidates if _same(list(c) if isinstance(c, tuple) else c, known)]
+        return first + [c for c in candidates if c not in first]
+
+    def remember(self, action, value):
+        value = list(value) if isinstance(value, tuple) else value
+        if _same(self.get(action), value):
+            return
+        self.data.setdefault(self.site, {})[action] = value
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            pass
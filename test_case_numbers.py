@@ -0,0 +1,120 @@
+import unittest
+
+from case_numbers import NA, case_recognizer, normalize_case_type
+
+# ------------------------------
+# Tests for the shared case-number recognizer: each dialect's
+# (type, number, year, IA) on its court's spellings, plus the edges the
+# parsers rely on (IA before or after the case number, IA without a case
+# number, five-digit "years", types glued to a preceding word, the loose
+# Gauhati stage, spans and findall order).
+#
+#   python -m pytest -q test_case_numbers.py
+#   python -m unittest test_case_numbers
+# ------------------------------
+
+class DialectTest(unittest.TestCase):
+    """identify() per court: block text -> (type, number, year, IA)."""
+
+    def check(self, court, cases):
+        recognizer = case_recognizer(court)
+        for text, expected in cases:
+            with self.subTest(court=court, text=text):
+                self.assertEqual(recognizer.identify(text), expected)
+
+    def test_tshc(self):
+        self.check("tshc", [
+            ("12 WP/12345/2024 RAMESH VS STATE OF TELANGANA", ("WP", "12345", "2024", NA)),
+            ("3 CRLP/55/2023 IA NO.1/2023 A VS B", ("CRLP", "55", "2023", "1/2023")),
+            ("IA NO. 4/2024 WP/9/2024", ("WP", "9", "2024", "4/2024")),
+            ("no case number on this line", (NA, NA, NA, NA)),
+        ])
+
+    def test_orissa(self):
+        self.check("orissa", [
+            ("1 WP(C)/31043/2024 IA No.328/2025 SRI X Versus STATE", ("WP(C)", "31043", "2024", "328/2025")),
+            ("2 RVWPET/193/2025 A Versus B", ("RVWPET", "193", "2025", NA)),
+            ("5 CONTC/7667/2024 (With IA No. 12/2024)", ("CONTC", "7667", "2024", "12/2024")),
+            ("WP(C)/1/2024 ia no 3/2024", ("WP(C)", "1", "2024", "3/2024")),
+        ])
+
+    def test_gauhati(self):
+        self.check("gauhati", [
+            ("1 WP(C)/1234/2024 ABC Versus STATE OF MIZORAM", ("WP(C)", "1234", "2024", NA)),
+            ("3 CRL.A(J)/5/2024 X Versus Y", ("CRL.A(J)", "5", "2024", NA)),
+            # the strict spelling wins over an earlier loose one in the same block
+            ("4 I.A.(C)/3/2024 IN WP(C)/12/2023", ("WP(C)", "12", "2023", NA)),
+            # the loose spelling is used when nothing else matches
+            ("I.A.(C)/3/2024", ("I.A.(C)", "3", "2024", NA)),
+        ])
+
+    def test_jharkhand(self):
+        self.check("jharkhand", [
+            ("W.P.(S)/1234/2024 RAM KUMAR VS STATE OF JHARKHAND IA NO. 55/2024", ("W.P.(S)", "1234", "2024", "55/2024")),
+            ("Cr.M.P. / 55 / 2023 A VS B", ("Cr.M.P.", "55", "2023", NA)),
+            ("w.p.(s) / 7 / 2021", ("w.p.(s)", "7", "2021", NA)),
+        ])
+
+    def test_jharkhand_table(self):
+        self.check("jharkhand_table", [
+            ("Court 2 W.P(S) 1234 2024 RAM VS STATE IA NO.7/2024", ("W.P(S)", "1234", "2024", "7/2024")),
+            ("AB.CD(CR) - 12 / 2024 X VS Y", ("AB.CD(CR)", "12", "2024", NA)),
+            ("W.P(S)-12-2024", ("W.P(S)", "12", "2024", NA)),
+        ])
+
+    def test_gujarat(self):
+        self.check("gujarat", [
+            ("1 R/SCA/1234/2024 RAMESH V/S STATE OF GUJARAT", ("SCA", "1234", "2024", NA)),
+            ("SCA/55/2024 IA NO.2/2024", ("SCA", "55", "2024", "2/2024")),
+        ])
+
+    def test_karnataka(self):
+        self.check("karnataka", [
+            ("WP 1176/2024", ("WP", "1176", "2024", NA)),
+            ("CCC 12/2023 PET: X RES: Y", ("CCC", "12", "2023", NA)),
+            ("WP  1176/2024", ("WP", "1176", "2024", NA)),
+            ("WP/1176/2024", (NA, NA, NA, NA)),   # slash after the type is not the Karnataka spelling
+        ])
+
+class EdgeCaseTest(unittest.TestCase):
+
+    def test_ia_without_case_number(self):
+        self.assertEqual(case_recognizer("tshc").identify("IA NO.5/2024 only"), (NA, NA, NA, "5/2024"))
+
+    def test_five_digit_year_is_not_a_year(self):
+        self.assertEqual(case_recognizer("tshc").identify("WP/9/20245"), (NA, NA, NA, NA))
+        self.assertEqual(case_recognizer("gujarat").findall("SCA/55/20245 SCA/1/2023"), [("SCA", "1", "2023")])
+
+    def test_type_must_start_a_word(self):
+        self.assertIsNone(case_recognizer("tshc").search("xWP/9/2024"))
+
+    def test_search_span_and_text(self):
+        text = "IA NO. 4/2024 WP/9/2024 A VS B"
+        match = case_recognizer("tshc").search(text)
+        self.assertEqual((match.start, match.end, match.text), (14, 23, "WP/9/2024"))
+        self.assertEqual(text[match.start:match.end], match.text)
+
+    def test_search_without_ia(self):
+        match = case_recognizer("tshc").search("IA NO.1/2024 WP/1/2024", with_ia=False)
+        self.assertEqual(match.as_tuple(), ("WP", "1", "2024", NA))
+
+    def test_findall_keeps_order(self):
+        self.assertEqual(case_recognizer("tshc").findall("WP/9/2024 and WP/10/2023"),
+                         [("WP", "9", "2024"), ("WP", "10", "2023")])
+        self.assertEqual(case_recognizer("tshc").findall("nothing here"), [])
+
+    def test_findall_uses_loose_stage_only_as_fallback(self):
+        gauhati = case_recognizer("gauhati")
+        self.assertEqual(gauhati.findall("WP(C)/1/2024 I.A.(C)/3/2024"), [("WP(C)", "1", "2024")])
+        self.assertEqual(gauhati.findall("I.A.(C)/3/2024"), [("I.A.(C)", "3", "2024")])
+
+    def test_recognizer_is_shared(self):
+        self.assertIs(case_recognizer("orissa"), case_recognizer("orissa"))
+
+    def test_normalize_case_type(self):
+        self.assertEqual(normalize_case_type("W.P.(S)"), "WP(S)")
+        self.assertEqual(normalize_case_type("cr. m.p."), "CRMP")
+        self.assertEqual(normalize_case_type("WP(C)"), "WP(C)")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ import time
 import pandas as pd
 import re
 from pathlib import Path
+from case_numbers import case_recognizer
 
 # === CONFIG ===
 SAVE_DIR = r"C:\Users\Dell\OneDrive\Desktop\tshc_script_for_download_and_extraction\tshc_pdfs"
@@ -16,9 +17,9 @@ START_DATE = datetime(2025, 1, 1)
 END_DATE = datetime(2025, 10, 21)
 DELAY_BETWEEN = 1
 
-# === SETUP ===
-os.makedirs(SAVE_DIR, exist_ok=True)
+case_ids = case_recognizer("tshc")  # CASE_TYPE/NUMBER/YEAR
 
+# === SETUP ===
 def download_pdf(date_obj):
     """Download PDF for a specific date"""
     date_str = date_obj.strftime("%d-%m-%Y")
@@ -183,16 +184,15 @@ def extract_cases_from_pdf(pdf_path):
                 causelist_slno = sno_match.group(1)
                 
                 # Extract case number pattern: CASE_TYPE/NUMBER/YEAR
-                case_pattern = r'([A-Z]+)/(\d+)/(\d{4})'
-                case_match = re.search(case_pattern, line)
+                case_match = case_ids.search(line, with_ia=False)
                 
                 if case_match:
-                    case_type = case_match.group(1)
-                    case_number = case_match.group(2)
-                    case_year = case_match.group(3)
+                    case_type = case_match.type
+                    case_number = case_match.number
+                    case_year = case_match.year
                     
                     # Get the position where case number ends
-                    case_end_pos = case_match.end()
+                    case_end_pos = case_match.end
                     
                     # Get everything after the case number
                     remaining_line = line[case_end_pos:].strip()
@@ -388,6 +388,7 @@ def append_to_excel(new_cases):
         print(f"  ❌ Error saving Excel: {e}")
 
 def main():
+    os.makedirs(SAVE_DIR, exist_ok=True)
     print("="*70)
     print("TSHC CAUSE LIST DOWNLOADER & CASE EXTRACTOR (COLUMN-BASED v3)")
     print("="*70)
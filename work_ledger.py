@@ -0,0 +1,112 @@
+import os
+import time
+import sqlite3
+from datetime import datetime, date
+
+# ------------------------------
+# Persistent resume ledger for the date-loop scrapers.
+# One unit is (court, date, list sr_no). It moves through
+# listed -> downloaded -> parsed -> stored, and a failure leaves it at its
+# last good state with the error noted. A date is closed once every unit
+# listed for it is stored. A restart skips closed dates without touching
+# the site. It reuses PDFs that were already downloaded and only redoes
+# units that are not stored yet.
+# ------------------------------
+STATES = ("listed", "downloaded", "parsed", "stored")
+
+def _day(value):
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+class WorkLedger:
+    """(court, date, sr_no) work units and their progress, kept in SQLite."""
+
+    def __init__(self, path, court):
+        self.path = path
+        self.court = court
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS units (court TEXT NOT NULL, day TEXT NOT NULL, "
+                          "sr_no TEXT NOT NULL, state TEXT NOT NULL, pdf TEXT NOT NULL DEFAULT '', "
+                          "error TEXT NOT NULL DEFAULT '', updated_at REAL NOT NULL, "
+                          "PRIMARY KEY (court, day, sr_no))")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS dates (court TEXT NOT NULL, day TEXT NOT NULL, "
+                          "closed INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (court, day))")
+
+    def date_done(self, day):
+        row = self.conn.execute("SELECT closed FROM dates WHERE court = ? AND day = ?",
+                                (self.court, _day(day))).fetchone()
+        return bool(row and row[0])
+
+    def record_listing(self, day, sr_nos):
+        """Add the units listed for day (units already known keep their state)."""
+        now = time.time()
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO dates (court, day) VALUES (?, ?)", (self.court, _day(day)))
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO units (court, day, sr_no, state, updated_at) VALUES (?, ?, ?, 'listed', ?)",
+                [(self.court, _day(day), str(sr_no), now) for sr_no in sr_nos])
+
+    def unit(self, day, sr_no):
+        """(state, pdf) of a unit, or (None, "") if it was never listed."""
+        row = self.conn.execute("SELECT state, pdf FROM units WHERE court = ? AND day = ? AND sr_no = ?",
+                                (self.court, _day(day), str(sr_no))).fetchone()
+        return (row[0], row[1]) if row else (None, "")
+
+    def state(self, day, sr_no):
+        return self.unit(day, sr_no)[0]
+
+    def advance(self, day, sr_no, state, pdf=None):
+        """Move a unit forward to state (never backwards) and clear its error."""
+        rank = STATES.index(state)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO units (court, day, sr_no, state, updated_at) VALUES (?, ?, ?, 'listed', ?)",
+                (self.court, _day(day), str(sr_no), time.time()))
+            current, _ = self.unit(day, sr_no)
+            if STATES.index(current) > rank:
+                state = current
+            self.conn.execute(
+                "UPDATE units SET state = ?, pdf = COALESCE(?, pdf), error = '', updated_at = ? "
+                "WHERE court = ? AND day = ? AND sr_no = ?",
+                (state, pdf, time.time(), self.court, _day(day), str(sr_no)))
+
+    def fail(self, day, sr_no, error):
+        with self.conn:
+            self.conn.execute("UPDATE units SET error = ?, updated_at = ? WHERE court = ? AND day = ? AND sr_no = ?",
+                              (str(error), time.time(), self.court, _day(day), str(sr_no)))
+
+    def close_date(self, day, allow_empty=False):
+        """Close day if every unit listed for it is stored; returns True when closed.
+
+        A day with no units only closes when allow_empty is set (e.g. the date
+        is in the past), since a list can still be published for a recent one.
+        """
+        total, stored = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(state = 'stored'), 0) FROM units WHERE court = ? AND day = ?",
+            (self.court, _day(day))).fetchone()
+        if total != stored or (total == 0 and not allow_empty):
+            return False
+        with self.conn:
+            self.conn.execute("INSERT INTO dates (court, day, closed) VALUES (?, ?, 1) "
+                              "ON CONFLICT (court, day) DO UPDATE SET closed = 1", (self.court, _day(day)))
+        return True
+
+    def summary(self):
+        """Unit count per state, plus units carrying an error."""
+        counts = dict(self.conn.execute("SELECT state, COUNT(*) FROM units WHERE court = ? GROUP BY state",
+                                        (self.court,)).fetchall())
+        counts["failed"] = self.conn.execute("SELECT COUNT(*) FROM units WHERE court = ? AND error != ''",
+                                             (self.court,)).fetchone()[0]
+        return counts
+
+    def close(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass